@@ -2,27 +2,43 @@ import streamlit as st
 import json
 import os
 import time
-import uuid
-import subprocess
-import sys
+import io
+import math
+import traceback
 from datetime import datetime, timezone
-from jsonschema.validators import Draft202012Validator
 from jsonschema.exceptions import ValidationError, SchemaError
+from src.validators.schema_registry import REGISTRY
+from src.orchestrator.pipeline import get_pipeline, print_summary
+from src.catalog.index import CatalogIndex, source_stamp
+from src.orchestrator.jobs import get_job_manager
+from src.storage.runs import RunStore
 
 st.set_page_config(page_title="Kasparro Content Viewer", layout="wide")
 
 
 st.title("Kasparro AI Content Preview")
 
-# --- Pipeline execution proof state ---
-if "pipeline_running" not in st.session_state:
-    st.session_state.pipeline_running = False
+# Viewer latency for this rerun (Streamlit re-executes the script, so these reset every rerun);
+# shown at the bottom of the sidebar. Compare with `python scripts/bench_viewer_cache.py`.
+RERUN_T0 = time.perf_counter()
+LOAD_STATS = {"calls": 0, "seconds": 0.0}
 
+# --- Pipeline execution proof state ---
+if "job_id" not in st.session_state:
+    st.session_state.job_id = None  # this session's latest regeneration job
 
 if "last_run_meta" not in st.session_state:
     st.session_state.last_run_meta = None   # will hold dict like {"run_id":..., "started_at":..., "finished_at":..., "exit_code":...}
 
 RUN_META_PATH = os.path.join("outputs", "ui_run_meta.json")
+# Regenerations are single-flight per output directory
+REGEN_TARGET = "outputs"
+# Regenerations are run-scoped: outputs/runs/<run_id>/, published via outputs/CURRENT
+RUNS = RunStore(REGEN_TARGET)
+
+def output_path(filename: str) -> str:
+    """Path of an output in the current run (or directly under outputs/ when none is published)."""
+    return os.path.join(RUNS.current_dir(), filename)
 
 def now_iso():
     return datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds")
@@ -35,114 +51,180 @@ def save_run_meta(meta: dict):
     except Exception:
         pass
 
+def file_stamp(path: str):
+    """(mtime_ns, size) of a file, or None if it does not exist. Part of every file cache key,
+    so a rewritten file is reloaded on the next rerun and an unchanged one never is."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _read_json(path: str, stamp) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def load_saved_run_meta():
+    stamp = file_stamp(RUN_META_PATH)
+    if stamp is None:
+        return None
     try:
-        if os.path.exists(RUN_META_PATH):
-            with open(RUN_META_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
+        return _read_json(RUN_META_PATH, stamp)
     except Exception:
         return None
-    return None
-
-def run_pipeline_with_proof():
-    run_id = str(uuid.uuid4())[:8]
-    run_id = str(uuid.uuid4())[:8]
-    started_at = now_iso()
-    t0 = time.time()
-    st.session_state.pipeline_running = True
 
+def run_pipeline_in_process(on_event=None):
+    """
+    Runs the pipeline in this process, like `python main.py` but without
+    interpreter start-up: imports, compiled schemas and the DAG stay warm
+    between runs. Returns (exit_code, stdout, stderr) like the old subprocess.
+    on_event receives per-node progress events while the pipeline runs.
+    """
+    # Output goes to a per-call stream: this runs on a job thread next to other sessions,
+    # so the process-wide sys.stdout must not be swapped
+    out, err = io.StringIO(), ""
+    exit_code = 0
+    try:
+        state = get_pipeline(output_dir=REGEN_TARGET, run_scoped=True).run(on_event=on_event, out=out)
+        print_summary(state, out=out)
+    except SystemExit as e:
+        exit_code, err = 1, str(e)
+    except Exception:
+        exit_code, err = 1, traceback.format_exc()
+    return exit_code, out.getvalue(), err
+
+def format_node_event(event) -> str:
+    step = f"[{event.index + 1}/{event.total}] `{event.node_id}`"
+    if event.event == "started":
+        return f"⏳ {step} started"
+    if event.event == "finished":
+        return f"✅ {step} finished in {event.duration_sec * 1000:.1f} ms"
+    return f"❌ {step} failed after {event.duration_sec * 1000:.1f} ms: {event.error}"
+
+def regenerate_job(job):
+    """
+    Background job body (runs on a JobManager thread, so no Streamlit calls):
+    runs the pipeline, records per-node events on the job and persists run meta.
+    """
     meta = {
-        "run_id": run_id,
-        "started_at": started_at,
+        "run_id": job.job_id,
+        "started_at": now_iso(),
         "finished_at": None,
         "duration_sec": None,
         "exit_code": None,
         "error": None,
     }
-    st.session_state.last_run_meta = meta
     save_run_meta(meta)
-
-    # A visible long-running status container in the UI
-    with st.status(f"Running agent pipeline (run {run_id})...", expanded=True, state="running") as status:
-        st.write(f"**Started:** {started_at}")
-        st.write("Executing: `python main.py`")
-
-        try:
-            # Capture output so we can show proof inside the UI
-            result = subprocess.run(
-                [sys.executable, "main.py"],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-
-            # Show subprocess logs as execution proof
-            if result.stdout:
-                st.code(result.stdout, language="text")
-            if result.stderr:
-                st.code(result.stderr, language="text")
-
-            finished_at = now_iso()
-            duration = round(time.time() - t0, 2)
-            meta["finished_at"] = finished_at
-            meta["duration_sec"] = duration
-            meta["exit_code"] = result.returncode
-
-            if result.returncode == 0:
-                status.update(label=f"Pipeline complete (run {run_id})", state="complete", expanded=False)
-                st.toast(f"Pipeline finished ✅ (run {run_id}) in {duration}s")  # optional
-            else:
-                meta["error"] = f"Pipeline failed with exit code {result.returncode}"
-                status.update(label=f"Pipeline failed (run {run_id})", state="error", expanded=True)
-                st.toast(f"Pipeline failed ❌ (run {run_id})")  # optional
-
-            st.session_state.last_run_meta = meta
-            save_run_meta(meta)
-
-        except Exception as e:
-            finished_at = now_iso()
-            duration = round(time.time() - t0, 2)
-            meta["finished_at"] = finished_at
-            meta["duration_sec"] = duration
-            meta["exit_code"] = -1
-            meta["error"] = str(e)
-
-            st.session_state.last_run_meta = meta
-            save_run_meta(meta)
-
-            status.update(label=f"Pipeline exception (run {run_id})", state="error", expanded=True)
-            st.exception(e)
-
-        finally:
-            st.session_state.pipeline_running = False
-
-    # Force a clean rerun so the app reloads fresh outputs after completion.
-    st.rerun()  # reruns immediately; stops further execution in this run
-
-
-# Helper to load JSON
+    t0 = time.time()
+    returncode, stdout, stderr = run_pipeline_in_process(job.events.append)
+    meta["finished_at"] = now_iso()
+    meta["duration_sec"] = round(time.time() - t0, 2)
+    meta["exit_code"] = returncode
+    if returncode != 0:
+        meta["error"] = f"Pipeline failed with exit code {returncode}"
+    save_run_meta(meta)
+    return {"meta": meta, "stdout": stdout, "stderr": stderr}
+
+def start_regeneration():
+    # Single-flight: a click while a regeneration is queued/running joins that job
+    job = get_job_manager().submit(REGEN_TARGET, regenerate_job)
+    st.session_state.job_id = job.job_id
+    return job
+
+def render_job(job):
+    """Live progress while the job is active (polled via rerun), then its logs as execution proof."""
+    run_id = job.job_id
+    if job.active:
+        with st.status(f"Running agent pipeline (run {run_id})...", expanded=True, state="running"):
+            st.write("Executing: in-process pipeline (same DAG as `python main.py`)")
+            if job.status == "queued":
+                st.write("Queued behind another regeneration...")
+            if job.requests > 1:
+                st.write(f"{job.requests} regenerate requests share this run")
+            events = list(job.events)
+            if events:
+                last = events[-1]
+                done = last.index + (last.event != "started")
+                st.progress(done / last.total, text=f"{done}/{last.total} nodes")
+            for event in events:
+                st.write(format_node_event(event))
+        time.sleep(0.5)
+        st.rerun()
+
+    result = job.result or {}
+    meta = result.get("meta") or {}
+    st.session_state.last_run_meta = meta or st.session_state.last_run_meta
+    ok = job.status == "succeeded" and meta.get("exit_code") == 0
+    label = f"Pipeline complete (run {run_id})" if ok else f"Pipeline failed (run {run_id})"
+    with st.status(label, expanded=not ok, state="complete" if ok else "error"):
+        for event in job.events:
+            st.write(format_node_event(event))
+        if result.get("stdout"):
+            st.code(result["stdout"], language="text")
+        if result.get("stderr"):
+            st.code(result["stderr"], language="text")
+        if job.error:
+            st.error(job.error)
+    if st.session_state.get("toasted_job") != run_id:
+        st.session_state.toasted_job = run_id
+        if ok:
+            st.toast(f"Pipeline finished ✅ (run {run_id}) in {meta.get('duration_sec')}s")
+        else:
+            st.toast(f"Pipeline failed ❌ (run {run_id})")
+
+
+# Helper to load JSON (cached per file version)
 def load_json(filename):
-    path = os.path.join("outputs", filename)
-    if os.path.exists(path):
-        with open(path, "r") as f:
-            return json.load(f)
-    return None
+    t0 = time.perf_counter()
+    try:
+        path = output_path(filename)
+        stamp = file_stamp(path)
+        if stamp is None:
+            return None
+        return _read_json(path, stamp)
+    finally:
+        LOAD_STATS["calls"] += 1
+        LOAD_STATS["seconds"] += time.perf_counter() - t0
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _download_json(path: str, stamp) -> str:
+    return json.dumps(_read_json(path, stamp), indent=2)
+
+def download_json(filename):
+    path = output_path(filename)
+    return _download_json(path, file_stamp(path))
 
 def validate_against_schema(data, schema_path: str):
-    with open(schema_path, "r", encoding="utf-8") as f:
-        schema = json.load(f)
-    Draft202012Validator.check_schema(schema)  # validates the schema itself
-    Draft202012Validator(schema).validate(data)  # validates the instance
+    # Schema is loaded, checked and compiled once per process; recompiled on mtime change
+    REGISTRY.get_validator(schema_path).validate(data)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _schema_error(out_path: str, out_stamp, schema_path: str, schema_stamp):
+    """Schema check result (None = pass), re-run only when the output or the schema file changes."""
+    try:
+        validate_against_schema(_read_json(out_path, out_stamp), schema_path)
+    except (ValidationError, SchemaError) as e:
+        return str(e)
+    return None
 
 # Tabs
-tab1, tab2, tab3, tab4 = st.tabs(["Product Page", "FAQ Page", "Comparison Page", "Validation Summary"])
+@st.cache_resource(show_spinner="Indexing catalog...", max_entries=4)
+def load_catalog_index(root: str, stamp) -> CatalogIndex:
+    # stamp changes whenever the catalog is rewritten, which re-opens (and incrementally rebuilds) the index
+    return CatalogIndex.open(root)
+
+CATALOG_DIR = os.path.join("outputs", "catalog")
+
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["Product Page", "FAQ Page", "Comparison Page", "Validation Summary", "Catalog"])
 
 # --- Validation Summary ---
 with tab4:
     st.header("Pipeline Validation Summary")
 
     # Pull last run meta from session_state, fall back to saved file
-    meta = st.session_state.last_run_meta or load_saved_run_meta()
+    # The saved file reflects the latest run from any session
+    meta = load_saved_run_meta() or st.session_state.last_run_meta
 
     if meta:
         st.subheader("Execution Proof")
@@ -159,7 +241,7 @@ with tab4:
     
     # 1. File Existence
     files = ["product_page.json", "faq.json", "comparison_page.json"]
-    missing = [f for f in files if not os.path.exists(os.path.join("outputs", f))]
+    missing = [f for f in files if not os.path.exists(output_path(f))]
     
     if missing:
         st.error(f"Missing Files: {missing}")
@@ -214,12 +296,13 @@ with tab4:
             if not data:
                 st.error(f"{out_file}: missing")
                 continue
-            try:
-                validate_against_schema(data, schema_file)
+            out_path = output_path(out_file)
+            error = _schema_error(out_path, file_stamp(out_path), schema_file, file_stamp(schema_file))
+            if error is None:
                 st.success(f"{out_file}: Schema PASS")
-            except (ValidationError, SchemaError) as e:
+            else:
                 st.error(f"{out_file}: Schema FAIL")
-                st.code(str(e))
+                st.code(error)
 
 
 # --- Product Page ---
@@ -249,7 +332,7 @@ with tab1:
         st.json(data)
         st.download_button(
             label="Download Product JSON",
-            data=json.dumps(data, indent=2),
+            data=download_json("product_page.json"),
             file_name="product_page.json",
             mime="application/json"
         )
@@ -271,7 +354,7 @@ with tab2:
         st.json(data)
         st.download_button(
             label="Download FAQ JSON",
-            data=json.dumps(data, indent=2),
+            data=download_json("faq.json"),
             file_name="faq.json",
             mime="application/json"
         )
@@ -288,22 +371,82 @@ with tab3:
         
         st.download_button(
             label="Download Comparison JSON",
-            data=json.dumps(data, indent=2),
+            data=download_json("comparison_page.json"),
             file_name="comparison_page.json",
             mime="application/json"
         )
     else:
         st.error("outputs/comparison_page.json not found")
 
+# --- Catalog Browser ---
+with tab5:
+    st.header("Catalog Browser")
+    catalog_dir = st.text_input("Catalog directory", value=CATALOG_DIR,
+                                help="Output of JsonWriterAgent.write_catalog or JsonlWriterAgent")
+    if not os.path.isdir(catalog_dir):
+        st.info(f"No catalog found at {catalog_dir}")
+    else:
+        index = load_catalog_index(catalog_dir, source_stamp(catalog_dir))
+
+        c1, c2, c3, c4 = st.columns(4)
+        text = c1.text_input("Search (ID or title)")
+        schema_status = c2.selectbox("Schema status", ["any", "passed", "failed"])
+        min_price = c3.number_input("Min price", min_value=0, value=0)
+        max_price = c4.number_input("Max price (0 = no limit)", min_value=0, value=0)
+
+        matches = index.query(
+            text=text,
+            schema_status=None if schema_status == "any" else schema_status,
+            min_price=min_price or None,
+            max_price=max_price or None,
+        )
+        p1, p2 = st.columns(2)
+        page_size = p1.selectbox("Page size", [25, 50, 100, 200], index=1)
+        page_count = max(1, math.ceil(len(matches) / page_size))
+        page_number = p2.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+        rows = matches[(page_number - 1) * page_size:page_number * page_size]
+
+        st.caption(f"{len(matches)} of {len(index)} products match")
+        st.dataframe(
+            [{"product_id": e.product_id, "title": e.title, "price": e.price,
+              "currency": e.currency, "schema_status": e.schema_status} for e in rows],
+            use_container_width=True,
+        )
+
+        selected = st.selectbox("Open product", [e.product_id for e in rows])
+        if selected:
+            # Only the selected product's pages are read
+            entry = next(e for e in rows if e.product_id == selected)
+            for key, page in index.load(entry).items():
+                with st.expander(key):
+                    st.json(page)
+
 # --- Sidebar: Pipeline Control ---
 with st.sidebar:
     st.header("Control Panel")
 
-    # Disable button while pipeline is running to avoid overlapping runs
-    if st.button("Regenerate Content", disabled=st.session_state.pipeline_running):
-        with st.spinner("Running Agent Pipeline..."):  # spinner is built for this use
-            run_pipeline_with_proof()
-
+    # Runs on the shared background job queue; clicks during a run join it
+    if st.button("Regenerate Content"):
+        start_regeneration()
+
+    # This session's job, or a regeneration started by another session
+    jobs = get_job_manager()
+    job = jobs.get(st.session_state.job_id) if st.session_state.job_id else None
+    job = jobs.active(REGEN_TARGET) or job
+    if job is not None:
+        render_job(job)
+
+
+    # Published runs: rollback is an instant pointer swap
+    run_ids = RUNS.runs()
+    if run_ids:
+        with st.expander("Runs"):
+            current = RUNS.current()
+            st.caption(f"Current: {current or 'outputs/ (no run published)'}")
+            target = st.selectbox("Run", list(reversed(run_ids)))
+            if st.button("Make current", disabled=target == current):
+                RUNS.rollback(target)
+                st.rerun()
 
     st.subheader("Download All")
     # Quick access to download all if they exist
@@ -312,9 +455,13 @@ with st.sidebar:
         if d:
             st.download_button(
                 label=f"Download {f_name}",
-                data=json.dumps(d, indent=2),
+                data=download_json(f_name),
                 file_name=f_name,
                 mime="application/json",
                 key=f"dl_sidebar_{f_name}"
             )
 
+    st.caption(
+        f"Output loads this rerun: {LOAD_STATS['calls']} in {LOAD_STATS['seconds'] * 1000:.1f} ms "
+        f"(cached per file version); rerun took {(time.perf_counter() - RERUN_T0) * 1000:.0f} ms"
+    )
@@ -1,118 +1,59 @@
-import json
-import os
-from src.state.pipeline_state import PipelineState
-from src.orchestrator.dag_runner import DagRunner, NodeSpec
-
-# Agents
-from src.agents.parse_product import ParseProductAgent
-from src.agents.generate_questions import GenerateQuestionsAgent
-from src.agents.generate_product_b import ProductBGeneratorAgent
-from src.agents.build_faq_page import FaqPageAgent
-from src.agents.build_product_page import ProductPageAgent
-from src.agents.build_comparison_page import ComparisonPageAgent
-from src.agents.write_json import JsonWriterAgent
-from src.agents.validate_outputs import ValidatorAgent
-
-def load_input_data(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-class ParseWrapperAgent:
-    """Wraps the Phase 1 ParseProductAgent to fit the Phase 3 interface."""
-    def run(self, state: PipelineState) -> PipelineState:
-        if not state.raw_product:
-            raise ValueError("No raw_product to parse")
-        agent = ParseProductAgent()
-        state.product = agent.run(state.raw_product)
-        return state
-
-def main():
-    # 1. Setup Initial State
-    raw_data = load_input_data("data/product_input.json")
-    initial_state = PipelineState(raw_product=raw_data)
-    
-    # 2. Build DAG
-    dag = DagRunner()
-    
-    # Node 1: Parse
-    dag.register(NodeSpec(node_id="parse_product", agent=ParseWrapperAgent()))
-    
-    # Node 2: Questions (depends on product)
-    dag.register(NodeSpec(
-        node_id="gen_questions",
-        agent=GenerateQuestionsAgent(),
-        depends_on=["parse_product"]
-    ))
-    
-    # Node 3: Product B (independent, but let's just depend on parse for consistency)
-    dag.register(NodeSpec(
-        node_id="gen_product_b",
-        agent=ProductBGeneratorAgent(),
-        depends_on=["parse_product"]
-    ))
-    
-    # Node 4: Page Drafts
-    dag.register(NodeSpec(
-        node_id="build_faq",
-        agent=FaqPageAgent(),
-        depends_on=["parse_product", "gen_questions"]
-    ))
-    dag.register(NodeSpec(
-        node_id="build_product_page",
-        agent=ProductPageAgent(),
-        depends_on=["parse_product"]
-    ))
-    dag.register(NodeSpec(
-        node_id="build_comparison",
-        agent=ComparisonPageAgent(),
-        depends_on=["parse_product", "gen_product_b"]
-    ))
-
-    # Node 5: Writer
-    dag.register(NodeSpec(
-        node_id="write_json",
-        agent=JsonWriterAgent(output_dir="outputs"),
-        depends_on=["build_faq", "build_product_page", "build_comparison"]
-    ))
-
-    # Node 6: Validate (depends on writer)
-    # Populate schema paths in state for the ValidatorAgent to find
-    schema_map = {
-        "faq_draft": os.path.abspath("src/schemas/faq_schema.json"),
-        "product_page_draft": os.path.abspath("src/schemas/product_page_schema.json"),
-        "comparison_draft": os.path.abspath("src/schemas/comparison_page_schema.json")
-    }
-    initial_state.schema_paths = schema_map # Set heavily needed paths in state
-
-    dag.register(NodeSpec(
-        node_id="validate_outputs",
-        agent=ValidatorAgent(), # Stateless now
-        depends_on=["write_json"]
-    ))
-    
-    # 3. Execution
-    final_state = dag.run(initial_state)
-    
-    # 4. Summary
-    print("\n--- Pipeline Summary ---")
-    print(f"Product: {final_state.product.product_name}")
-    print(f"Questions Generated: {len(final_state.questions.items)}")
-    print(f"Questions Generated: {len(final_state.questions.items)}")
-    print("Outputs Written:")
-    for key, path in final_state.output_paths.items():
-        print(f" - {key}: {path}")
-    
-    if final_state.validation_report:
-        print("\n--- Validation Report ---")
-        print(f"Passed: {final_state.validation_report['passed']}")
-        if not final_state.validation_report['passed']:
-             print("Errors:")
-             for err in final_state.validation_report['errors']:
-                 print(f" - {err}")
-             # Fail Hard as per Phase 4 requirement
-             raise SystemExit("Validation failed: Pipeline outputs did not meet strict criteria.")
-    else:
-        print("\n[WARNING] No validation report found!")
+import argparse
+import sys
+from src.orchestrator.dag_runner import jsonl_listener
+from src.orchestrator.pipeline import Pipeline, print_summary
+from src.storage.runs import RunStore
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate, validate and write the product content pages.")
+    parser.add_argument("--force-revalidate", action="store_true",
+                        help="revalidate pages even if an earlier run already proved them")
+    parser.add_argument("--validation-mode", choices=["full", "tiered"], default="full",
+                        help="tiered: structural checks on every page, full validation on a sample")
+    parser.add_argument("--sample-rate", type=float, default=0.01,
+                        help="fraction of products fully validated in tiered mode (default: 0.01)")
+    parser.add_argument("--progress-jsonl", action="store_true",
+                        help="write per-node progress events to stderr as JSON lines")
+    parser.add_argument("--in-place", action="store_true",
+                        help="write outputs/*.json directly instead of a new run in outputs/runs/<run_id>/ "
+                             "(a published outputs/CURRENT is left unchanged)")
+    parser.add_argument("--keep-runs", type=int, default=5, help="run directories to keep (default: 5)")
+    parser.add_argument("--list-runs", action="store_true", help="list run directories and exit")
+    parser.add_argument("--rollback", nargs="?", const="", metavar="RUN_ID",
+                        help="point CURRENT at RUN_ID (default: the previous run) and exit")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    runs = RunStore("outputs", keep=args.keep_runs)
+
+    if args.list_runs:
+        current = runs.current()
+        for run_id in runs.runs():
+            print(f"{'*' if run_id == current else ' '} {run_id}")
+        return
+    if args.rollback is not None:
+        run_id = runs.rollback(args.rollback or None)
+        print(f"CURRENT -> {run_id}")
+        return
+
+    # 1-3. Build the DAG (see src/orchestrator/pipeline.py) and run it on data/product_input.json
+    # Pages proven by an earlier run are skipped unless --force-revalidate is given
+    pipeline = Pipeline(output_dir="outputs", force_revalidate=args.force_revalidate,
+                        run_scoped=not args.in_place, keep_runs=args.keep_runs,
+                        validation_mode=args.validation_mode, sample_rate=args.sample_rate)
+    on_event = jsonl_listener(sys.stderr) if args.progress_jsonl else None
+    try:
+        final_state = pipeline.run(on_event=on_event)
+    finally:
+        pipeline.close()
+    
+    # 4. Summary (raises SystemExit when validation failed)
+    print_summary(final_state)
+    if not args.in_place:
+        print(f"\nCURRENT -> {runs.current()}")
+    elif runs.current():
+        print(f"\nNote: readers still use the published run {runs.current()} (outputs/CURRENT)")
 
 if __name__ == "__main__":
     main()
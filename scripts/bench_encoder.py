@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""json.dumps(indent=2) vs the streaming page encoder on the committed outputs."""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.assembly import ASSEMBLERS, encode_page
+from src.agents.write_json import OUTPUT_FILES
+from src.storage.json_encoder import encode_json
+
+def main(rounds: int = 5000):
+    drafts = {}
+    for key, filename in OUTPUT_FILES.items():
+        with open(os.path.join("outputs", filename), encoding="utf-8") as f:
+            drafts[key] = json.load(f)
+
+    def legacy():
+        for key, draft in drafts.items():
+            json.dumps(ASSEMBLERS[key](draft), indent=2, ensure_ascii=False).encode("utf-8")
+
+    def encoder():
+        for key, draft in drafts.items():
+            encode_json(ASSEMBLERS[key](draft)).encode("utf-8")
+
+    def one_pass():
+        for key, draft in drafts.items():
+            encode_page(key, draft)
+
+    for label, fn in (("assemble + json.dumps", legacy), ("assemble + encode_json", encoder), ("encode_page", one_pass)):
+        elapsed = min(timeit.repeat(fn, number=rounds, repeat=3))
+        print(f"{label:<26}{elapsed:>8.3f}s{rounds * len(drafts) / elapsed:>12.0f} pages/s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
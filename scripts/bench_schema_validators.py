@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Per-document timing: generic Draft202012Validator vs code-generated validators."""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonschema import Draft202012Validator
+from src.validators.schema_codegen import compile_validator
+
+PAIRS = {
+    "faq.json": "src/schemas/faq_schema.json",
+    "product_page.json": "src/schemas/product_page_schema.json",
+    "comparison_page.json": "src/schemas/comparison_page_schema.json",
+}
+
+def main(number: int = 2000):
+    print(f"{'document':<22}{'generic (us)':>14}{'generated (us)':>16}{'speedup':>10}")
+    for out_file, schema_file in PAIRS.items():
+        with open(schema_file, encoding="utf-8") as f:
+            schema = json.load(f)
+        with open(os.path.join("outputs", out_file), encoding="utf-8") as f:
+            doc = json.load(f)
+
+        generic = Draft202012Validator(schema)
+        fast = compile_validator(schema)
+        assert fast(doc) and generic.is_valid(doc)
+
+        t_generic = timeit.timeit(lambda: generic.validate(doc), number=number) / number * 1e6
+        t_fast = timeit.timeit(lambda: fast(doc), number=number) / number * 1e6
+        print(f"{out_file:<22}{t_generic:>14.1f}{t_fast:>16.2f}{t_generic / t_fast:>9.0f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Viewer rerun cost: re-reading/re-validating every output vs the file-stamp-keyed caches in app.py."""
+import json
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.storage.runs import resolve_output_dir
+from src.validators.schema_registry import REGISTRY
+
+SCHEMAS = {
+    "faq.json": "src/schemas/faq_schema.json",
+    "product_page.json": "src/schemas/product_page_schema.json",
+    "comparison_page.json": "src/schemas/comparison_page_schema.json",
+}
+# One app.py rerun: summary tab, page tabs and sidebar downloads each load every output
+LOADS_PER_RERUN = 4
+
+def file_stamp(path: str):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+class StampCache:
+    """Stand-in for st.cache_data: keyed by the call arguments, each hit returns a pickled copy."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.entries = {}
+
+    def __call__(self, *args):
+        if args not in self.entries:
+            self.entries[args] = pickle.dumps(self.fn(*args))
+        return pickle.loads(self.entries[args])
+
+def read_json(path: str, stamp=None) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def schema_error(path: str, stamp, schema_path: str, schema_stamp):
+    REGISTRY.get_validator(schema_path).validate(read_json(path))
+    return None
+
+def main(reruns: int = 2000):
+    root = resolve_output_dir("outputs")
+    paths = {name: os.path.join(root, name) for name in SCHEMAS}
+    REGISTRY.preload()
+
+    def uncached():
+        for _ in range(LOADS_PER_RERUN):
+            for path in paths.values():
+                read_json(path)
+        for name, path in paths.items():
+            schema_error(path, None, SCHEMAS[name], None)
+
+    cached_read, cached_schema = StampCache(read_json), StampCache(schema_error)
+
+    def cached():
+        for _ in range(LOADS_PER_RERUN):
+            for path in paths.values():
+                cached_read(path, file_stamp(path))
+        for name, path in paths.items():
+            cached_schema(path, file_stamp(path), SCHEMAS[name], file_stamp(SCHEMAS[name]))
+
+    print(f"{reruns} reruns, {LOADS_PER_RERUN * len(paths)} loads + {len(paths)} schema checks each ({root})")
+    for label, fn in (("uncached", uncached), ("cached (file stamp)", cached)):
+        elapsed = min(timeit.repeat(fn, number=reruns, repeat=3))
+        print(f"{label:<22}{elapsed:>8.3f}s{elapsed / reruns * 1000:>10.3f} ms/rerun")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
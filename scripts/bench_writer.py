@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Legacy per-file json.dump vs the atomic buffered writer vs sharded JSONL vs SQLite for an N-product catalog."""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.write_json import JsonWriterAgent, OUTPUT_FILES
+from src.agents.write_jsonl import JsonlWriterAgent
+from src.agents.write_sqlite import SqliteWriterAgent
+from src.storage.io_executor import IoExecutor
+
+def load_pages() -> dict:
+    pages = {}
+    for key, filename in OUTPUT_FILES.items():
+        with open(os.path.join("outputs", filename), encoding="utf-8") as f:
+            pages[key] = json.load(f)
+    return pages
+
+def legacy_write(root: str, entries):
+    # The previous JsonWriterAgent path: makedirs check + json.dump straight into the file
+    for product_id, pages in entries:
+        product_dir = os.path.join(root, product_id)
+        if not os.path.exists(product_dir):
+            os.makedirs(product_dir)
+        for key, filename in OUTPUT_FILES.items():
+            with open(os.path.join(product_dir, filename), "w", encoding="utf-8") as f:
+                json.dump(pages[key], f, indent=2, ensure_ascii=False)
+
+def timed(label: str, fn, count: int):
+    root = tempfile.mkdtemp(prefix="bench_writer_")
+    try:
+        t0 = time.perf_counter()
+        fn(root)
+        elapsed = time.perf_counter() - t0
+    finally:
+        shutil.rmtree(root)
+    print(f"{label:<28}{elapsed:>8.2f}s{count / elapsed:>12.0f} pages/s")
+
+def main(products: int = 10_000):
+    pages = load_pages()
+    entries = [(f"p{i:06d}", pages) for i in range(products)]
+    files = products * len(OUTPUT_FILES)
+    print(f"{products} products, {files} pages")
+    timed("legacy json.dump", lambda root: legacy_write(root, entries), files)
+    for policy in ("none", "batch", "file"):
+        timed(f"atomic (fsync={policy})",
+              lambda root: JsonWriterAgent(output_dir=root, fsync=policy).write_catalog(entries), files)
+    with IoExecutor(max_workers=4) as io:
+        timed("atomic (io pool x4)",
+              lambda root: JsonWriterAgent(output_dir=root, io_executor=io).write_catalog(entries), files)
+    for compression in (None, "gzip", "lzma"):
+        timed(f"jsonl (compression={compression})",
+              lambda root: JsonlWriterAgent(output_dir=root, compression=compression).write_catalog(entries), files)
+    timed("sqlite (wal, batched)",
+          lambda root: SqliteWriterAgent(os.path.join(root, "outputs.sqlite")).write_catalog(entries), files)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
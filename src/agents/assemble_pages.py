@@ -0,0 +1,15 @@
+from src.state.pipeline_state import PipelineState
+from src.agents.assembly import assemble_pages, encode_page
+
+class AssemblePagesAgent:
+    """
+    Assembles schema-shaped pages in memory so they can be validated before
+    writing, and encodes each one once; the validator's ledger and the writer
+    both use those bytes instead of serializing the page again.
+    """
+    def run(self, state: PipelineState) -> PipelineState:
+        state.assembled_pages = assemble_pages(state)
+        if not state.assembled_pages:
+            raise ValueError("No drafts found to assemble")
+        state.encoded_pages = {key: encode_page(key, getattr(state, key)) for key in state.assembled_pages}
+        return state
@@ -1,53 +1,97 @@
-from typing import Dict, Any
+import copy
+from typing import Dict, Any, Callable, Tuple
+from src.storage.json_encoder import encode_items
+
+Layout = Tuple[Tuple[str, Any], ...]  # (field, default) in output order
+
+# Schema: title, ingredients, benefits, usage, safety, price, question_bank, faqs, meta
+FAQ_LAYOUT: Layout = (
+    ("title", ""),
+    ("ingredients", []),
+    ("benefits", []),
+    ("usage", ""),
+    ("safety", ""),
+    ("price", {"currency": "INR", "amount": 0}),
+    ("question_bank", []),
+    ("faqs", []),
+    ("meta", {"generated_by": "FaqPageAgent"}),
+)
+
+# Schema: meta, hero, details, usage, safety, pricing
+PRODUCT_PAGE_LAYOUT: Layout = (
+    ("meta", {"generated_by": "ProductPageAgent"}),
+    ("hero", {"title": ""}),
+    ("details", {"ingredients": [], "benefits": []}),
+    ("usage", ""),
+    ("safety", ""),
+    ("pricing", {"currency": "INR", "amount": 0}),
+)
+
+# Schema: meta, comparison, product_a, product_b
+COMPARISON_LAYOUT: Layout = (
+    ("meta", {
+        "product_b_fictional": True, # Enforce this
+        "product_b_name": "Fictional Product B"
+    }),
+    ("comparison", []),
+    ("product_a", {"name": ""}),
+    ("product_b", {
+        "name": "",
+        "key_ingredients": [],
+        "benefits": [],
+        "price": {"currency": "INR", "amount": 0}
+    }),
+)
+
+def _assemble(draft: Dict[str, Any], layout: Layout) -> Dict[str, Any]:
+    # Only the schema's keys survive; defaults are copied so pages never share them
+    return {name: draft[name] if name in draft else copy.deepcopy(default) for name, default in layout}
 
 def assemble_faq_page(draft: Dict[str, Any]) -> Dict[str, Any]:
     """
     Assembles the final FAQ page structure strictly matching the schema.
     Sanitizes inputs by selecting only allowed keys.
     """
-    # Schema: title, ingredients, benefits, usage, safety, price, question_bank, faqs, meta
-    return {
-        "title": draft.get("title", ""),
-        "ingredients": draft.get("ingredients", []),
-        "benefits": draft.get("benefits", []),
-        "usage": draft.get("usage", ""),
-        "safety": draft.get("safety", ""),
-        "price": draft.get("price", {"currency": "INR", "amount": 0}),
-        "question_bank": draft.get("question_bank", []),
-        "faqs": draft.get("faqs", []),
-        "meta": draft.get("meta", {"generated_by": "FaqPageAgent"})
-    }
+    return _assemble(draft, FAQ_LAYOUT)
 
 def assemble_product_page(draft: Dict[str, Any]) -> Dict[str, Any]:
     """
     Assembles the final Product page structure strictly matching the schema.
     """
-    # Schema: meta, hero, details, usage, safety, pricing
-    return {
-        "meta": draft.get("meta", {"generated_by": "ProductPageAgent"}),
-        "hero": draft.get("hero", {"title": ""}),
-        "details": draft.get("details", {"ingredients": [], "benefits": []}),
-        "usage": draft.get("usage", ""),
-        "safety": draft.get("safety", ""),
-        "pricing": draft.get("pricing", {"currency": "INR", "amount": 0})
-    }
+    return _assemble(draft, PRODUCT_PAGE_LAYOUT)
 
 def assemble_comparison_page(draft: Dict[str, Any]) -> Dict[str, Any]:
     """
     Assembles the final Comparison page structure strictly matching the schema.
     """
-    # Schema: meta, comparison, product_a, product_b
-    return {
-        "meta": draft.get("meta", {
-            "product_b_fictional": True, # Enforce this
-            "product_b_name": "Fictional Product B"
-        }),
-        "comparison": draft.get("comparison", []),
-        "product_a": draft.get("product_a", {"name": ""}),
-        "product_b": draft.get("product_b", {
-            "name": "", 
-            "key_ingredients": [], 
-            "benefits": [], 
-            "price": {"currency": "INR", "amount": 0}
-        })
-    }
+    return _assemble(draft, COMPARISON_LAYOUT)
+
+# Draft state attribute -> assembler, in output order
+ASSEMBLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "faq_draft": assemble_faq_page,
+    "product_page_draft": assemble_product_page,
+    "comparison_draft": assemble_comparison_page,
+}
+
+LAYOUTS: Dict[str, Layout] = {
+    "faq_draft": FAQ_LAYOUT,
+    "product_page_draft": PRODUCT_PAGE_LAYOUT,
+    "comparison_draft": COMPARISON_LAYOUT,
+}
+
+def assemble_pages(state: Any) -> Dict[str, Dict[str, Any]]:
+    """Assembles every draft present on the state, keyed by draft name."""
+    pages = {}
+    for key, assemble in ASSEMBLERS.items():
+        draft = getattr(state, key)
+        if draft:
+            pages[key] = assemble(draft)
+    return pages
+
+def encode_page(key: str, draft: Dict[str, Any]) -> bytes:
+    """
+    Assembles and serializes a draft in one pass, without building the page
+    dict. Same bytes as serialize_page(ASSEMBLERS[key](draft)).
+    """
+    items = [(name, draft[name] if name in draft else default) for name, default in LAYOUTS[key]]
+    return encode_items(items).encode("utf-8")
@@ -1,10 +1,15 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from src.state.pipeline_state import PipelineState
 from src.templates.faq_template import TEMPLATE
 from src.blocks import BLOCKS
 from src.blocks.faq_answers import build_faq_answer
+from src.blocks.answer_cache import FaqAnswerCache
 
 class FaqPageAgent:
+    def __init__(self, answer_cache: Optional[FaqAnswerCache] = None):
+        # Optional: share one cache across products/reruns
+        self.answer_cache = answer_cache
+
     def run(self, state: PipelineState) -> PipelineState:
         if not state.product or not state.questions:
              raise ValueError("ProductData and Questions required for FaqPageAgent")
@@ -23,13 +28,19 @@ class FaqPageAgent:
         draft["question_bank"] = all_q_objs
         
         # Use external block for deterministic answers
+        answer = self.answer_cache.answer if self.answer_cache is not None else build_faq_answer
         draft["faqs"] = [
-            {"question": q["question"], "answer": build_faq_answer(state.product, q)} 
+            {"question": q["question"], "answer": answer(state.product, q)} 
             for q in all_q_objs[:5] # Limit to 5 as per plan 2B
         ]
         
         # 3. Add meta
         draft["meta"] = {"generated_by": "FaqPageAgent"}
-        
+
         state.faq_draft = draft
         return state
+
+    def flush(self):
+        """Persists new answers so the next run (or process) starts warm; called once per DAG run."""
+        if self.answer_cache is not None and self.answer_cache.path and self.answer_cache.dirty:
+            self.answer_cache.save()
@@ -1,60 +1,120 @@
-from typing import List, Dict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple
 from src.state.pipeline_state import PipelineState, CategorizedQuestions
 
+@dataclass(frozen=True)
+class QuestionTemplate:
+    question_id: str
+    category: str
+    text: str
+    # > 0 means the template is expanded once per benefit (up to this many)
+    per_benefit: int = 0
+
+    @property
+    def shared(self) -> bool:
+        """Product-independent questions have no placeholders."""
+        return "{" not in self.text
+
+class SharedQuestion(dict):
+    """
+    Read-only question item, shared by every product's question list.
+    Still a dict, so schema validation and JSON encoding see a plain object;
+    copies (copy/deepcopy/dict()) are ordinary mutable dicts.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared question bank items are read-only; copy with dict(item) to edit")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __copy__(self) -> Dict[str, str]:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> Dict[str, str]:
+        return dict(self)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+# Order matters: it is the order questions appear in question_bank.
+QUESTION_TEMPLATES: Tuple[QuestionTemplate, ...] = (
+    # 1. Informational
+    QuestionTemplate("info.what_is", "Informational", "What is {name}?"),
+    QuestionTemplate("info.concentration", "Informational", "How much {concentration} does it contain?"),
+    QuestionTemplate("info.key_ingredients", "Informational", "What are the key ingredients in {name}?"),
+    # 2. Usage
+    QuestionTemplate("usage.how_to_use", "Usage", "How do I use this product?"),
+    QuestionTemplate("usage.when_to_apply", "Usage", "When should I apply it?"),
+    QuestionTemplate("usage.with_other_serums", "Usage", "Can I use {name} with other serums?"),
+    # 3. Safety
+    QuestionTemplate("safety.side_effects", "Safety", "Are there any side effects?"),
+    QuestionTemplate("safety.sensitive_skin", "Safety", "Is {name} suitable for sensitive skin?"),
+    QuestionTemplate("safety.watch_out", "Safety", "What specifically should I watch out for?"),
+    # 4. Benefits
+    QuestionTemplate("benefits.helps_with", "Benefits", "Does this help with {benefit}?", per_benefit=2),
+    QuestionTemplate("benefits.results_time", "Benefits", "How long until I see results?"),
+    # 5. Purchase
+    QuestionTemplate("purchase.cost", "Purchase", "How much does {name} cost?"),
+    QuestionTemplate("purchase.guarantee", "Purchase", "Is there a money-back guarantee?"),
+    QuestionTemplate("purchase.where_to_buy", "Purchase", "Where can I buy it?"),
+    # 6. Storage (Bonus category to ensure > 5)
+    QuestionTemplate("storage.how_to_store", "Storage", "How should I store this serum?"),
+)
+
+# Product-independent questions, built once per process and referenced by ID.
+# Every product's question list holds these same read-only items; only
+# product-specific questions are rendered into new dicts (see run()).
+SHARED_QUESTION_BANK: Mapping[str, SharedQuestion] = MappingProxyType({
+    t.question_id: SharedQuestion(category=t.category, question=t.text.strip())
+    for t in QUESTION_TEMPLATES if t.shared
+})
+
+# Compiled plan: (question_id, category, shared item or bound str.format, per_benefit)
+_PLAN = tuple(
+    (t.question_id, t.category, SHARED_QUESTION_BANK[t.question_id] if t.shared else t.text.format, t.per_benefit)
+    for t in QUESTION_TEMPLATES
+)
+
 class GenerateQuestionsAgent:
     def run(self, state: PipelineState) -> PipelineState:
         if not state.product:
             raise ValueError("ProductData is required for GenerateQuestionsAgent")
         
         product = state.product
-        questions = []
-        
-        # 1. Informational
-        questions.append({"category": "Informational", "question": f"What is {product.product_name}?"})
-        questions.append({"category": "Informational", "question": f"How much {product.concentration} does it contain?"})
-        questions.append({"category": "Informational", "question": f"What are the key ingredients in {product.product_name}?"})
-        
-        # 2. Usage
-        questions.append({"category": "Usage", "question": "How do I use this product?"})
-        questions.append({"category": "Usage", "question": "When should I apply it?"})
-        questions.append({"category": "Usage", "question": f"Can I use {product.product_name} with other serums?"})
+        name = product.product_name
+        concentration = product.concentration
         
-        # 3. Safety
-        questions.append({"category": "Safety", "question": "Are there any side effects?"})
-        questions.append({"category": "Safety", "question": f"Is {product.product_name} suitable for sensitive skin?"})
-        questions.append({"category": "Safety", "question": "What specifically should I watch out for?"})
-        
-        # 4. Benefits
-        for benefit in product.benefits[:2]:
-             questions.append({"category": "Benefits", "question": f"Does this help with {benefit.lower()}?"})
-        questions.append({"category": "Benefits", "question": "How long until I see results?"})
-
-        # 5. Purchase
-        questions.append({"category": "Purchase", "question": f"How much does {product.product_name} cost?"})
-        questions.append({"category": "Purchase", "question": "Is there a money-back guarantee?"})
-        questions.append({"category": "Purchase", "question": "Where can I buy it?"})
-
-        # 6. Storage (Bonus category to ensure > 5)
-        questions.append({"category": "Storage", "question": "How should I store this serum?"})
-
-        # Ensure uniqueness and non-empty
+        # Walk the compiled plan; only product-specific questions are materialized.
+        # Ensure uniqueness and non-empty (first occurrence wins).
         seen = set()
-        unique_questions = []
-        for q in questions:
-            q_text = q["question"].strip()
-            if not q_text:
-                continue
-            if q_text not in seen:
-                seen.add(q_text)
-                q["question"] = q_text # Store stripped version
-                unique_questions.append(q)
+        items: List[Dict[str, str]] = []
+        ids: List[str] = []
+        for question_id, category, entry, per_benefit in _PLAN:
+            if isinstance(entry, SharedQuestion):
+                # Shared as-is: read-only, so no per-product copy is needed
+                candidates = [(question_id, entry)]
+            elif per_benefit:
+                candidates = [
+                    (f"{question_id}.{i}", {"category": category, "question": entry(benefit=benefit.lower()).strip()})
+                    for i, benefit in enumerate(product.benefits[:per_benefit])
+                ]
+            else:
+                candidates = [(question_id, {
+                    "category": category,
+                    "question": entry(name=name, concentration=concentration).strip()
+                })]
 
-        # Sanity check (though tests cover this)
-        if len(unique_questions) < 15:
-             # Just in case our list logic changes and we shrink below limit
-             # Add generic padding to guarantee contract if needed, 
-             # but better to rely on fixed list above being sufficient.
-             pass
+            for q_id, q in candidates:
+                q_text = q["question"]
+                if not q_text or q_text in seen:
+                    continue
+                seen.add(q_text)
+                items.append(q)
+                ids.append(q_id)
 
-        state.questions = CategorizedQuestions(items=unique_questions)
+        state.questions = CategorizedQuestions(items=items, ids=ids)
         return state
@@ -1,76 +1,186 @@
 import json
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from src.state.pipeline_state import PipelineState
-from src.validators.schema_validate import SchemaValidator
-from src.validators.fact_guard import FactGuard
+from src.agents.write_json import serialize_page
+from src.validators.schema_registry import REGISTRY
+from src.validators.scheduler import ValidationScheduler, build_tasks
+from src.validators.ledger import ValidationLedger, content_hash, product_fingerprint
+from src.validators.tiered import validate_catalog_tiered
+from src.storage.io_executor import IoExecutor
+from src.models.product import product_id_for
+
+VALIDATION_MODES = ("full", "tiered")
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
 
 class ValidatorAgent:
+    def __init__(self, in_memory: bool = False, max_workers: int = 1, fail_fast: bool = True,
+                 ledger: Optional[ValidationLedger] = None, force: bool = False,
+                 io_executor: Optional[IoExecutor] = None, mode: str = "full", sample_rate: float = 0.01):
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Invalid mode='{mode}'. Allowed: {list(VALIDATION_MODES)}")
+        # in_memory=True validates state.assembled_pages before they are written;
+        # otherwise each output file is read and parsed exactly once.
+        self.in_memory = in_memory
+        # Schema and FactGuard checks are independent; max_workers > 1 fans them out.
+        # fail_fast=False collects every error into validation_report instead of raising.
+        self.max_workers = max_workers
+        self.fail_fast = fail_fast
+        # Optional ledger of already-proven outputs; force=True revalidates everything
+        self.ledger = ledger
+        self.force = force
+        # Optional shared pool for reading output files concurrently
+        self.io_executor = io_executor
+        # mode="tiered": structural checks on every page, full schema + FactGuard only for the
+        # deterministic sample (see validate_catalog_tiered); the report gains a "coverage" section.
+        # Tiered results are never recorded in the ledger, since most pages are not fully proven.
+        self.mode = mode
+        self.sample_rate = sample_rate
+
     def run(self, state: PipelineState) -> PipelineState:
+        if self.mode == "tiered":
+            return self._run_tiered(state)
+
         # Configuration
         errors = []
         
-        # 1. Schema Validation (Draft 2020-12)
-        # We iterate over the output paths stored in state
-        for key, output_path in state.output_paths.items():
+        # 1. Schema Validation (Draft 2020-12) targets
+        keys = state.assembled_pages if self.in_memory else state.output_paths
+        schema_paths = {}
+        for key in keys:
             if key not in state.schema_paths:
                 continue
-
             schema_path = state.schema_paths[key]
-            
-            if not os.path.exists(output_path):
-                errors.append(f"Output file missing: {output_path}")
-                continue
-            
             if not os.path.exists(schema_path):
                 errors.append(f"Schema file missing: {schema_path}")
                 continue
+            schema_paths[key] = schema_path
 
-            try:
-                # Use strict SchemaValidator
-                SchemaValidator.validate_file(output_path, schema_path)
-            except Exception as e:
-                # Fail Fast: Raise immediately
-                raise RuntimeError(f"VALIDATION FATAL: {str(e)}")
+        ledger_keys: Dict[str, str] = {}
+        skipped: List[str] = []
+        documents = self._collect_documents(state, schema_paths, errors, ledger_keys, skipped)
 
         # 2. Fact Guard (Product Consistency)
-        if state.product:
-            try:
-                guard = FactGuard(state.product)
-                
-                # Check each generated file
-                # Map internal keys to Guard methods
-                
-                # FAQ
-                if "faq_draft" in state.output_paths:
-                    path = state.output_paths["faq_draft"]
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    guard.validate_faq_page(data)
-                    
-                # Product Page
-                if "product_page_draft" in state.output_paths:
-                    path = state.output_paths["product_page_draft"]
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    guard.validate_product_page(data)
-                    
-                # Comparison Page
-                if "comparison_draft" in state.output_paths:
-                    path = state.output_paths["comparison_draft"]
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    guard.validate_comparison_page(data)
-                    
-            except Exception as e:
-                # Fail Fast on content violation
-                raise RuntimeError(f"CONTENT VIOLATION: {str(e)}")
-        else:
+        if not state.product:
              print("[WARNING] Skipping FactGuard: No product data found in state.")
 
-        # If we get here, everything passed
+        # Schema checks first, then FactGuard, reported in that order
+        labels = {key: self._label(state, key) for key in schema_paths}
+        tasks = build_tasks("product", documents, schema_paths, state.product, labels=labels)
+        scheduler = ValidationScheduler(max_workers=self.max_workers, fail_fast=self.fail_fast)
+        failed_keys = set()
+        for task, task_errors in zip(tasks, scheduler.run(tasks)):
+            if task_errors:
+                failed_keys.add(task.output_key)
+            errors.extend(task_errors)
+
+        # 3. Record newly proven outputs
+        if self.ledger is not None:
+            for key, ledger_key in ledger_keys.items():
+                if key in documents and key not in failed_keys:
+                    self.ledger.record(ledger_key, self._label(state, key))
+            if self.ledger.path:
+                self.ledger.save()
+
         state.validation_report = {
-            "passed": True,
-            "errors": []
+            "passed": not errors,
+            "errors": errors,
+            "skipped": skipped
         }
         return state
+
+    def _run_tiered(self, state: PipelineState) -> PipelineState:
+        errors: List[str] = []
+        if self.in_memory:
+            if not state.assembled_pages:
+                raise ValueError("In-memory validation requires assembled_pages (run AssemblePagesAgent first)")
+            pages = dict(state.assembled_pages)
+        else:
+            pages = {}
+            for key, payload in self._read_outputs(state, errors).items():
+                try:
+                    pages[key] = json.loads(payload.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    raise RuntimeError(f"VALIDATION FATAL: {state.output_paths[key]} is not valid JSON: {e}")
+
+        schema_paths = {}
+        for key in pages:
+            if key in state.schema_paths:
+                if os.path.exists(state.schema_paths[key]):
+                    schema_paths[key] = state.schema_paths[key]
+                else:
+                    errors.append(f"Schema file missing: {state.schema_paths[key]}")
+
+        product_id = product_id_for(state.product.product_name) if state.product else "product"
+        report = validate_catalog_tiered([(product_id, state.product, pages)], schema_paths,
+                                         sample_rate=self.sample_rate, max_workers=self.max_workers)
+        errors.extend(report["errors"])
+        state.validation_report = {
+            "passed": not errors,
+            "errors": errors,
+            "skipped": [],
+            "coverage": report["coverage"],
+        }
+        return state
+
+    def _label(self, state: PipelineState, key: str) -> str:
+        if self.in_memory:
+            return f"<memory:{key}>"
+        return state.output_paths[key]
+
+    def _ledger_key(self, state: PipelineState, key: str, payload: bytes, schema_paths: Dict[str, str]) -> str:
+        schema_hash = REGISTRY.get_schema_hash(schema_paths[key]) if key in schema_paths else ""
+        return ValidationLedger.make_key(content_hash(payload), schema_hash, product_fingerprint(state.product))
+
+    def _collect_documents(self, state: PipelineState, schema_paths: Dict[str, str], errors: List[str],
+                           ledger_keys: Dict[str, str], skipped: List[str]) -> Dict[str, Any]:
+        """Documents still needing validation; outputs proven by the ledger are skipped."""
+        if self.in_memory:
+            if not state.assembled_pages:
+                raise ValueError("In-memory validation requires assembled_pages (run AssemblePagesAgent first)")
+            if self.ledger is None:
+                return dict(state.assembled_pages)
+            documents = {}
+            for key, page in state.assembled_pages.items():
+                # Hash the exact bytes the writer will produce
+                payload = state.encoded_pages.get(key) or serialize_page(page)
+                ledger_keys[key] = self._ledger_key(state, key, payload, schema_paths)
+                if not self.force and self.ledger.is_proven(ledger_keys[key]):
+                    skipped.append(key)
+                else:
+                    documents[key] = page
+            return documents
+
+        documents = {}
+        for key, payload in self._read_outputs(state, errors).items():
+            output_path = state.output_paths[key]
+            if self.ledger is not None:
+                ledger_keys[key] = self._ledger_key(state, key, payload, schema_paths)
+                if not self.force and self.ledger.is_proven(ledger_keys[key]):
+                    skipped.append(key)
+                    continue
+            try:
+                documents[key] = json.loads(payload.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise RuntimeError(f"VALIDATION FATAL: {output_path} is not valid JSON: {e}")
+        return documents
+
+    def _read_outputs(self, state: PipelineState, errors: List[str]) -> Dict[str, bytes]:
+        """Raw bytes per output key; missing or unreadable files become report errors for that output."""
+        paths = {}
+        for key, output_path in state.output_paths.items():
+            if not os.path.exists(output_path):
+                errors.append(f"Output file missing: {output_path}")
+            else:
+                paths[key] = output_path
+        if self.io_executor is None:
+            return {key: _read_bytes(path) for key, path in paths.items()}
+
+        futures = {key: self.io_executor.submit(key, _read_bytes, path) for key, path in paths.items()}
+        failures = self.io_executor.drain()
+        for key, excs in failures.items():
+            errors.extend(f"Output file unreadable: {paths.get(key, key)}: {exc}" for exc in excs)
+        return {key: future.result() for key, future in futures.items() if key not in failures}
@@ -1,43 +1,148 @@
-import json
+import hashlib
 import os
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
 from src.state.pipeline_state import PipelineState
-from src.agents.assembly import assemble_faq_page, assemble_product_page, assemble_comparison_page
+from src.agents.assembly import encode_page
+from src.storage.atomic_writer import AtomicWriter
+from src.storage.manifest import OutputManifest
+from src.storage.io_executor import IoExecutor, format_io_errors
+from src.storage.json_encoder import encode_json
+
+# Draft key -> output filename, in write order
+OUTPUT_FILES = {
+    "faq_draft": "faq.json",
+    "product_page_draft": "product_page.json",
+    "comparison_draft": "comparison_page.json",
+}
+
+def serialize_page(data: dict) -> bytes:
+    # Strict requirement: same bytes as json.dumps(data, indent=2, ensure_ascii=False)
+    return encode_json(data).encode("utf-8")
 
 class JsonWriterAgent:
-    def __init__(self, output_dir: str = "outputs"):
+    def __init__(self, output_dir: str = "outputs", verify_writes: bool = False, fsync: str = "none",
+                 skip_unchanged: bool = True, io_executor: Optional[IoExecutor] = None):
         self.output_dir = output_dir
+        # Post-write check: compare on-disk bytes to the written hash (no JSON re-parse)
+        self.verify_writes = verify_writes
+        # Temp file + rename per output; see AtomicWriter for fsync policies
+        self._writer = AtomicWriter(fsync=fsync)
+        # Content-addressed: files whose hash matches manifest.json are not rewritten
+        self.skip_unchanged = skip_unchanged
+        # Optional shared pool: file writes/verification run there, drained before the manifest
+        self.io_executor = io_executor
+        self._manifest = None
+        self._owner: Hashable = None  # product/output whose files are being written
+        self.written = []
+        self.skipped = []
+
+    def _begin(self, output_dir: str):
+        # Re-read the manifest every run: other processes may have written outputs
+        self._manifest = OutputManifest(output_dir)
+        self.written, self.skipped = [], []
+
+    def _drain(self):
+        if self.io_executor is None:
+            return
+        errors = self.io_executor.drain()
+        if errors:
+            raise RuntimeError("WRITE FAILED: " + "; ".join(format_io_errors(errors)))
+
+    def _abort(self):
+        # Let in-flight writes settle before dropping staged temp files
+        if self.io_executor is not None:
+            self.io_executor.drain()
+        self._writer.discard()
+
+    def _finish(self):
+        self._drain()
+        self._writer.flush()
+        if self._manifest.dirty:
+            self._writer.write(self._manifest.path, self._manifest.to_bytes())
+            self._writer.flush()
+            self._manifest.dirty = False
 
     def run(self, state: PipelineState) -> PipelineState:
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-
-        # 1. Assemble strict outputs using the Assembly Layer
-        # This converts internal drafts into strictly schema-compliant structures
-        
-        # FAQ
-        if state.faq_draft:
-            final_faq = assemble_faq_page(state.faq_draft)
-            path = os.path.join(self.output_dir, "faq.json")
-            self._write(path, final_faq)
-            state.output_paths["faq_draft"] = path
-        
-        # Product Page
-        if state.product_page_draft:
-            final_prod = assemble_product_page(state.product_page_draft)
-            path = os.path.join(self.output_dir, "product_page.json")
-            self._write(path, final_prod)
-            state.output_paths["product_page_draft"] = path
-            
-        # Comparison Page
-        if state.comparison_draft:
-            final_comp = assemble_comparison_page(state.comparison_draft)
-            path = os.path.join(self.output_dir, "comparison_page.json")
-            self._write(path, final_comp)
-            state.output_paths["comparison_draft"] = path
-            
+        # 0. Gate: pages that failed validation (e.g. tiered mode, which reports rather than raises) never reach disk
+        report = state.validation_report
+        if report is not None and not report.get("passed"):
+            raise RuntimeError("VALIDATION FAILED: refusing to write outputs: " + "; ".join(report.get("errors", [])))
+
+        # 1. Reuse the bytes encoded at assembly (or the assembled pages) when present;
+        # otherwise assemble and serialize each draft in one pass
+        pages = state.encoded_pages or state.assembled_pages or {
+            key: encode_page(key, getattr(state, key)) for key in OUTPUT_FILES if getattr(state, key)
+        }
+
+        # A run may target its own directory (e.g. a run-scoped pipeline) without reconfiguring the agent
+        output_dir = state.output_dir or self.output_dir
+        self._begin(output_dir)
+        try:
+            for key, filename in OUTPUT_FILES.items():
+                if key not in pages:
+                    continue
+                path = os.path.join(output_dir, filename)
+                self._owner = key
+                state.output_hashes[key] = self._write(path, pages[key])
+                state.output_paths[key] = path
+            self._finish()
+        except BaseException:
+            self._abort()
+            raise
+
+        if self.verify_writes:
+            for key, path in state.output_paths.items():
+                if key in state.output_hashes:
+                    self._submit(key, self._verify, path, state.output_hashes[key])
+            self._drain()
+
         return state
 
-    def _write(self, path: str, data: dict):
-        # Strict requirement: ensure_ascii=False, indent=2
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def write_catalog(self, entries: Iterable[Tuple[Hashable, Dict[str, Any]]]) -> Dict[Hashable, Dict[str, str]]:
+        """
+        Writes many products' assembled pages to <output_dir>/<product_id>/<file>,
+        sharing directory creation and the fsync policy across the whole batch.
+        Returns {product_id: {output_key: sha256}}.
+        """
+        hashes: Dict[Hashable, Dict[str, str]] = {}
+        self._begin(self.output_dir)
+        try:
+            for product_id, pages in entries:
+                name = str(product_id)
+                if not name or name in (".", "..") or os.sep in name or (os.altsep and os.altsep in name):
+                    raise ValueError(f"Invalid product id for a directory name: {product_id!r}")
+                product_dir = os.path.join(self.output_dir, name)
+                self._owner = product_id
+                hashes[product_id] = {
+                    key: self._write(os.path.join(product_dir, filename), pages[key])
+                    for key, filename in OUTPUT_FILES.items() if key in pages
+                }
+            self._finish()
+        except BaseException:
+            self._abort()
+            raise
+        return hashes
+
+    def _submit(self, owner: Hashable, fn, *args):
+        if self.io_executor is None:
+            fn(*args)
+        else:
+            self.io_executor.submit(owner, fn, *args)
+
+    def _write(self, path: str, data: Any) -> str:
+        # data: an assembled page, or its already-encoded bytes
+        payload = data if isinstance(data, bytes) else serialize_page(data)
+        digest = hashlib.sha256(payload).hexdigest()
+        if self.skip_unchanged and self._manifest.is_current(path, digest):
+            self.skipped.append(path)
+            return digest
+        self._submit(self._owner, self._writer.write, path, payload)
+        self._manifest.record(path, digest, len(payload))
+        self.written.append(path)
+        return digest
+
+    def _verify(self, path: str, expected: str):
+        with open(path, "rb") as f:
+            actual = hashlib.sha256(f.read()).hexdigest()
+        if actual != expected:
+            raise RuntimeError(f"WRITE VERIFICATION FAILED: {path} hash {actual} != {expected}")
@@ -0,0 +1,79 @@
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.state.pipeline_state import PipelineState
+from src.agents.assembly import assemble_pages
+from src.agents.write_json import OUTPUT_FILES
+from src.models.product import product_id_for
+from src.storage.jsonl_shards import ShardedJsonlWriter
+
+# Draft key -> record field ("faq", "product_page", "comparison_page")
+RECORD_FIELDS = {key: os.path.splitext(filename)[0] for key, filename in OUTPUT_FILES.items()}
+
+def to_record(pages: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: pages[key] for key, field in RECORD_FIELDS.items() if key in pages}
+
+class JsonlWriterAgent:
+    """
+    Compact alternative to JsonWriterAgent for large catalogs: one JSON line
+    per product in sharded .jsonl files (optionally gzip/lzma compressed)
+    with a sidecar offset index per shard. The pretty per-file layout written
+    by JsonWriterAgent stays the default output.
+
+    run() appends one product per call to a sink kept open across calls, so
+    a pipeline run per product still fills shards of `products_per_shard`.
+    A shard is published when it rotates or on close(); use the agent as a
+    context manager (or call close()) once the last product is written.
+    """
+
+    def __init__(self, output_dir: str = os.path.join("outputs", "jsonl"), products_per_shard: int = 1000,
+                 max_shard_bytes: int = 64 * 1024 * 1024, compression: Optional[str] = None):
+        self.output_dir = output_dir
+        self.products_per_shard = products_per_shard
+        self.max_shard_bytes = max_shard_bytes
+        self.compression = compression
+        self._open_sink: Optional[ShardedJsonlWriter] = None  # shared by run() calls until close()
+
+    def _sink(self) -> ShardedJsonlWriter:
+        return ShardedJsonlWriter(self.output_dir, products_per_shard=self.products_per_shard,
+                                  max_shard_bytes=self.max_shard_bytes, compression=self.compression)
+
+    def run(self, state: PipelineState) -> PipelineState:
+        if not state.product:
+            raise ValueError("No product found in state to write a JSONL record for")
+        pages = state.assembled_pages or assemble_pages(state)
+        product_id = product_id_for(state.product.product_name)
+        if self._open_sink is None:
+            self._open_sink = self._sink()
+        self._open_sink.append(product_id, to_record(pages))
+        # Shard holding this record (published when it rotates or on close())
+        state.output_paths["jsonl_shard"] = self._open_sink.open_shard
+        return state
+
+    def close(self) -> List[str]:
+        """Publishes the shards filled by run(); returns their paths."""
+        sink, self._open_sink = self._open_sink, None
+        return sink.close() if sink is not None else []
+
+    def abort(self):
+        """Drops the shard still open from run() calls without publishing it."""
+        sink, self._open_sink = self._open_sink, None
+        if sink is not None:
+            sink.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_catalog(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Appends {product_id: assembled pages} records; returns the shard paths written."""
+        # Publish pending run() records first so shard numbers cannot collide
+        self.close()
+        with self._sink() as sink:
+            for product_id, pages in entries:
+                sink.append(str(product_id), to_record(pages))
+        return sink.shards
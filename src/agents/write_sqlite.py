@@ -0,0 +1,45 @@
+import hashlib
+import os
+from typing import Any, Dict, Iterable, Tuple
+from src.state.pipeline_state import PipelineState
+from src.agents.assembly import assemble_pages
+from src.agents.write_json import serialize_page
+from src.agents.write_jsonl import RECORD_FIELDS
+from src.models.product import product_id_for
+from src.storage.sqlite_store import SqliteOutputStore
+
+DEFAULT_DB_PATH = os.path.join("outputs", "outputs.sqlite")
+
+class SqliteWriterAgent:
+    """
+    Writes assembled pages into a SqliteOutputStore. Bodies are the same
+    bytes JsonWriterAgent writes, so content_hash matches manifest.json ETags.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, batch_size: int = 500):
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+    def run(self, state: PipelineState) -> PipelineState:
+        pages = state.assembled_pages or assemble_pages(state)
+        hashes = self.write_catalog([(product_id_for(state.product.product_name), pages)])
+        for product_hashes in hashes.values():
+            state.output_hashes.update(product_hashes)
+        state.output_paths["sqlite"] = self.db_path
+        return state
+
+    def write_catalog(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Dict[str, str]]:
+        """Upserts every product's pages; returns {product_id: {output_key: sha256}}."""
+        hashes: Dict[str, Dict[str, str]] = {}
+        with SqliteOutputStore(self.db_path, batch_size=self.batch_size) as store:
+            for product_id, pages in entries:
+                product_id = str(product_id)
+                hashes[product_id] = {}
+                for key, output_type in RECORD_FIELDS.items():
+                    if key not in pages:
+                        continue
+                    payload = serialize_page(pages[key])
+                    digest = hashlib.sha256(payload).hexdigest()
+                    store.put(product_id, output_type, digest, payload.decode("utf-8"))
+                    hashes[product_id][key] = digest
+        return hashes
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.blocks.faq_answers import ANSWER_FIELDS, route_question, render_answer
+
+# Bump when answer wording changes so persisted caches are discarded.
+CACHE_VERSION = 1
+CACHE_FILE_NAME = "faq_answers.json"
+DEFAULT_CACHE_PATH = os.path.join(".cache", CACHE_FILE_NAME)
+
+def normalize_question(question_obj: Dict[str, str]) -> Tuple[str, str]:
+    """(category, question) normalized the same way routing sees them."""
+    return (
+        (question_obj.get("category") or "").strip().lower(),
+        (question_obj.get("question") or "").strip().lower(),
+    )
+
+def field_fingerprint(product: Any, fields: Tuple[str, ...]) -> str:
+    """Hash of only the product fields a rule reads."""
+    if not fields:
+        return ""
+    payload = json.dumps([getattr(product, f) for f in fields], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+
+class FaqAnswerCache:
+    """
+    Bounded LRU in front of build_faq_answer.
+
+    Questions are routed once per normalized (category, question) to a rule,
+    and answers are keyed by (rule, fingerprint of the fields that rule reads),
+    so e.g. a price change only invalidates price answers. Optionally persisted
+    to a JSON file between runs.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: Optional[str] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.path = path
+        self._routes: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+        self._answers: "OrderedDict[Tuple[Optional[str], str], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False  # answers added since the last load/save
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def _route(self, question_obj: Dict[str, str]) -> Optional[str]:
+        key = normalize_question(question_obj)
+        if key in self._routes:
+            self._routes.move_to_end(key)
+            return self._routes[key]
+        rule_id = route_question({"category": key[0], "question": key[1]})
+        self._routes[key] = rule_id
+        if len(self._routes) > self.maxsize:
+            self._routes.popitem(last=False)
+        return rule_id
+
+    def answer(self, product: Any, question_obj: Dict[str, str]) -> str:
+        rule_id = self._route(question_obj)
+        key = (rule_id, field_fingerprint(product, ANSWER_FIELDS.get(rule_id, ())))
+        cached = self._answers.get(key)
+        if cached is not None:
+            self._answers.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        result = render_answer(product, rule_id)
+        self._answers[key] = result
+        self.dirty = True
+        if len(self._answers) > self.maxsize:
+            self._answers.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._routes.clear()
+        self._answers.clear()
+
+    def load(self, path: str):
+        """Loads persisted answers; a missing, corrupt or stale file is ignored."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return
+        answers = payload.get("answers")
+        if not isinstance(answers, list):
+            return
+        loaded: "OrderedDict[Tuple[Optional[str], str], str]" = OrderedDict()
+        for entry in answers[-self.maxsize:]:
+            # [rule_id or null, fingerprint, text]; any other shape means the file is corrupt
+            if not (isinstance(entry, list) and len(entry) == 3 and (entry[0] is None or isinstance(entry[0], str))
+                    and isinstance(entry[1], str) and isinstance(entry[2], str)):
+                return
+            loaded[(entry[0], entry[1])] = entry[2]
+        self._answers.update(loaded)
+
+    def save(self, path: Optional[str] = None):
+        """Persists answers (LRU order) via a unique temp file + rename."""
+        path = path or self.path
+        if not path:
+            raise ValueError("No cache path configured")
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        payload = {
+            "version": CACHE_VERSION,
+            "answers": [[rule_id, fp, text] for (rule_id, fp), text in self._answers.items()],
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=parent or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.dirty = False
@@ -1,29 +1,108 @@
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
 
-def build_faq_answer(product: Any, question_obj: Dict[str, str]) -> str:
+FALLBACK_ANSWER = "This information is not provided in the product dataset."
+
+def _answer_usage(product: Any) -> str:
+    return product.how_to_use
+
+def _answer_safety(product: Any) -> str:
+    return product.side_effects
+
+def _answer_ingredients(product: Any) -> str:
+    return "Key ingredients: " + ", ".join(product.key_ingredients)
+
+def _answer_benefits(product: Any) -> str:
+    return "Benefits: " + ", ".join(product.benefits)
+
+def _answer_price(product: Any) -> str:
+    return f"Price: ₹{product.price_inr}"
+
+# Routing rules in priority order: (rule_id, category keywords, question keywords, renderer).
+# A question is answered by the first rule with a keyword contained in its
+# lowercased category or question text; otherwise FALLBACK_ANSWER.
+ANSWER_RULES: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...], Callable[[Any], str]], ...] = (
+    ("usage", ("usage",), ("how to use", "apply"), _answer_usage),
+    ("safety", ("safety",), ("side effect", "tingl"), _answer_safety),
+    ("ingredients", ("ingredient",), ("ingredient",), _answer_ingredients),
+    ("benefits", ("benefit",), ("dark spot", "bright"), _answer_benefits),
+    ("price", ("price", "purchase"), ("cost",), _answer_price),
+)
+
+# Product fields each rule's renderer reads (the fallback reads none).
+ANSWER_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "usage": ("how_to_use",),
+    "safety": ("side_effects",),
+    "ingredients": ("key_ingredients",),
+    "benefits": ("benefits",),
+    "price": ("price_inr",),
+}
+
+_RENDERERS: Dict[str, Callable[[Any], str]] = {rule_id: render for rule_id, _, _, render in ANSWER_RULES}
+
+def _compile(keyword_sets: List[Tuple[str, ...]]):
     """
-    Deterministically builds an FAQ answer based on product data.
+    Compiles all keywords into one pattern. The zero-width lookahead reports a
+    match at every offset (overlapping keywords are not hidden), and the
+    alternation lists keywords in rule priority order.
     """
+    priority: Dict[str, int] = {}
+    for rank, keywords in enumerate(keyword_sets):
+        for kw in keywords:
+            priority.setdefault(kw, rank)
+    ordered = sorted(priority, key=lambda kw: (priority[kw], -len(kw)))
+    pattern = re.compile("(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))")
+    return pattern, priority
+
+_CATEGORY_MATCHER = _compile([cat_kws for _, cat_kws, _, _ in ANSWER_RULES])
+_QUESTION_MATCHER = _compile([q_kws for _, _, q_kws, _ in ANSWER_RULES])
+_NO_MATCH = len(ANSWER_RULES)
+
+def _best_rank(text: str, matcher) -> int:
+    pattern, priority = matcher
+    best = _NO_MATCH
+    for m in pattern.finditer(text):
+        rank = priority[m.group(1)]
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+    return best
+
+def route_question(question_obj: Dict[str, str]) -> Optional[str]:
+    """Returns the rule_id that answers this question, or None for the fallback."""
     cat = (question_obj.get("category") or "").lower()
     q = (question_obj.get("question") or "").lower()
+    rank = _best_rank(cat, _CATEGORY_MATCHER)
+    if rank:
+        rank = min(rank, _best_rank(q, _QUESTION_MATCHER))
+    return ANSWER_RULES[rank][0] if rank < _NO_MATCH else None
 
-    # 0. explicit rejections/fallbacks (None currently needed, relying on general fallback)
-
-    # 1. Exact/Keyword Mapping to Dataset Fields
-    if "usage" in cat or "how to use" in q or "apply" in q:
-        return product.how_to_use
-    
-    if "safety" in cat or "side effect" in q or "tingl" in q:
-        return product.side_effects
-        
-    if "ingredient" in cat or "ingredient" in q:
-        return "Key ingredients: " + ", ".join(product.key_ingredients)
-        
-    if "benefit" in cat or "dark spot" in q or "bright" in q:
-        return "Benefits: " + ", ".join(product.benefits)
-        
-    if "price" in cat or "purchase" in cat or "cost" in q:
-        return f"Price: ₹{product.price_inr}"
-        
-    # 2. General Fallback (Dataset Only - Safe Compliance)
-    return "This information is not provided in the product dataset."
+def render_answer(product: Any, rule_id: Optional[str]) -> str:
+    """Renders the answer for a routed rule (None -> dataset-only fallback)."""
+    if rule_id is None:
+        return FALLBACK_ANSWER
+    return _RENDERERS[rule_id](product)
+
+def build_faq_answer(product: Any, question_obj: Dict[str, str]) -> str:
+    """
+    Deterministically builds an FAQ answer based on product data.
+    """
+    return render_answer(product, route_question(question_obj))
+
+def build_faq_answers(jobs: Iterable[Tuple[Any, Iterable[Dict[str, str]]]]) -> List[List[str]]:
+    """
+    Batch API: answers every question for many (product, questions) pairs.
+    Each distinct (category, question) is routed once across the whole batch.
+    """
+    routes: Dict[Tuple[str, str], Optional[str]] = {}
+    results = []
+    for product, questions in jobs:
+        answers = []
+        for q in questions:
+            key = (q.get("category") or "", q.get("question") or "")
+            if key not in routes:
+                routes[key] = route_question(q)
+            answers.append(render_answer(product, routes[key]))
+        results.append(answers)
+    return results
@@ -0,0 +1,197 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.agents.write_json import OUTPUT_FILES
+from src.agents.write_jsonl import RECORD_FIELDS
+from src.storage.atomic_writer import AtomicWriter
+from src.storage.jsonl_shards import INDEX_SUFFIX, ShardedJsonlReader, read_record
+from src.storage.manifest import MANIFEST_NAME, OutputManifest
+from src.validators.schema_registry import REGISTRY, SCHEMA_PATHS
+
+INDEX_NAME = "catalog_index.jsonl"
+INDEX_VERSION = 2
+
+@dataclass
+class IndexEntry:
+    product_id: str
+    title: str
+    price: int
+    currency: str
+    # "passed" | "failed": JSON Schema check of the product's pages at index time
+    # (schema only; FactGuard needs the source product and is not run here)
+    schema_status: str
+    # Where the pages live: {"dir": <product dir>} or {"shard", "offset", "length", "line"}
+    location: Dict[str, Any] = field(default_factory=dict)
+    # Changes whenever the product's pages change; unchanged entries are reused on rebuild
+    etag: str = ""
+
+def _schema_status(pages: Dict[str, Any]) -> str:
+    for key, page in pages.items():
+        fast = REGISTRY.get_fast_validator(SCHEMA_PATHS[key])
+        valid = fast(page) if fast is not None else REGISTRY.get_validator(SCHEMA_PATHS[key]).is_valid(page)
+        if not valid:
+            return "failed"
+    return "passed" if pages else "failed"
+
+def summarize(product_id: str, pages: Dict[str, Any], location: Dict[str, Any], etag: str) -> IndexEntry:
+    """Index entry for one product's assembled pages (keyed like OUTPUT_FILES)."""
+    product_page = pages.get("product_page_draft") or {}
+    faq = pages.get("faq_draft") or {}
+    pricing = product_page.get("pricing") or faq.get("price") or {}
+    title = (product_page.get("hero") or {}).get("title") or faq.get("title") or product_id
+    return IndexEntry(product_id, str(title), int(pricing.get("amount", 0) or 0), str(pricing.get("currency", "")),
+                      _schema_status(pages), location, etag)
+
+def source_stamp(root: str) -> List[Any]:
+    # manifest.json (per-file layout) and shard indexes (JSONL layout) change on every write
+    stamp = []
+    for name in sorted(os.listdir(root)):
+        if name == MANIFEST_NAME or name.endswith(INDEX_SUFFIX):
+            st = os.stat(os.path.join(root, name))
+            stamp.append([name, st.st_mtime_ns, st.st_size])
+    return stamp
+
+class CatalogIndex:
+    """
+    Lightweight index over a generated catalog, so a browser can page and
+    filter without opening every product.
+
+    The catalog is either JsonWriterAgent.write_catalog's layout
+    (<root>/<product_id>/*.json + manifest.json) or JsonlWriterAgent shards.
+    The index is persisted as <root>/catalog_index.jsonl (a header line, then
+    one compact entry per product) and rebuilt incrementally: entries whose
+    etag (manifest hashes / shard location) is unchanged are kept as is.
+    Full pages are only read by load(), one product at a time.
+    """
+
+    def __init__(self, root: str, entries: List[IndexEntry]):
+        self.root = root
+        self.entries = entries
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.root, INDEX_NAME)
+
+    # --- building ---
+
+    @classmethod
+    def open(cls, root: str) -> "CatalogIndex":
+        """Loads the persisted index, rebuilding it first if the catalog changed since."""
+        header, entries = cls._read(os.path.join(root, INDEX_NAME))
+        if header.get("version") == INDEX_VERSION and header.get("stamp") == source_stamp(root):
+            return cls(root, entries)
+        return cls.build(root, previous=entries)
+
+    @classmethod
+    def build(cls, root: str, previous: Iterable[IndexEntry] = ()) -> "CatalogIndex":
+        known = {e.product_id: e for e in previous}
+        if any(name.endswith(INDEX_SUFFIX) for name in os.listdir(root)):
+            entries = cls._from_shards(root, known)
+        else:
+            entries = cls._from_directories(root, known)
+        entries.sort(key=lambda e: e.product_id)
+        index = cls(root, entries)
+        index.save()
+        return index
+
+    @staticmethod
+    def _from_directories(root: str, known: Dict[str, IndexEntry]) -> List[IndexEntry]:
+        manifest = OutputManifest(root)
+        entries = []
+        for name in sorted(os.listdir(root)):
+            product_dir = os.path.join(root, name)
+            if not os.path.isdir(product_dir):
+                continue
+            paths = {key: os.path.join(product_dir, filename) for key, filename in OUTPUT_FILES.items()
+                     if os.path.exists(os.path.join(product_dir, filename))}
+            if not paths:
+                continue
+            etags = [manifest.etag(path) for path in paths.values()]
+            etag = ",".join(etags) if all(etags) else ""
+            previous = known.get(name)
+            if etag and previous is not None and previous.etag == etag:
+                entries.append(previous)
+                continue
+            pages = {}
+            for key, path in paths.items():
+                with open(path, "r", encoding="utf-8") as f:
+                    pages[key] = json.load(f)
+            entries.append(summarize(name, pages, {"dir": name}, etag))
+        return entries
+
+    @staticmethod
+    def _from_shards(root: str, known: Dict[str, IndexEntry]) -> List[IndexEntry]:
+        reader = ShardedJsonlReader(root)
+        fields = {field_name: key for key, field_name in RECORD_FIELDS.items()}
+        entries = []
+        for product_id in reader.ids():
+            shard_path, offset, length, line = reader.locate(product_id)
+            location = {"shard": os.path.basename(shard_path), "offset": offset, "length": length, "line": line}
+            etag = f"{location['shard']}:{offset}:{line}"
+            previous = known.get(product_id)
+            if previous is not None and previous.etag == etag:
+                entries.append(previous)
+                continue
+            record = reader.get(product_id)
+            pages = {fields[name]: page for name, page in record.items() if name in fields}
+            entries.append(summarize(product_id, pages, location, etag))
+        return entries
+
+    def save(self):
+        header = {"version": INDEX_VERSION, "stamp": source_stamp(self.root)}
+        lines = [json.dumps(header)] + [json.dumps(asdict(e), ensure_ascii=False, separators=(",", ":"))
+                                        for e in self.entries]
+        AtomicWriter().write_many([(self.path, ("\n".join(lines) + "\n").encode("utf-8"))])
+
+    @staticmethod
+    def _read(path: str) -> Tuple[Dict[str, Any], List[IndexEntry]]:
+        """A missing or unreadable index reads as empty (and is rebuilt by open())."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                return header, [IndexEntry(**json.loads(line)) for line in f if line.strip()]
+        except (OSError, ValueError, TypeError):
+            return {}, []
+
+    # --- browsing ---
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def query(self, text: str = "", schema_status: Optional[str] = None,
+              min_price: Optional[int] = None, max_price: Optional[int] = None) -> List[IndexEntry]:
+        needle = text.strip().lower()
+        return [
+            e for e in self.entries
+            if (not needle or needle in e.product_id.lower() or needle in e.title.lower())
+            and (schema_status is None or e.schema_status == schema_status)
+            and (min_price is None or e.price >= min_price)
+            and (max_price is None or e.price <= max_price)
+        ]
+
+    def page(self, number: int, size: int = 50, **filters: Any) -> Tuple[List[IndexEntry], int]:
+        """Entries on 0-based page `number` of the filtered list, and the filtered total."""
+        if size <= 0:
+            raise ValueError("page size must be positive")
+        matches = self.query(**filters)
+        start = max(number, 0) * size
+        return matches[start:start + size], len(matches)
+
+    def load(self, entry: IndexEntry) -> Dict[str, Any]:
+        """Reads one product's full pages (keyed like OUTPUT_FILES) from its indexed location."""
+        location = entry.location
+        if "dir" in location:
+            pages = {}
+            for key, filename in OUTPUT_FILES.items():
+                path = os.path.join(self.root, location["dir"], filename)
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        pages[key] = json.load(f)
+            return pages
+        # Straight to the indexed offset; the shard .idx files are not loaded
+        record = read_record(os.path.join(self.root, location["shard"]), location["offset"],
+                             location["length"], location["line"])
+        fields = {field_name: key for key, field_name in RECORD_FIELDS.items()}
+        return {fields[name]: page for name, page in record.items() if name in fields}
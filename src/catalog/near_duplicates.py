@@ -0,0 +1,166 @@
+import hashlib
+import random
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.product import ProductData
+
+# Mersenne prime used for the universal hash family h(x) = (a*x + b) mod P
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def product_features(product: ProductData) -> Set[str]:
+    """
+    Feature set used for similarity: the product's ingredients and benefits,
+    normalized and prefixed so an ingredient never collides with a benefit.
+    """
+    features = {"ing:" + item.strip().lower() for item in product.key_ingredients if item.strip()}
+    features.update("ben:" + item.strip().lower() for item in product.benefits if item.strip())
+    return features
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard similarity, used to confirm LSH candidates."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _base_hash(token: str) -> int:
+    # Stable across processes (unlike hash(), which is salted per interpreter)
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    """Deterministic MinHash signatures over string feature sets."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        if num_perm <= 0:
+            raise ValueError("num_perm must be positive")
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [_base_hash(t) for t in set(tokens)]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._params
+        )
+
+    @staticmethod
+    def estimate(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity from two signatures of equal length."""
+        if len(sig_a) != len(sig_b):
+            raise ValueError("Signatures must have the same length")
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+class LshIndex:
+    """
+    Banded locality-sensitive hashing index over MinHash signatures.
+    Items sharing at least one band bucket become candidate pairs, so finding
+    comparison pairs costs roughly O(n) instead of all-pairs O(n^2).
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.hasher = MinHasher(num_perm=num_perm, seed=seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._features: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def features(self, key: str) -> Set[str]:
+        return self._features[key]
+
+    def _band_keys(self, sig: Tuple[int, ...]):
+        for i in range(self.bands):
+            yield i, sig[i * self.rows:(i + 1) * self.rows]
+
+    def add(self, key: str, tokens: Iterable[str]):
+        if key in self._signatures:
+            raise ValueError(f"Key {key} already indexed.")
+        features = set(tokens)
+        sig = self.hasher.signature(features)
+        self._signatures[key] = sig
+        self._features[key] = features
+        for i, band in self._band_keys(sig):
+            self._buckets[i].setdefault(band, []).append(key)
+
+    def query(self, tokens: Iterable[str]) -> List[str]:
+        """Keys sharing at least one band with the given feature set (insertion order)."""
+        sig = self.hasher.signature(tokens)
+        seen: Dict[str, None] = {}
+        for i, band in self._band_keys(sig):
+            for key in self._buckets[i].get(band, ()):
+                seen[key] = None
+        return list(seen)
+
+    def candidate_pairs(self) -> Set[Tuple[str, str]]:
+        """All unordered key pairs that collide in at least one band."""
+        pairs: Set[Tuple[str, str]] = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                if len(keys) < 2:
+                    continue
+                for i in range(len(keys)):
+                    for j in range(i + 1, len(keys)):
+                        a, b = keys[i], keys[j]
+                        pairs.add((a, b) if a < b else (b, a))
+        return pairs
+
+    def similar_pairs(self, threshold: float) -> List[Tuple[str, str, float]]:
+        """Candidate pairs whose exact Jaccard similarity is >= threshold, sorted deterministically."""
+        result = []
+        for a, b in self.candidate_pairs():
+            score = jaccard(self._features[a], self._features[b])
+            if score >= threshold:
+                result.append((a, b, score))
+        result.sort(key=lambda r: (-r[2], r[0], r[1]))
+        return result
+
+
+class NearDuplicateDetector:
+    """
+    Ingest-time guard: flags a product whose ingredient/benefit set is a
+    near-duplicate of one already seen, so its content need not be regenerated.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.index = LshIndex(num_perm=num_perm, bands=bands, seed=seed)
+
+    def check(self, key: str, product: ProductData) -> Optional[str]:
+        """
+        Returns the key of the most similar previously ingested product if it is
+        a near-duplicate, else None. Non-duplicates are added to the index.
+        Re-ingesting the same key (e.g. a rerun) never matches itself.
+        """
+        features = product_features(product)
+        best_key, best_score = None, -1.0
+        for cand in self.index.query(features):
+            if cand == key:
+                continue
+            score = jaccard(features, self.index.features(cand))
+            if score > best_score:
+                best_key, best_score = cand, score
+
+        if best_key is not None and best_score >= self.threshold:
+            return best_key
+
+        if key not in self.index:
+            self.index.add(key, features)
+        return None
@@ -1,3 +1,4 @@
+import re
 from typing import List
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
@@ -12,6 +13,11 @@ def parse_price(value: str) -> int:
     digits = ''.join(filter(str.isdigit, value))
     return int(digits) if digits else 0
 
+def product_id_for(product_name: str) -> str:
+    """Stable, filesystem-safe product ID derived from the product name (e.g. 'glowboost-vitamin-c-serum')."""
+    slug = re.sub(r"[^a-z0-9]+", "-", product_name.lower()).strip("-")
+    return slug or "product"
+
 class RawProductInput(BaseModel):
     model_config = ConfigDict(extra="forbid")
     product_name: str = Field(alias="Product Name")
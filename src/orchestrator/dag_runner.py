@@ -1,5 +1,7 @@
-from typing import List, Dict, Any, Set
-from dataclasses import dataclass, field
+import json
+import time
+from typing import List, Dict, Any, Callable, Optional, Set, TextIO
+from dataclasses import dataclass, field, asdict
 from src.state.pipeline_state import PipelineState
 
 @dataclass
@@ -8,14 +10,39 @@ class NodeSpec:
     agent: Any  # Must have .run(state)
     depends_on: List[str] = field(default_factory=list)
 
+@dataclass
+class NodeEvent:
+    node_id: str
+    event: str  # "started" | "finished" | "failed"
+    index: int  # position in the execution plan
+    total: int  # number of nodes in the plan
+    timestamp: float  # time.time()
+    duration_sec: Optional[float] = None  # finished/failed only
+    error: Optional[str] = None  # failed only
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+EventListener = Callable[[NodeEvent], None]
+
+def jsonl_listener(stream: TextIO) -> EventListener:
+    """Writes each event as one JSON line and flushes, for line-delimited progress streams."""
+    def listener(event: NodeEvent):
+        stream.write(event.to_json() + "\n")
+        stream.flush()
+    return listener
+
 class DagRunner:
     def __init__(self):
         self._nodes: Dict[str, NodeSpec] = {}
+        # Execution order, computed once and reused until the graph changes
+        self._plan: List[str] = []
 
     def register(self, node: NodeSpec):
         if node.node_id in self._nodes:
             raise ValueError(f"Node {node.node_id} already registered.")
         self._nodes[node.node_id] = node
+        self._plan = []
 
     def _topological_sort(self) -> List[str]:
         # Kahn's algorithm
@@ -46,14 +73,42 @@ class DagRunner:
             
         return result
 
-    def run(self, initial_state: PipelineState) -> PipelineState:
-        execution_order = self._topological_sort()
+    def run(self, initial_state: PipelineState, on_event: Optional[EventListener] = None,
+            out: Optional[TextIO] = None) -> PipelineState:
+        """
+        on_event, if given, receives a NodeEvent when each node starts, finishes or fails.
+        Progress lines go to out (default: sys.stdout at call time).
+        Agents' flush() hooks run once at the end, whether or not a node failed.
+        """
+        if not self._plan:
+            self._plan = self._topological_sort()
+        execution_order = self._plan
         state = initial_state
-        print(f"DAG Execution Order: {execution_order}")
+        print(f"DAG Execution Order: {execution_order}", file=out)
+        emit = on_event or (lambda event: None)
+        total = len(execution_order)
         
-        for node_id in execution_order:
-            node = self._nodes[node_id]
-            print(f"Running node: {node_id}")
-            state = node.agent.run(state)
-            
+        try:
+            for index, node_id in enumerate(execution_order):
+                node = self._nodes[node_id]
+                print(f"Running node: {node_id}", file=out)
+                emit(NodeEvent(node_id, "started", index, total, time.time()))
+                t0 = time.perf_counter()
+                try:
+                    state = node.agent.run(state)
+                except BaseException as e:
+                    emit(NodeEvent(node_id, "failed", index, total, time.time(),
+                                   round(time.perf_counter() - t0, 6), f"{type(e).__name__}: {e}"))
+                    raise
+                emit(NodeEvent(node_id, "finished", index, total, time.time(), round(time.perf_counter() - t0, 6)))
+        finally:
+            self.flush()
+
         return state
+
+    def flush(self):
+        """Run teardown: agents with a flush() hook persist whatever they batched during the run."""
+        for node_id in self._plan or self._nodes:
+            flush = getattr(self._nodes[node_id].agent, "flush", None)
+            if flush is not None:
+                flush()
@@ -0,0 +1,118 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+ACTIVE_STATES = ("queued", "running")
+
+@dataclass
+class Job:
+    job_id: str
+    target: str  # what the job regenerates, e.g. an output directory
+    status: str = "queued"  # "queued" | "running" | "succeeded" | "failed"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # Progress written by the job function (e.g. NodeEvents); read by pollers
+    events: List[Any] = field(default_factory=list)
+    result: Any = None
+    error: Optional[str] = None
+    # Submissions coalesced into this job (1 = only the original)
+    requests: int = 1
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATES
+
+class JobManager:
+    """
+    Process-wide background job queue for regenerations.
+
+    At most one job per target is queued or running: submitting while one is
+    active returns that job (duplicates coalesce). Jobs for different targets
+    run concurrently up to max_concurrent; the rest wait as "queued". Callers
+    (e.g. Streamlit sessions) keep the job_id and poll get()/latest().
+    """
+
+    def __init__(self, max_concurrent: int = 1, max_history: int = 50):
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._ids = itertools.count(1)
+        self.max_history = max_history
+
+    def submit(self, target: str, fn: Callable[[Job], Any]) -> Job:
+        """Queues fn(job) for target, or returns the target's queued/running job."""
+        with self._lock:
+            job = self._active.get(target)
+            if job is not None:
+                job.requests += 1
+                return job
+            job = Job(job_id=f"job-{next(self._ids):04d}", target=target)
+            self._jobs[job.job_id] = job
+            self._active[target] = job
+            self._futures[job.job_id] = self._pool.submit(self._execute, job, fn)
+            self._trim()
+            return job
+
+    def _execute(self, job: Job, fn: Callable[[Job], Any]):
+        job.started_at = time.time()
+        job.status = "running"
+        try:
+            job.result = fn(job)
+            job.status = "succeeded"
+        except BaseException as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._active.get(job.target) is job:
+                    del self._active[job.target]
+                self._futures.pop(job.job_id, None)
+
+    def _trim(self):
+        # Forget the oldest finished jobs beyond max_history
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(self._jobs) - self.max_history)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def active(self, target: str) -> Optional[Job]:
+        return self._active.get(target)
+
+    def latest(self, target: str) -> Optional[Job]:
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job.target == target:
+                    return job
+        return None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.exception(timeout=timeout)
+        return self.get(job_id)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+_DEFAULT_MANAGER: Optional[JobManager] = None
+_DEFAULT_LOCK = threading.Lock()
+
+def get_job_manager() -> JobManager:
+    """Process-wide JobManager shared by every viewer session."""
+    global _DEFAULT_MANAGER
+    with _DEFAULT_LOCK:
+        if _DEFAULT_MANAGER is None:
+            _DEFAULT_MANAGER = JobManager()
+        return _DEFAULT_MANAGER
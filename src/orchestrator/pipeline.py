@@ -0,0 +1,227 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, TextIO
+
+from src.state.pipeline_state import PipelineState
+from src.orchestrator.dag_runner import DagRunner, EventListener, NodeSpec
+from src.agents.parse_product import ParseProductAgent
+from src.agents.generate_questions import GenerateQuestionsAgent
+from src.agents.generate_product_b import ProductBGeneratorAgent
+from src.agents.build_faq_page import FaqPageAgent
+from src.agents.build_product_page import ProductPageAgent
+from src.agents.build_comparison_page import ComparisonPageAgent
+from src.agents.assemble_pages import AssemblePagesAgent
+from src.agents.write_json import JsonWriterAgent
+from src.agents.validate_outputs import ValidatorAgent
+from src.validators.ledger import ValidationLedger, LEDGER_FILE_NAME
+from src.blocks.answer_cache import FaqAnswerCache, CACHE_FILE_NAME
+from src.validators.schema_registry import REGISTRY, SCHEMA_PATHS
+from src.storage.io_executor import IoExecutor
+from src.storage.runs import RunStore
+from src.catalog.near_duplicates import NearDuplicateDetector
+from src.models.product import product_id_for
+
+DEFAULT_INPUT_PATH = os.path.join("data", "product_input.json")
+# Pipeline caches (validation ledger, FAQ answers) default to <output_dir>/.cache
+CACHE_DIR_NAME = ".cache"
+
+def load_input_data(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+class ParseWrapperAgent:
+    """
+    Wraps the Phase 1 ParseProductAgent to fit the Phase 3 interface.
+    With a NearDuplicateDetector, each ingested product is also checked
+    against those seen before and state.near_duplicate_of is set on a match,
+    so callers can skip regenerating its content.
+    """
+    def __init__(self, near_duplicates: Optional[NearDuplicateDetector] = None):
+        self.near_duplicates = near_duplicates
+
+    def run(self, state: PipelineState) -> PipelineState:
+        if not state.raw_product:
+            raise ValueError("No raw_product to parse")
+        agent = ParseProductAgent()
+        state.product = agent.run(state.raw_product)
+        if self.near_duplicates is not None:
+            state.near_duplicate_of = self.near_duplicates.check(
+                product_id_for(state.product.product_name), state.product)
+        return state
+
+def build_dag(output_dir: str = "outputs", force_revalidate: bool = False,
+              io_executor: Optional[IoExecutor] = None, validation_mode: str = "full",
+              sample_rate: float = 0.01, near_duplicates: Optional[NearDuplicateDetector] = None,
+              cache_dir: Optional[str] = None) -> DagRunner:
+    """
+    The content pipeline: parse -> questions / Product B -> pages -> assemble -> validate -> write.
+    Persistent caches live under cache_dir (default <output_dir>/.cache), not the working directory.
+    """
+    dag = DagRunner()
+    if cache_dir is None:
+        cache_dir = os.path.join(output_dir, CACHE_DIR_NAME)
+
+    # Node 1: Parse
+    dag.register(NodeSpec(node_id="parse_product", agent=ParseWrapperAgent(near_duplicates)))
+
+    # Node 2: Questions (depends on product)
+    dag.register(NodeSpec(
+        node_id="gen_questions",
+        agent=GenerateQuestionsAgent(),
+        depends_on=["parse_product"]
+    ))
+
+    # Node 3: Product B (independent, but let's just depend on parse for consistency)
+    dag.register(NodeSpec(
+        node_id="gen_product_b",
+        agent=ProductBGeneratorAgent(),
+        depends_on=["parse_product"]
+    ))
+
+    # Node 4: Page Drafts
+    dag.register(NodeSpec(
+        node_id="build_faq",
+        # Answers persist under cache_dir (saved once per run), so reruns only render answers whose inputs changed
+        agent=FaqPageAgent(answer_cache=FaqAnswerCache(path=os.path.join(cache_dir, CACHE_FILE_NAME))),
+        depends_on=["parse_product", "gen_questions"]
+    ))
+    dag.register(NodeSpec(
+        node_id="build_product_page",
+        agent=ProductPageAgent(),
+        depends_on=["parse_product"]
+    ))
+    dag.register(NodeSpec(
+        node_id="build_comparison",
+        agent=ComparisonPageAgent(),
+        depends_on=["parse_product", "gen_product_b"]
+    ))
+
+    # Node 5: Assemble schema-shaped pages in memory
+    dag.register(NodeSpec(
+        node_id="assemble_pages",
+        agent=AssemblePagesAgent(),
+        depends_on=["build_faq", "build_product_page", "build_comparison"]
+    ))
+
+    # Node 6: Validate assembled pages before anything is written
+    dag.register(NodeSpec(
+        node_id="validate_outputs",
+        # Pages proven by an earlier run are skipped unless force_revalidate is set
+        agent=ValidatorAgent(
+            in_memory=True,
+            ledger=ValidationLedger(os.path.join(cache_dir, LEDGER_FILE_NAME)),
+            force=force_revalidate,
+            io_executor=io_executor,
+            # "tiered": structural checks always, full validation for a deterministic sample
+            mode=validation_mode,
+            sample_rate=sample_rate
+        ),
+        depends_on=["assemble_pages"]
+    ))
+
+    # Node 7: Writer (only validated pages reach disk; bytes are hash-checked after write)
+    dag.register(NodeSpec(
+        node_id="write_json",
+        agent=JsonWriterAgent(output_dir=output_dir, verify_writes=True, io_executor=io_executor),
+        depends_on=["validate_outputs"]
+    ))
+    return dag
+
+def print_summary(state: PipelineState, out: Optional[TextIO] = None):
+    """Console summary of a finished run (to out, default sys.stdout); raises SystemExit if validation failed."""
+    print("\n--- Pipeline Summary ---", file=out)
+    print(f"Product: {state.product.product_name}", file=out)
+    if state.near_duplicate_of:
+        print(f"Near-duplicate of: {state.near_duplicate_of}", file=out)
+    print(f"Questions Generated: {len(state.questions.items)}", file=out)
+    print("Outputs Written:", file=out)
+    for key, path in state.output_paths.items():
+        print(f" - {key}: {path}", file=out)
+    
+    if state.validation_report:
+        print("\n--- Validation Report ---", file=out)
+        print(f"Passed: {state.validation_report['passed']}", file=out)
+        if state.validation_report.get("skipped"):
+            print(f"Skipped (unchanged since last validation): {state.validation_report['skipped']}", file=out)
+        coverage = state.validation_report.get("coverage")
+        if coverage:
+            print(f"Coverage: {coverage['pages_full']}/{coverage['pages_total']} pages fully validated "
+                  f"(sample rate {coverage['sample_rate']}), all structurally checked", file=out)
+        if not state.validation_report['passed']:
+             print("Errors:", file=out)
+             for err in state.validation_report['errors']:
+                 print(f" - {err}", file=out)
+             # Fail Hard as per Phase 4 requirement
+             raise SystemExit("Validation failed: Pipeline outputs did not meet strict criteria.")
+    else:
+        print("\n[WARNING] No validation report found!", file=out)
+
+class Pipeline:
+    """
+    Reusable in-process pipeline. Schemas are compiled and the DAG (agents,
+    execution plan, I/O pool) is built once; each run() only executes nodes.
+    Runs are serialized because they share the output directory.
+
+    By default each run writes to <output_dir>/runs/<run_id>/ (passed to the
+    writer through state.output_dir) and is published by swapping the CURRENT
+    pointer only after it succeeded (see RunStore); failed runs are discarded.
+    run_scoped=False writes straight to output_dir and leaves a published
+    CURRENT alone, so readers of the current run are not affected.
+    """
+
+    def __init__(self, output_dir: str = "outputs", force_revalidate: bool = False, io_workers: int = 4,
+                 run_scoped: bool = True, keep_runs: int = 5, validation_mode: str = "full",
+                 sample_rate: float = 0.01, detect_near_duplicates: bool = False,
+                 cache_dir: Optional[str] = None):
+        REGISTRY.preload()
+        self.output_dir = output_dir
+        self.run_scoped = run_scoped
+        self.runs = RunStore(output_dir, keep=keep_runs)
+        self.io_executor = IoExecutor(max_workers=io_workers)
+        self.dag = build_dag(output_dir=output_dir, force_revalidate=force_revalidate,
+                             io_executor=self.io_executor, validation_mode=validation_mode,
+                             sample_rate=sample_rate, cache_dir=cache_dir,
+                             # One detector per Pipeline: products from earlier runs count as ingested
+                             near_duplicates=NearDuplicateDetector() if detect_near_duplicates else None)
+        self._lock = threading.Lock()
+
+    def run(self, raw_product: Optional[Dict[str, Any]] = None,
+            input_path: str = DEFAULT_INPUT_PATH, on_event: Optional[EventListener] = None,
+            out: Optional[TextIO] = None) -> PipelineState:
+        """
+        on_event receives per-node progress events (see NodeEvent); progress
+        lines go to out (default sys.stdout), so callers on worker threads can
+        capture them without redirecting the process-wide stdout.
+        """
+        if raw_product is None:
+            raw_product = load_input_data(input_path)
+        state = PipelineState(raw_product=raw_product, schema_paths=dict(SCHEMA_PATHS))
+        with self._lock:
+            if not self.run_scoped:
+                return self.dag.run(state, on_event=on_event, out=out)
+
+            run_id, state.output_dir = self.runs.create_run()
+            try:
+                state = self.dag.run(state, on_event=on_event, out=out)
+                if state.validation_report and not state.validation_report.get("passed"):
+                    raise RuntimeError(f"Run {run_id} failed validation; not published")
+            except BaseException:
+                self.runs.discard(run_id)
+                raise
+            self.runs.publish(run_id)
+            return state
+
+    def close(self):
+        self.io_executor.shutdown()
+
+_PIPELINES: Dict[tuple, Pipeline] = {}
+_PIPELINES_LOCK = threading.Lock()
+
+def get_pipeline(**options: Any) -> Pipeline:
+    """Process-wide Pipeline per set of constructor options (built on first use)."""
+    key = tuple(sorted(options.items()))
+    with _PIPELINES_LOCK:
+        if key not in _PIPELINES:
+            _PIPELINES[key] = Pipeline(**options)
+        return _PIPELINES[key]
@@ -6,11 +6,15 @@ from src.models.product_b import ProductBData
 @dataclass
 class CategorizedQuestions:
     items: List[Dict[str, str]] = field(default_factory=list)
+    # Parallel to items: stable question IDs (shared-bank IDs for product-independent questions)
+    ids: List[str] = field(default_factory=list)
 
 @dataclass
 class PipelineState:
     raw_product: Optional[Dict[str, Any]] = None
     product: Optional[ProductData] = None
+    # Product ID of an already-ingested near-duplicate (set at parse when detection is enabled)
+    near_duplicate_of: Optional[str] = None
     questions: Optional[CategorizedQuestions] = None
     product_b: Optional[ProductBData] = None
     
@@ -19,8 +23,18 @@ class PipelineState:
     product_page_draft: Optional[Dict[str, Any]] = None
     comparison_draft: Optional[Dict[str, Any]] = None
     
+    # Assembled, schema-shaped pages (keyed like output_paths)
+    assembled_pages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Their exact output bytes, encoded once from the drafts (hashed by the validator, written by the writer)
+    encoded_pages: Dict[str, bytes] = field(default_factory=dict)
+    
+    # Directory the writer targets for this run (None: the writer's own output_dir)
+    output_dir: Optional[str] = None
+
     # Final paths
     output_paths: Dict[str, str] = field(default_factory=dict)
+    # sha256 of the exact bytes written per output key
+    output_hashes: Dict[str, str] = field(default_factory=dict)
     schema_paths: Dict[str, str] = field(default_factory=dict)
     
     # Validation
@@ -0,0 +1,125 @@
+import itertools
+import os
+import threading
+from typing import Iterable, List, Set, Tuple
+
+FSYNC_POLICIES = ("none", "file", "batch")
+
+class AtomicWriter:
+    """
+    Writes whole payloads to a temp file in the target directory and renames
+    it into place, so readers never see a torn file.
+
+    write() only stages the temp file; flush() renames every staged file into
+    place and discard() drops them, so a batch that fails part-way publishes
+    nothing, whatever the fsync policy.
+
+    fsync policy:
+      - "none":  no fsync (atomic against process crashes, not power loss)
+      - "file":  fsync each file as it is written; flush() fsyncs each touched
+                 directory after the renames
+      - "batch": flush() fsyncs all staged files, renames them and fsyncs each
+                 touched directory once
+    Directories are created once per writer, not once per file; a cached
+    directory that has since been removed is recreated on the next write.
+    Safe to call from several threads (e.g. IoExecutor workers).
+    """
+
+    def __init__(self, fsync: str = "none"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync='{fsync}'. Allowed: {list(FSYNC_POLICIES)}")
+        self.fsync = fsync
+        self._known_dirs: Set[str] = set()
+        self._staged: List[Tuple[str, str]] = []  # (tmp_path, final_path)
+        self._counter = itertools.count()
+        self._lock = threading.Lock()  # guards _known_dirs and _staged
+
+    def _ensure_dir(self, directory: str):
+        with self._lock:
+            if directory in self._known_dirs:
+                return
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._known_dirs.add(directory)
+
+    def _forget_dir(self, directory: str):
+        with self._lock:
+            self._known_dirs.discard(directory)
+
+    def _tmp_path(self, path: str) -> str:
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f".{name}.{os.getpid()}.{next(self._counter)}.tmp")
+
+    @staticmethod
+    def _fsync_dir(directory: str):
+        # Directory fsync is POSIX-only; skip where directories cannot be opened
+        try:
+            fd = os.open(directory or ".", os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _write_tmp(self, tmp_path: str, payload: bytes):
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            if self.fsync == "file":
+                f.flush()
+                os.fsync(f.fileno())
+
+    def write(self, path: str, payload: bytes):
+        directory = os.path.dirname(path) or "."
+        self._ensure_dir(directory)
+        tmp_path = self._tmp_path(path)
+        try:
+            try:
+                self._write_tmp(tmp_path, payload)
+            except FileNotFoundError:
+                # Cached directory was removed since (e.g. a pruned run): recreate once
+                self._forget_dir(directory)
+                self._ensure_dir(directory)
+                self._write_tmp(tmp_path, payload)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._staged.append((tmp_path, path))
+
+    def write_many(self, items: Iterable[Tuple[str, bytes]]):
+        for path, payload in items:
+            self.write(path, payload)
+        self.flush()
+
+    def flush(self):
+        """Publishes staged files; a no-op when nothing is staged."""
+        with self._lock:
+            staged, self._staged = self._staged, []
+        if not staged:
+            return
+        if self.fsync == "batch":
+            for tmp_path, _ in staged:
+                fd = os.open(tmp_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        for tmp_path, path in staged:
+            os.replace(tmp_path, path)
+        if self.fsync == "none":
+            return
+        for directory in sorted({os.path.dirname(path) for _, path in staged}):
+            self._fsync_dir(directory)
+
+    def discard(self):
+        """Drops staged files without publishing them."""
+        with self._lock:
+            staged, self._staged = self._staged, []
+        for tmp_path, _ in staged:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
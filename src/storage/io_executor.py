@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, List, Set
+
+class IoExecutor:
+    """
+    Bounded thread pool for file reads/writes, shared by JsonWriterAgent and
+    ValidatorAgent so I/O overlaps with serialization and validation.
+
+    At most `max_pending` jobs are queued or running; submit() blocks until a
+    slot frees up (backpressure). Each job has an owner (typically a product
+    ID or output key); failures are collected per owner and returned by
+    drain(), which waits for every outstanding job. Call drain() at the end of
+    a pipeline stage and shutdown() when the pipeline is done.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        if max_workers <= 0 or max_pending <= 0:
+            raise ValueError("max_workers and max_pending must be positive")
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="io")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending: Set[Future] = set()
+        self._errors: Dict[Hashable, List[BaseException]] = {}
+
+    def submit(self, owner: Hashable, fn: Callable[..., Any], *args: Any) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda f: self._done(owner, f))
+        return future
+
+    def _done(self, owner: Hashable, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+            if not future.cancelled() and future.exception() is not None:
+                self._errors.setdefault(owner, []).append(future.exception())
+        self._slots.release()
+
+    def drain(self) -> Dict[Hashable, List[BaseException]]:
+        """Waits for all submitted jobs; returns (and clears) {owner: [exceptions]}."""
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            wait(pending)
+        with self._lock:
+            errors, self._errors = self._errors, {}
+        return errors
+
+    def shutdown(self):
+        self.drain()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+def format_io_errors(errors: Dict[Hashable, List[BaseException]]) -> List[str]:
+    return [f"{owner}: {exc}" for owner, excs in errors.items() for exc in excs]
@@ -0,0 +1,120 @@
+from json.encoder import encode_basestring  # C-accelerated when available
+from typing import Any, Callable, Sequence, Set, Tuple
+
+# json.dumps falls back to its pure-Python, generator-based encoder whenever
+# indent is set. This encoder returns the same text as
+# json.dumps(value, indent=2, ensure_ascii=False) from a recursive walk that
+# joins lists of strings and escapes with the C string encoder.
+# Cycles are not tracked while encoding (that costs a set lookup per
+# container); a self-referencing value recurses until RecursionError, which
+# the entry points turn into json.dumps' ValueError after an iterative check.
+
+_INDENTS = ["\n" + "  " * level for level in range(32)]
+
+def _newline(level: int) -> str:
+    return _INDENTS[level] if level < len(_INDENTS) else "\n" + "  " * level
+
+def _float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+def _key(key: Any) -> str:
+    # Same key coercion as json.dumps
+    if isinstance(key, str):
+        return encode_basestring(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return encode_basestring(int.__repr__(key))
+    if isinstance(key, float):
+        return encode_basestring(_float(key))
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+def _item(value: Any, level: int) -> str:
+    # Strings dominate generated pages; skip the call for them
+    return encode_basestring(value) if type(value) is str else encode_value(value, level)
+
+def encode_object(items, level: int) -> str:
+    """Encodes (key, value) pairs as a JSON object nested `level` deep."""
+    inner = _newline(level + 1)
+    body = ("," + inner).join([_key(k) + ": " + _item(v, level + 1) for k, v in items])
+    if not body:
+        return "{}"
+    return "{" + inner + body + _newline(level) + "}"
+
+def encode_value(value: Any, level: int = 0) -> str:
+    t = type(value)
+    if t is str:
+        return encode_basestring(value)
+    if t is dict:
+        return encode_object(value.items(), level)
+    if t is list or t is tuple:
+        if not value:
+            return "[]"
+        inner = _newline(level + 1)
+        return "[" + inner + ("," + inner).join([_item(v, level + 1) for v in value]) + _newline(level) + "]"
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    # Subclasses are encoded like json.dumps does: by their base type
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _float(value)
+    if isinstance(value, dict):
+        return encode_object(value.items(), level)
+    if isinstance(value, (list, tuple)):
+        return encode_value(list(value), level)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _has_cycle(root: Any) -> bool:
+    """Iterative (recursion-free) check for a container that contains itself."""
+    active: Set[int] = set()  # containers on the current path
+    stack = [(root, False)]
+    while stack:
+        node, leaving = stack.pop()
+        if leaving:
+            active.discard(id(node))
+            continue
+        if isinstance(node, dict):
+            children = list(node.values())
+        elif isinstance(node, (list, tuple)):
+            children = list(node)
+        else:
+            continue
+        if id(node) in active:
+            return True
+        active.add(id(node))
+        stack.append((node, True))
+        stack.extend((child, False) for child in reversed(children))
+    return False
+
+def _guarded(encode: Callable[[], str], root: Any) -> str:
+    try:
+        return encode()
+    except RecursionError:
+        if _has_cycle(root):
+            raise ValueError("Circular reference detected") from None
+        raise
+
+def encode_json(value: Any) -> str:
+    """Equivalent to json.dumps(value, indent=2, ensure_ascii=False)."""
+    return _guarded(lambda: encode_value(value, 0), value)
+
+def encode_items(items: Sequence[Tuple[Any, Any]]) -> str:
+    """Top-level JSON object from (key, value) pairs, with the same cycle check as encode_json."""
+    return _guarded(lambda: encode_object(items, 0), [value for _, value in items])
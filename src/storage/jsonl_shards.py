@@ -0,0 +1,192 @@
+import glob
+import gzip
+import json
+import lzma
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# compression -> shard file suffix
+COMPRESSIONS = {None: ".jsonl", "gzip": ".jsonl.gz", "lzma": ".jsonl.xz"}
+INDEX_SUFFIX = ".idx"
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "lzma":
+        return lzma.compress(data)
+    return data
+
+def _decompress(data: bytes, path: str) -> bytes:
+    if path.endswith(".gz"):
+        return gzip.decompress(data)
+    if path.endswith(".xz"):
+        return lzma.decompress(data)
+    return data
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """Compact single-line JSON."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def read_record(shard_path: str, offset: int, length: int, line: int) -> Dict[str, Any]:
+    """Reads one record given its index entry, decompressing only its block."""
+    with open(shard_path, "rb") as f:
+        f.seek(offset)
+        data = _decompress(f.read(length), shard_path)
+    return json.loads(data.split(b"\n")[line])
+
+class ShardedJsonlWriter:
+    """
+    Appends compact JSON records to rotating shard files.
+
+    A shard is closed after `products_per_shard` records or once it reaches
+    `max_shard_bytes` (uncompressed). With compression, records are written
+    in blocks of `block_records`, each an independent gzip member / xz stream,
+    so the shard is still a valid .gz/.xz file and any block can be
+    decompressed alone. Every shard gets a sidecar `<shard>.idx` (JSON lines:
+    id, offset, length, line) for random access. Shards and indexes are
+    written under temp names and renamed on close.
+    """
+
+    def __init__(self, output_dir: str, prefix: str = "shard", products_per_shard: int = 1000,
+                 max_shard_bytes: int = 64 * 1024 * 1024, compression: Optional[str] = None,
+                 block_records: int = 64):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Invalid compression='{compression}'. Allowed: {list(COMPRESSIONS)}")
+        if products_per_shard <= 0 or block_records <= 0:
+            raise ValueError("products_per_shard and block_records must be positive")
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.products_per_shard = products_per_shard
+        self.max_shard_bytes = max_shard_bytes
+        self.compression = compression
+        self.block_records = block_records if compression else 1
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._next_shard = self._first_free_shard()
+        self._file = None
+        self._path = ""
+        self._count = 0
+        self._raw_bytes = 0
+        self._block: List[Tuple[str, bytes]] = []
+        self._index: List[bytes] = []
+        self.shards: List[str] = []
+
+    def _first_free_shard(self) -> int:
+        pattern = re.compile(re.escape(self.prefix) + r"-(\d+)\.jsonl")
+        existing = [int(m.group(1)) for name in os.listdir(self.output_dir)
+                    for m in [pattern.match(name)] if m]
+        return max(existing) + 1 if existing else 0
+
+    def _open_shard(self):
+        name = f"{self.prefix}-{self._next_shard:05d}{COMPRESSIONS[self.compression]}"
+        self._next_shard += 1
+        self._path = os.path.join(self.output_dir, name)
+        self._file = open(self._path + ".tmp", "wb")
+        self._count = 0
+        self._raw_bytes = 0
+        self._index = []
+
+    def _flush_block(self):
+        if not self._block:
+            return
+        offset = self._file.tell()
+        payload = _compress(b"".join(line for _, line in self._block), self.compression)
+        self._file.write(payload)
+        for line_no, (product_id, line) in enumerate(self._block):
+            length = len(payload) if self.compression else len(line)
+            self._index.append(encode_record({"id": product_id, "offset": offset, "length": length, "line": line_no}))
+        self._block = []
+
+    def _close_shard(self):
+        if self._file is None:
+            return
+        self._flush_block()
+        self._file.close()
+        self._file = None
+        os.replace(self._path + ".tmp", self._path)
+        index_path = self._path + INDEX_SUFFIX
+        with open(index_path + ".tmp", "wb") as f:
+            f.write(b"".join(self._index))
+        os.replace(index_path + ".tmp", index_path)
+        self.shards.append(self._path)
+
+    def append(self, product_id: str, record: Dict[str, Any]):
+        line = encode_record(dict(record, product_id=product_id))
+        if self._file is None:
+            self._open_shard()
+        elif self._count >= self.products_per_shard or self._raw_bytes + len(line) > self.max_shard_bytes:
+            self._close_shard()
+            self._open_shard()
+        self._block.append((product_id, line))
+        self._count += 1
+        self._raw_bytes += len(line)
+        if len(self._block) >= self.block_records:
+            self._flush_block()
+
+    @property
+    def open_shard(self) -> Optional[str]:
+        """Path the open shard will be published under on close (None if no shard is open)."""
+        return self._path if self._file is not None else None
+
+    def close(self) -> List[str]:
+        self._close_shard()
+        return self.shards
+
+    def abort(self):
+        """Drops the open shard without publishing it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self._path + ".tmp")
+        self._block = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+class ShardedJsonlReader:
+    """Random access by product ID over shards written by ShardedJsonlWriter (later shards win)."""
+
+    def __init__(self, output_dir: str, prefix: str = "shard"):
+        self.output_dir = output_dir
+        self._index: Dict[str, Tuple[str, int, int, int]] = {}
+        for index_path in sorted(glob.glob(os.path.join(output_dir, f"{prefix}-*.jsonl*{INDEX_SUFFIX}"))):
+            shard_path = index_path[:-len(INDEX_SUFFIX)]
+            with open(index_path, "rb") as f:
+                for raw in f:
+                    entry = json.loads(raw)
+                    self._index[entry["id"]] = (shard_path, entry["offset"], entry["length"], entry["line"])
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, product_id: str) -> bool:
+        return product_id in self._index
+
+    def ids(self) -> List[str]:
+        return list(self._index)
+
+    def locate(self, product_id: str) -> Tuple[str, int, int, int]:
+        """(shard_path, offset, length, line) of the product's record."""
+        try:
+            return self._index[product_id]
+        except KeyError:
+            raise KeyError(f"Product not found in shards: {product_id}")
+
+    def get(self, product_id: str) -> Dict[str, Any]:
+        return read_record(*self.locate(product_id))
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Streams every record in shard order (superseded copies of a product included)."""
+        shard_paths = sorted({entry[0] for entry in self._index.values()})
+        for shard_path in shard_paths:
+            opener = gzip.open if shard_path.endswith(".gz") else lzma.open if shard_path.endswith(".xz") else open
+            with opener(shard_path, "rb") as f:
+                for raw in f:
+                    yield json.loads(raw)
@@ -0,0 +1,58 @@
+import json
+import os
+from typing import Dict, Optional
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+class OutputManifest:
+    """
+    Per-directory record of output content hashes (usable as ETags).
+    Paths are stored relative to the output directory with '/' separators.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.files: Dict[str, Dict[str, object]] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """A missing, corrupt or stale manifest means every file is rewritten."""
+        self.files, self.dirty = {}, False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == MANIFEST_VERSION:
+            self.files = dict(payload.get("files", {}))
+
+    def relpath(self, path: str) -> str:
+        return os.path.relpath(path, self.output_dir).replace(os.sep, "/")
+
+    def etag(self, path: str) -> Optional[str]:
+        entry = self.files.get(self.relpath(path))
+        return entry["sha256"] if entry else None
+
+    def is_current(self, path: str, sha256: str) -> bool:
+        """True when the manifest has this hash and the file on disk still has the recorded size."""
+        entry = self.files.get(self.relpath(path))
+        if not entry or entry.get("sha256") != sha256:
+            return False
+        try:
+            return os.path.getsize(path) == entry.get("size")
+        except OSError:
+            return False
+
+    def record(self, path: str, sha256: str, size: int):
+        rel = self.relpath(path)
+        entry = {"sha256": sha256, "size": size}
+        if self.files.get(rel) != entry:
+            self.files[rel] = entry
+            self.dirty = True
+
+    def to_bytes(self) -> bytes:
+        payload = {"version": MANIFEST_VERSION, "files": dict(sorted(self.files.items()))}
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,142 @@
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from src.storage.atomic_writer import AtomicWriter
+
+RUNS_DIR = "runs"
+POINTER_NAME = "CURRENT"  # authoritative pointer: a file holding the current run ID
+LINK_NAME = "current"  # convenience symlink -> runs/<run_id>, where the platform allows it
+
+class RunStore:
+    """
+    Run-scoped outputs under <root>/runs/<run_id>/ with an atomically swapped
+    "current" pointer.
+
+    A run writes into its own directory; publish() then replaces <root>/CURRENT
+    (temp file + rename) so readers switch from one complete run to the next
+    and never see a partly written one. Rollback is just another pointer swap.
+    Older runs beyond `keep` are pruned; the current run is never removed.
+    Without a pointer, readers fall back to <root> itself (the legacy layout).
+    """
+
+    def __init__(self, root: str = "outputs", keep: int = 5):
+        if keep <= 0:
+            raise ValueError("keep must be positive")
+        self.root = root
+        self.keep = keep
+        self.runs_dir = os.path.join(root, RUNS_DIR)
+        self.pointer_path = os.path.join(root, POINTER_NAME)
+
+    def run_dir(self, run_id: str) -> str:
+        return os.path.join(self.runs_dir, run_id)
+
+    def create_run(self, seed: bool = True) -> Tuple[str, str]:
+        """
+        Creates a directory for a new run; returns (run_id, path). IDs sort by creation time.
+        With `seed`, the directory starts as a copy of the current run (see seed()).
+        """
+        os.makedirs(self.runs_dir, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        for attempt in range(100):
+            run_id = stamp if attempt == 0 else f"{stamp}-{attempt}"
+            try:
+                os.mkdir(self.run_dir(run_id))
+            except FileExistsError:
+                continue
+            if seed:
+                self.seed(run_id)
+            return run_id, self.run_dir(run_id)
+        raise RuntimeError(f"Could not allocate a run directory under {self.runs_dir}")
+
+    def seed(self, run_id: str) -> List[str]:
+        """
+        Fills run_id with the current run's files (manifest.json included) so the
+        writer's skip-unchanged check has something to match. Files are hardlinked
+        where possible, else copied; writers replace files by rename, so a changed
+        output never touches the published run's copy. Returns the seeded names.
+        """
+        source = self.current()
+        if source is None or source == run_id:
+            return []
+        source_dir, target_dir = self.run_dir(source), self.run_dir(run_id)
+        seeded = []
+        for name in sorted(os.listdir(source_dir)):
+            src = os.path.join(source_dir, name)
+            if not os.path.isfile(src) or os.path.islink(src):
+                continue
+            dst = os.path.join(target_dir, name)
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+            seeded.append(name)
+        return seeded
+
+    def runs(self) -> List[str]:
+        """Run IDs, oldest first."""
+        if not os.path.isdir(self.runs_dir):
+            return []
+        return sorted(name for name in os.listdir(self.runs_dir) if os.path.isdir(self.run_dir(name)))
+
+    def current(self) -> Optional[str]:
+        try:
+            with open(self.pointer_path, "r", encoding="utf-8") as f:
+                run_id = f.read().strip()
+        except OSError:
+            return None
+        return run_id if run_id and os.path.isdir(self.run_dir(run_id)) else None
+
+    def current_dir(self) -> str:
+        run_id = self.current()
+        return self.run_dir(run_id) if run_id else self.root
+
+    def _swap(self, run_id: str):
+        if not os.path.isdir(self.run_dir(run_id)):
+            raise ValueError(f"Unknown run: {run_id}")
+        AtomicWriter(fsync="file").write_many([(self.pointer_path, (run_id + "\n").encode("utf-8"))])
+        link_path = os.path.join(self.root, LINK_NAME)
+        tmp_link = f"{link_path}.{os.getpid()}.tmp"
+        try:
+            os.symlink(os.path.join(RUNS_DIR, run_id), tmp_link)
+            os.replace(tmp_link, link_path)
+        except OSError:
+            # Symlinks are optional; CURRENT is what readers use
+            if os.path.lexists(tmp_link):
+                os.remove(tmp_link)
+
+    def publish(self, run_id: str) -> List[str]:
+        """Makes run_id current, then prunes old runs; returns the pruned run IDs."""
+        self._swap(run_id)
+        return self.prune()
+
+    def rollback(self, run_id: Optional[str] = None) -> str:
+        """Points CURRENT at run_id, or at the run before the current one."""
+        if run_id is None:
+            runs = self.runs()
+            current = self.current()
+            older = runs[:runs.index(current)] if current in runs else []
+            if not older:
+                raise ValueError("No earlier run to roll back to")
+            run_id = older[-1]
+        self._swap(run_id)
+        return run_id
+
+    def prune(self, keep: Optional[int] = None) -> List[str]:
+        keep = self.keep if keep is None else keep
+        current = self.current()
+        old = [run_id for run_id in self.runs()[:-keep] if run_id != current]
+        for run_id in old:
+            shutil.rmtree(self.run_dir(run_id), ignore_errors=True)
+        return old
+
+    def discard(self, run_id: str):
+        """Removes an unpublished run (e.g. one that failed validation)."""
+        if run_id == self.current():
+            raise ValueError(f"Refusing to discard the current run: {run_id}")
+        shutil.rmtree(self.run_dir(run_id), ignore_errors=True)
+
+def resolve_output_dir(root: str = "outputs") -> str:
+    """Directory readers should load outputs from: the current run, or root itself."""
+    return RunStore(root).current_dir()
@@ -0,0 +1,115 @@
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS outputs (
+    product_id   TEXT NOT NULL,
+    output_type  TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    body         TEXT NOT NULL,
+    PRIMARY KEY (product_id, output_type)
+);
+CREATE INDEX IF NOT EXISTS idx_outputs_type ON outputs (output_type);
+CREATE INDEX IF NOT EXISTS idx_outputs_hash ON outputs (content_hash);
+"""
+
+# Unchanged rows (same hash) are left alone, so re-runs cost no page writes
+UPSERT_SQL = """
+INSERT INTO outputs (product_id, output_type, content_hash, body) VALUES (?, ?, ?, ?)
+ON CONFLICT (product_id, output_type) DO UPDATE SET
+    content_hash = excluded.content_hash, body = excluded.body
+WHERE outputs.content_hash != excluded.content_hash
+"""
+
+Row = Tuple[str, str, str, str]  # (product_id, output_type, content_hash, body)
+
+class SqliteOutputStore:
+    """
+    SQLite store for generated outputs, one row per (product_id, output_type).
+
+    Opened in WAL mode so readers (viewer, downstream jobs) never block the
+    writer. Rows are written with one prepared statement in batched
+    transactions of `batch_size`. The primary key indexes product_id; extra
+    indexes cover output_type and content_hash.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA_SQL)
+        self._pending: List[Row] = []
+        self.changed = 0
+
+    # --- writes ---
+
+    def put(self, product_id: str, output_type: str, content_hash: str, body: str):
+        self._pending.append((product_id, output_type, content_hash, body))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def put_many(self, rows: Iterable[Row]):
+        for row in rows:
+            self.put(*row)
+
+    def flush(self):
+        if not self._pending:
+            return
+        before = self._conn.total_changes
+        with self._conn:  # one transaction per batch
+            self._conn.executemany(UPSERT_SQL, self._pending)
+        self.changed += self._conn.total_changes - before
+        self._pending = []
+
+    def discard(self):
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.discard()
+        self.close()
+
+    # --- reads ---
+
+    def get(self, product_id: str, output_type: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT body FROM outputs WHERE product_id = ? AND output_type = ?",
+                                 (product_id, output_type)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_product(self, product_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn.execute("SELECT output_type, body FROM outputs WHERE product_id = ?", (product_id,))
+        return {output_type: json.loads(body) for output_type, body in rows}
+
+    def etag(self, product_id: str, output_type: str) -> Optional[str]:
+        row = self._conn.execute("SELECT content_hash FROM outputs WHERE product_id = ? AND output_type = ?",
+                                 (product_id, output_type)).fetchone()
+        return row[0] if row else None
+
+    def product_ids(self, limit: Optional[int] = None, offset: int = 0) -> List[str]:
+        rows = self._conn.execute("SELECT DISTINCT product_id FROM outputs ORDER BY product_id LIMIT ? OFFSET ?",
+                                  (-1 if limit is None else limit, offset))
+        return [r[0] for r in rows]
+
+    def find_by_hash(self, content_hash: str) -> List[Tuple[str, str]]:
+        rows = self._conn.execute("SELECT product_id, output_type FROM outputs WHERE content_hash = ?",
+                                  (content_hash,))
+        return [tuple(r) for r in rows]
+
+    def count(self, output_type: Optional[str] = None) -> int:
+        if output_type is None:
+            return self._conn.execute("SELECT COUNT(*) FROM outputs").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM outputs WHERE output_type = ?", (output_type,)).fetchone()[0]
@@ -0,0 +1,96 @@
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+from src.validators.fact_guard import Violation, PAGE_CHECKS
+
+class Vocabulary:
+    """Interns ingredient/benefit strings to small ints shared across the catalog."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        idx = self._ids.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._ids[name] = idx
+            self._names.append(name)
+        return idx
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Id of a known string; unknown strings are not added."""
+        return self._ids.get(name)
+
+    def names(self, ids: Iterable[int]) -> List[str]:
+        return sorted(self._names[i] for i in ids)
+
+class ProductFacts:
+    """Per-product allowlists as int sets over a shared Vocabulary."""
+    __slots__ = ("vocab", "ingredients", "benefits", "price", "concentration")
+
+    def __init__(self, vocab: Vocabulary, ingredients: FrozenSet[int], benefits: FrozenSet[int],
+                 price: int, concentration: str):
+        self.vocab = vocab
+        self.ingredients = ingredients
+        self.benefits = benefits
+        self.price = price
+        self.concentration = concentration
+
+    def ingredient_allowed(self, item: str) -> bool:
+        idx = self.vocab.lookup(item)
+        return idx is not None and idx in self.ingredients
+
+    def benefit_allowed(self, item: str) -> bool:
+        idx = self.vocab.lookup(item)
+        return idx is not None and idx in self.benefits
+
+    # Only called when a violation message is actually formatted
+    def ingredient_names(self) -> List[str]:
+        return self.vocab.names(self.ingredients)
+
+    def benefit_names(self) -> List[str]:
+        return self.vocab.names(self.benefits)
+
+class BatchFactGuard:
+    """
+    Catalog-scale FactGuard: validates many products' pages against one
+    interned vocabulary. Products with identical facts share one ProductFacts,
+    and violation messages are formatted lazily (str(violation)).
+    """
+
+    def __init__(self, vocab: Optional[Vocabulary] = None):
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self._facts: Dict[Tuple, ProductFacts] = {}
+
+    def facts_for(self, product: Any) -> ProductFacts:
+        ingredients = frozenset(self.vocab.intern(x) for x in product.key_ingredients)
+        benefits = frozenset(self.vocab.intern(x) for x in product.benefits)
+        key = (ingredients, benefits, product.price_inr, product.concentration)
+        facts = self._facts.get(key)
+        if facts is None:
+            facts = ProductFacts(self.vocab, ingredients, benefits, product.price_inr, product.concentration)
+            self._facts[key] = facts
+        return facts
+
+    def validate(self, product: Any, pages: Dict[str, dict]) -> List[Violation]:
+        facts = self.facts_for(product)
+        violations: List[Violation] = []
+        for key, check in PAGE_CHECKS.items():
+            if key in pages:
+                violations.extend(check(facts, pages[key]))
+        return violations
+
+    def validate_many(self, entries: Iterable[Tuple[Hashable, Any, Dict[str, dict]]]) -> Dict[Hashable, List[Violation]]:
+        """
+        entries: (product_id, product, {output_key: page}).
+        Returns only the products with violations, in input order.
+        """
+        failures: Dict[Hashable, List[Violation]] = {}
+        for product_id, product, pages in entries:
+            violations = self.validate(product, pages)
+            if violations:
+                failures[product_id] = violations
+        return failures
@@ -1,12 +1,158 @@
-from typing import Set, List, Any
+import re
+from typing import Set, List, Any, Callable, Iterable, Iterator
+
+# One precompiled scanner for every FAQ marker FactGuard cares about.
+# The markers cannot overlap each other, so a single finditer sees them all.
+_FAQ_MARKERS = re.compile(r"(?P<placeholder>(?i:placeholder))|(?P<rupee>₹)|(?P<percent>%)|(?P<ingredients>Key ingredients:)|(?P<benefits>Benefits:)")
+
+# Bump whenever a check changes, so previously proven outputs are re-validated
+FACT_GUARD_VERSION = 1
+
+_SUBSET = "FactGuard Failure [{}]: '{}' is not a known fact. Allowed: {}"
+_EXACT = "FactGuard Failure [{}]: Value '{}' does not match expected '{}'"
+
+class Violation:
+    """
+    A FactGuard finding whose message is only formatted when needed.
+    Callable args (e.g. the sorted allowed list) are evaluated lazily.
+    """
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, *args: Any):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.template.format(*[a() if callable(a) else a for a in self.args])
+
+    def __repr__(self) -> str:
+        return f"Violation({str(self)!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Violation):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+def subset_violations(items: Iterable[str], is_allowed: Callable[[str], bool],
+                      allowed_names: Callable[[], List[str]], context: str) -> Iterator[Violation]:
+    for item in items:
+        if not is_allowed(item):
+            yield Violation(_SUBSET, context, item, allowed_names)
+
+def product_page_violations(facts: Any, data: dict) -> Iterator[Violation]:
+    """`facts` provides ingredient_allowed/benefit_allowed, *_names and price (see FactGuard)."""
+    # 1. Details - Ingredients
+    if "details" in data and "ingredients" in data["details"]:
+        yield from subset_violations(data["details"]["ingredients"], facts.ingredient_allowed,
+                                     facts.ingredient_names, "ProductPage.ingredients")
+        
+    # 2. Details - Benefits
+    if "details" in data and "benefits" in data["details"]:
+        yield from subset_violations(data["details"]["benefits"], facts.benefit_allowed,
+                                     facts.benefit_names, "ProductPage.benefits")
+        
+    # 3. Pricing
+    if "pricing" in data and "amount" in data["pricing"]:
+        if data["pricing"]["amount"] != facts.price:
+            yield Violation(_EXACT, "ProductPage.price", data["pricing"]["amount"], facts.price)
+
+def comparison_page_violations(facts: Any, data: dict) -> Iterator[Violation]:
+    # Scan comparison rows
+    if "comparison" in data:
+        for row in data["comparison"]:
+            attr = row.get("attribute")
+            val_a = row.get("product_a_value")
+            
+            if attr == "Key Ingredients" and isinstance(val_a, list):
+                yield from subset_violations(val_a, facts.ingredient_allowed, facts.ingredient_names, "Comparison.ingredients")
+            elif attr == "Benefits" and isinstance(val_a, list):
+                yield from subset_violations(val_a, facts.benefit_allowed, facts.benefit_names, "Comparison.benefits")
+            elif attr == "Price (INR)" and val_a != facts.price:
+                yield Violation(_EXACT, "Comparison.price", val_a, facts.price)
+
+def _first_segment(ans: str, starts: List[int], ends: List[int]) -> str:
+    """Equivalent to ans.split(marker)[1]: text after the first marker up to the next one."""
+    stop = starts[1] if len(starts) > 1 else len(ans)
+    return ans[ends[0]:stop]
+
+def faq_page_violations(facts: Any, data: dict) -> Iterator[Violation]:
+    # 3. FAQ Validation
+    # Check that answers don't hallucinate facts or prices
+    if "faqs" not in data:
+        return
+    allowed_price = str(facts.price)
+    concentration = facts.concentration
+    
+    for item in data["faqs"]:
+        ans = item.get("answer", "")
+
+        # Single scan: record which markers appear (and where, for list markers)
+        found = set()
+        ing_starts: List[int] = []
+        ing_ends: List[int] = []
+        ben_starts: List[int] = []
+        ben_ends: List[int] = []
+        for m in _FAQ_MARKERS.finditer(ans):
+            kind = m.lastgroup
+            found.add(kind)
+            if kind == "ingredients":
+                ing_starts.append(m.start())
+                ing_ends.append(m.end())
+            elif kind == "benefits":
+                ben_starts.append(m.start())
+                ben_ends.append(m.end())
+        if not found:
+            continue
+        
+        # 1. No Placeholders
+        if "placeholder" in found:
+            yield Violation("FactGuard Failure [FAQ]: Generated placeholder found in answer.")
+
+        # 2. Strict Price Check
+        if "rupee" in found and allowed_price not in ans:
+            yield Violation("FactGuard Failure [FAQ]: Price mismatch. Answer mentions ₹ but not {}", allowed_price)
+
+        # 3. Ingredient Leakage
+        # Parse out the list part: "Key ingredients: A, B" -> ["A", "B"]
+        if ing_starts:
+            content = _first_segment(ans, ing_starts, ing_ends)
+            for p in (x.strip() for x in content.split(",")):
+                if p and not facts.ingredient_allowed(p):
+                    yield Violation("FactGuard Failure [FAQ]: Ingredient '{}' not in dataset.", p)
+
+        # 4. Benefit Leakage
+        if ben_starts:
+            content = _first_segment(ans, ben_starts, ben_ends)
+            for p in (x.strip() for x in content.split(",")):
+                if p and not facts.benefit_allowed(p):
+                    yield Violation("FactGuard Failure [FAQ]: Benefit '{}' not in dataset.", p)
+
+        # 5. Concentration Check
+        # Strict check: if a percentage is mentioned, it must be the product concentration
+        if "percent" in found and concentration not in ans:
+            yield Violation("FactGuard Failure [FAQ]: Answer mentions % but does not include dataset concentration '{}'", concentration)
+
+# Output key (as in state.output_paths) -> page check
+PAGE_CHECKS = {
+    "faq_draft": faq_page_violations,
+    "product_page_draft": product_page_violations,
+    "comparison_draft": comparison_page_violations,
+}
 
 class FactGuard:
     """
     Deterministic validator to ensure generated outputs only contain 
     facts present in the source dataset.
+
+    By default the first violation raises ValueError. With collect_all=True
+    every violation is recorded instead and returned by the validate_* calls.
     """
     
-    def __init__(self, product_data):
+    def __init__(self, product_data, collect_all: bool = False):
         self.product = product_data
         self.allowed_ingredients = set(product_data.key_ingredients)
         self.allowed_benefits = set(product_data.benefits)
@@ -14,87 +160,44 @@ class FactGuard:
         self.usage_text = product_data.how_to_use
         self.safety_text = product_data.side_effects
         self.price = product_data.price_inr
+        self.concentration = product_data.concentration
+        self.collect_all = collect_all
+        self.violations: List[str] = []
+
+    # Fact lookups used by the shared page checks
+    def ingredient_allowed(self, item: str) -> bool:
+        return item in self.allowed_ingredients
+
+    def benefit_allowed(self, item: str) -> bool:
+        return item in self.allowed_benefits
+
+    def ingredient_names(self) -> List[str]:
+        return sorted(self.allowed_ingredients)
+
+    def benefit_names(self) -> List[str]:
+        return sorted(self.allowed_benefits)
+
+    def _report(self, violations: Iterable[Violation]) -> List[str]:
+        start = len(self.violations)
+        for v in violations:
+            if not self.collect_all:
+                raise ValueError(str(v))
+            self.violations.append(str(v))
+        return self.violations[start:]
     
     def check_subset(self, items: List[str], allowed: Set[str], context: str):
         """Ensures all items in the list are in the allowed set."""
-        for item in items:
-            if item not in allowed:
-                raise ValueError(f"FactGuard Failure [{context}]: '{item}' is not a known fact. Allowed: {sorted(list(allowed))}")
+        self._report(subset_violations(items, allowed.__contains__, lambda: sorted(list(allowed)), context))
 
     def check_exact(self, value: Any, expected: Any, context: str):
         if value != expected:
-            raise ValueError(f"FactGuard Failure [{context}]: Value '{value}' does not match expected '{expected}'")
+            self._report([Violation(_EXACT, context, value, expected)])
 
-    def validate_product_page(self, data: dict):
-        # 1. Details - Ingredients
-        if "details" in data and "ingredients" in data["details"]:
-            self.check_subset(data["details"]["ingredients"], self.allowed_ingredients, "ProductPage.ingredients")
-            
-        # 2. Details - Benefits
-        if "details" in data and "benefits" in data["details"]:
-            self.check_subset(data["details"]["benefits"], self.allowed_benefits, "ProductPage.benefits")
-            
-        # 3. Pricing
-        if "pricing" in data and "amount" in data["pricing"]:
-            self.check_exact(data["pricing"]["amount"], self.price, "ProductPage.price")
-
-    def validate_comparison_page(self, data: dict):
-        # Scan comparison rows
-        if "comparison" in data:
-            for row in data["comparison"]:
-                attr = row.get("attribute")
-                val_a = row.get("product_a_value")
-                
-                if attr == "Key Ingredients" and isinstance(val_a, list):
-                    self.check_subset(val_a, self.allowed_ingredients, "Comparison.ingredients")
-                elif attr == "Benefits" and isinstance(val_a, list):
-                    self.check_subset(val_a, self.allowed_benefits, "Comparison.benefits")
-                elif attr == "Price (INR)":
-                    self.check_exact(val_a, self.price, "Comparison.price")
-
-    def validate_faq_page(self, data: dict):
-        # 3. FAQ Validation
-        # Check that answers don't hallucinate facts or prices
-        if "faqs" in data:
-            allowed_price = str(self.price)
-            
-            for item in data["faqs"]:
-                ans = item.get("answer", "")
-                
-                # Simple boolean checks if specific tokens appear
-                # 1. No Placeholders
-                if "placeholder" in ans.lower():
-                    raise ValueError("FactGuard Failure [FAQ]: Generated placeholder found in answer.")
-
-                # 2. Strict Price Check
-                if "₹" in ans and allowed_price not in ans:
-                     raise ValueError(f"FactGuard Failure [FAQ]: Price mismatch. Answer mentions ₹ but not {allowed_price}")
-
-                # 3. Ingredient Leakage
-                if "Key ingredients:" in ans:
-                    # Parse out the list part: "Key ingredients: A, B" -> ["A", "B"]
-                    try:
-                        content = ans.split("Key ingredients:")[1]
-                        parts = [x.strip() for x in content.split(",") if x.strip()]
-                        # Check if all parts are in allowed ingredients
-                        for p in parts:
-                            if p not in self.allowed_ingredients:
-                                 raise ValueError(f"FactGuard Failure [FAQ]: Ingredient '{p}' not in dataset.")
-                    except IndexError:
-                        pass # Valid answer format might differ slightly, but split should work if phrase present
-
-                # 4. Benefit Leakage
-                if "Benefits:" in ans:
-                    try:
-                        content = ans.split("Benefits:")[1]
-                        parts = [x.strip() for x in content.split(",") if x.strip()]
-                        for p in parts:
-                            if p not in self.allowed_benefits:
-                                 raise ValueError(f"FactGuard Failure [FAQ]: Benefit '{p}' not in dataset.")
-                    except IndexError:
-                        pass
-
-                # 5. Concentration Check
-                if "%" in ans and self.product.concentration not in ans:
-                     # Strict check: if a percentage is mentioned, it must be the product concentration
-                     raise ValueError(f"FactGuard Failure [FAQ]: Answer mentions % but does not include dataset concentration '{self.product.concentration}'")
+    def validate_product_page(self, data: dict) -> List[str]:
+        return self._report(product_page_violations(self, data))
+
+    def validate_comparison_page(self, data: dict) -> List[str]:
+        return self._report(comparison_page_violations(self, data))
+
+    def validate_faq_page(self, data: dict) -> List[str]:
+        return self._report(faq_page_violations(self, data))
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from src.validators.fact_guard import FACT_GUARD_VERSION
+
+LEDGER_VERSION = 1
+LEDGER_FILE_NAME = "validation_ledger.json"
+DEFAULT_LEDGER_PATH = os.path.join(".cache", LEDGER_FILE_NAME)
+
+def content_hash(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+def product_fingerprint(product: Any) -> str:
+    """Hash of every product fact FactGuard may read ("" when there is no product)."""
+    if product is None:
+        return ""
+    return content_hash(product.model_dump_json().encode("utf-8"))
+
+class ValidationLedger:
+    """
+    Persistent record of outputs that already passed validation.
+
+    An entry is keyed by the output's content hash, the schema hash, the
+    product fingerprint and FACT_GUARD_VERSION; if none of these changed the
+    output is already proven and can be skipped.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_LEDGER_PATH, max_entries: int = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(output_hash: str, schema_hash: str, product_fp: str) -> str:
+        return f"{output_hash}:{schema_hash}:{product_fp}:{FACT_GUARD_VERSION}"
+
+    def is_proven(self, key: str) -> bool:
+        return key in self._entries
+
+    def record(self, key: str, label: str):
+        self._entries.pop(key, None)
+        self._entries[key] = {
+            "output": label,
+            "validated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def load(self, path: str):
+        """A missing, corrupt, stale-version or malformed ledger is treated as empty."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != LEDGER_VERSION:
+            return
+        entries = payload.get("entries", {})
+        if not isinstance(entries, dict) or not all(
+                isinstance(key, str) and isinstance(entry, dict) for key, entry in entries.items()):
+            return
+        self._entries = OrderedDict(entries)
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        if not path:
+            raise ValueError("No ledger path configured")
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        # Unique temp file: concurrent savers never write into each other's file
+        fd, tmp_path = tempfile.mkstemp(dir=parent or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": LEDGER_VERSION, "entries": self._entries}, f, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
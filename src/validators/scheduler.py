@@ -0,0 +1,141 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from src.validators.schema_validate import SchemaValidator
+from src.validators.fact_guard import FactGuard, PAGE_CHECKS
+from src.validators.batch_fact_guard import BatchFactGuard
+
+# Error prefixes used by ValidatorAgent for each kind of check
+ERROR_PREFIXES = {
+    "schema": "VALIDATION FATAL",
+    "facts": "CONTENT VIOLATION",
+}
+
+@dataclass
+class ValidationTask:
+    product_id: Hashable
+    output_key: str
+    kind: str  # "schema" | "facts"
+    check: Callable[[], List[str]]  # returns violation messages (empty = pass)
+
+    def execute(self) -> List[str]:
+        try:
+            messages = self.check()
+        except Exception as e:
+            messages = [str(e)]
+        prefix = ERROR_PREFIXES[self.kind]
+        return [f"{prefix}: {m}" for m in messages]
+
+def build_tasks(product_id: Hashable, documents: Dict[str, Any], schema_paths: Dict[str, str],
+                product: Any = None, labels: Optional[Dict[str, str]] = None,
+                batch_guard: Optional[BatchFactGuard] = None) -> List[ValidationTask]:
+    """
+    Schema checks for every document with a schema, then FactGuard checks (if a product is given).
+    With batch_guard, facts come from its shared vocabulary instead of a per-product FactGuard.
+    """
+    labels = labels or {}
+    tasks = []
+    for key, data in documents.items():
+        if key not in schema_paths:
+            continue
+        label = labels.get(key, key)
+        def schema_check(data=data, schema_path=schema_paths[key], label=label):
+            SchemaValidator.validate_instance(data, schema_path, label=label)
+            return []
+        tasks.append(ValidationTask(product_id, key, "schema", schema_check))
+
+    if product is not None:
+        guard = batch_guard.facts_for(product) if batch_guard is not None else FactGuard(product)
+        for key, page_check in PAGE_CHECKS.items():
+            if key in documents:
+                def facts_check(data=documents[key], page_check=page_check):
+                    return [str(v) for v in page_check(guard, data)]
+                tasks.append(ValidationTask(product_id, key, "facts", facts_check))
+    return tasks
+
+class ValidationScheduler:
+    """
+    Runs independent validation tasks on a worker pool and returns results in
+    task order, so reports are deterministic regardless of completion order.
+
+    fail_fast=True cancels outstanding tasks at the first failure and raises
+    RuntimeError with the failing message (lowest task index among failures).
+    """
+
+    def __init__(self, max_workers: int = 4, fail_fast: bool = False):
+        self.max_workers = max_workers
+        self.fail_fast = fail_fast
+
+    def run(self, tasks: List[ValidationTask]) -> List[List[str]]:
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            return self._run_inline(tasks)
+
+        results: List[Optional[List[str]]] = [None] * len(tasks)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(task.execute): idx for idx, task in enumerate(tasks)}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                failed = False
+                for future in done:
+                    results[futures[future]] = future.result()
+                    failed = failed or bool(results[futures[future]])
+                if failed and self.fail_fast:
+                    for future in pending:
+                        future.cancel()
+                    # Let already-running tasks finish so the reported failure is deterministic
+                    for future in wait(pending).done:
+                        if not future.cancelled():
+                            results[futures[future]] = future.result()
+                    break
+
+        if self.fail_fast:
+            self._raise_first(results)
+        return [r or [] for r in results]
+
+    def _run_inline(self, tasks: List[ValidationTask]) -> List[List[str]]:
+        results = []
+        for task in tasks:
+            errors = task.execute()
+            if errors and self.fail_fast:
+                raise RuntimeError(errors[0])
+            results.append(errors)
+        return results
+
+    @staticmethod
+    def _raise_first(results: List[Optional[List[str]]]):
+        for errors in results:
+            if errors:
+                raise RuntimeError(errors[0])
+
+def validate_catalog(entries: Iterable[Tuple[Hashable, Any, Dict[str, Any]]], schema_paths: Dict[str, str],
+                     max_workers: int = 4, fail_fast: bool = False) -> Dict[str, Any]:
+    """
+    Validates many products' pages across a worker pool.
+    entries: (product_id, product, {output_key: page}).
+    Returns a validation_report with per-product results in input order.
+    FactGuard checks share one BatchFactGuard, so products with identical facts
+    share their allowlists.
+    """
+    tasks: List[ValidationTask] = []
+    products: Dict[Hashable, Dict[str, Any]] = {}
+    batch_guard = BatchFactGuard()
+    for product_id, product, pages in entries:
+        products[product_id] = {"passed": True, "errors": []}
+        tasks.extend(build_tasks(product_id, pages, schema_paths, product, batch_guard=batch_guard))
+
+    results = ValidationScheduler(max_workers=max_workers, fail_fast=fail_fast).run(tasks)
+
+    errors = []
+    for task, task_errors in zip(tasks, results):
+        if task_errors:
+            products[task.product_id]["passed"] = False
+            products[task.product_id]["errors"].extend(task_errors)
+            errors.extend(f"[{task.product_id}] {e}" for e in task_errors)
+
+    return {
+        "passed": not errors,
+        "errors": errors,
+        "products": products,
+    }
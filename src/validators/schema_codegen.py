@@ -0,0 +1,171 @@
+import numbers
+from typing import Any, Callable, Dict, List, Optional
+
+# Keywords the generator understands. Anything else makes compile_validator
+# raise UnsupportedSchemaError so callers fall back to Draft202012Validator.
+SUPPORTED_KEYWORDS = {
+    "$schema", "$comment", "title", "description",
+    "type", "properties", "required", "additionalProperties",
+    "items", "minItems", "maxItems", "minLength", "maxLength",
+}
+
+# Mirrors Draft202012Validator's TYPE_CHECKER (bools are not numbers; 1.0 is an integer)
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+class UnsupportedSchemaError(ValueError):
+    pass
+
+class _Emitter:
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._counter = 0
+
+    def var(self) -> str:
+        self._counter += 1
+        return f"v{self._counter}"
+
+    def const(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def fail_if(self, cond: str, indent: int):
+        pad = "    " * indent
+        self.lines.append(f"{pad}if {cond}:")
+        self.lines.append(f"{pad}    return False")
+
+    def emit(self, schema: Any, v: str, indent: int):
+        pad = "    " * indent
+        if schema is True:
+            return
+        if schema is False:
+            self.lines.append(f"{pad}return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"Schema must be an object or boolean, got {type(schema).__name__}")
+        unknown = set(schema) - SUPPORTED_KEYWORDS
+        if unknown:
+            raise UnsupportedSchemaError(f"Unsupported keywords: {sorted(unknown)}")
+
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else list(types)
+            if any(t not in _TYPE_CHECKS for t in types):
+                raise UnsupportedSchemaError(f"Unsupported type: {types}")
+            cond = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+            self.fail_if(f"not ({cond})", indent)
+
+        self._emit_object(schema, v, indent, types)
+        self._emit_array(schema, v, indent, types)
+        self._emit_string(schema, v, indent, types)
+
+    def _guard(self, kind: str, v: str, indent: int, types: Optional[List[str]]) -> int:
+        """Keywords only apply to matching instance types; skip the check when type already pins it."""
+        if types == [kind]:
+            return indent
+        self.lines.append("    " * indent + f"if {_TYPE_CHECKS[kind].format(v=v)}:")
+        return indent + 1
+
+    def _close(self, start: int, indent: int):
+        if len(self.lines) == start + 1 and self.lines[start].rstrip().endswith(":"):
+            self.lines.append("    " * indent + "pass")
+
+    def _emit_object(self, schema: dict, v: str, indent: int, types):
+        props = schema.get("properties", {})
+        required = schema.get("required", [])
+        additional = schema.get("additionalProperties", True)
+        if not props and not required and additional is True:
+            return
+
+        start = len(self.lines)
+        inner = self._guard("object", v, indent, types)
+        for key in required:
+            self.fail_if(f"{key!r} not in {v}", inner)
+
+        if additional is False:
+            self.fail_if(f"not {self.const(frozenset(props))}.issuperset({v})", inner)
+        elif additional is not True:
+            known = self.const(frozenset(props))
+            k, item = self.var(), self.var()
+            self.lines.append("    " * inner + f"for {k}, {item} in {v}.items():")
+            self.lines.append("    " * (inner + 1) + f"if {k} not in {known}:")
+            body = len(self.lines)
+            self.emit(additional, item, inner + 2)
+            if len(self.lines) == body:
+                self.lines.append("    " * (inner + 2) + "pass")
+
+        for key, subschema in props.items():
+            if subschema is True or subschema == {}:
+                continue
+            sub = self.var()
+            if key in required:
+                self.lines.append("    " * inner + f"{sub} = {v}[{key!r}]")
+                self.emit(subschema, sub, inner)
+            else:
+                self.lines.append("    " * inner + f"if {key!r} in {v}:")
+                self.lines.append("    " * (inner + 1) + f"{sub} = {v}[{key!r}]")
+                self.emit(subschema, sub, inner + 1)
+        if inner != indent:
+            self._close(start, inner)
+
+    def _emit_array(self, schema: dict, v: str, indent: int, types):
+        if not any(k in schema for k in ("items", "minItems", "maxItems")):
+            return
+        start = len(self.lines)
+        inner = self._guard("array", v, indent, types)
+        if "minItems" in schema:
+            self.fail_if(f"len({v}) < {int(schema['minItems'])}", inner)
+        if "maxItems" in schema:
+            self.fail_if(f"len({v}) > {int(schema['maxItems'])}", inner)
+        items = schema.get("items", True)
+        if not (items is True or items == {}):
+            item = self.var()
+            self.lines.append("    " * inner + f"for {item} in {v}:")
+            body = len(self.lines)
+            self.emit(items, item, inner + 1)
+            if len(self.lines) == body:
+                self.lines.append("    " * (inner + 1) + "pass")
+        if inner != indent:
+            self._close(start, inner)
+
+    def _emit_string(self, schema: dict, v: str, indent: int, types):
+        if "minLength" not in schema and "maxLength" not in schema:
+            return
+        start = len(self.lines)
+        inner = self._guard("string", v, indent, types)
+        if "minLength" in schema:
+            self.fail_if(f"len({v}) < {int(schema['minLength'])}", inner)
+        if "maxLength" in schema:
+            self.fail_if(f"len({v}) > {int(schema['maxLength'])}", inner)
+        if inner != indent:
+            self._close(start, inner)
+
+def generate_source(schema: Any, name: str = "validate") -> str:
+    """
+    Returns Python source for `def <name>(instance) -> bool` that accepts exactly
+    the instances Draft202012Validator accepts for this schema.
+    """
+    emitter = _Emitter()
+    emitter.emit(schema, "v0", 1)
+    # Constants are key sets; emit them sorted so the source is stable across runs
+    header = [f"{const_name} = frozenset({sorted(value)!r})" for const_name, value in emitter.constants.items()]
+    header.append(f"def {name}(v0):")
+    return "\n".join(header + emitter.lines + ["    return True", ""])
+
+def compile_validator(schema: Any, name: str = "validate") -> Callable[[Any], bool]:
+    """Generates and compiles a specialized validator; raises UnsupportedSchemaError."""
+    source = generate_source(schema, name)
+    namespace: Dict[str, Any] = {"_Number": numbers.Number}
+    exec(compile(source, f"<schema_codegen:{name}>", "exec"), namespace)
+    fn = namespace[name]
+    fn.__source__ = source
+    return fn
@@ -0,0 +1,94 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from jsonschema import Draft202012Validator
+from src.validators.schema_codegen import compile_validator, UnsupportedSchemaError
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schemas")
+
+# Output key -> schema file for each generated page
+SCHEMA_PATHS = {
+    "faq_draft": os.path.join(SCHEMA_DIR, "faq_schema.json"),
+    "product_page_draft": os.path.join(SCHEMA_DIR, "product_page_schema.json"),
+    "comparison_draft": os.path.join(SCHEMA_DIR, "comparison_page_schema.json"),
+}
+
+class _Entry(NamedTuple):
+    stamp: Tuple[int, int]  # (mtime_ns, size)
+    schema: dict
+    validator: Draft202012Validator
+    fast: Optional[Callable[[Any], bool]]
+    sha256: str  # of the raw schema bytes
+
+class SchemaRegistry:
+    """
+    Process-wide cache of compiled schema validators.
+
+    Each schema is loaded, meta-validated (check_schema) and compiled once;
+    the entry is rebuilt only when the file's mtime or size changes. Alongside
+    the generic validator, a code-generated fast validator is built when the
+    schema only uses supported keywords (see schema_codegen).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self.compiles = 0
+
+    def _entry(self, path: str) -> _Entry:
+        abs_path = os.path.abspath(path)
+        try:
+            st = os.stat(abs_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Schema file not found: {path}")
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        entry = self._entries.get(abs_path)
+        if entry is not None and entry.stamp == stamp:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(abs_path)
+            if entry is not None and entry.stamp == stamp:
+                return entry
+            with open(abs_path, "rb") as f:
+                raw = f.read()
+            schema = json.loads(raw.decode("utf-8"))
+            Draft202012Validator.check_schema(schema)
+            try:
+                fast = compile_validator(schema)
+            except UnsupportedSchemaError:
+                fast = None
+            entry = _Entry(stamp, schema, Draft202012Validator(schema), fast, hashlib.sha256(raw).hexdigest())
+            self._entries[abs_path] = entry
+            self.compiles += 1
+            return entry
+
+    def get_schema(self, path: str) -> dict:
+        return self._entry(path).schema
+
+    def get_validator(self, path: str) -> Draft202012Validator:
+        return self._entry(path).validator
+
+    def get_fast_validator(self, path: str) -> Optional[Callable[[Any], bool]]:
+        """Generated validator returning True/False, or None if the schema is unsupported."""
+        return self._entry(path).fast
+
+    def get_schema_hash(self, path: str) -> str:
+        """sha256 of the schema file as currently loaded."""
+        return self._entry(path).sha256
+
+    def preload(self, schema_dir: str = SCHEMA_DIR):
+        """Compiles every *.json schema in schema_dir up front."""
+        for path in sorted(glob.glob(os.path.join(schema_dir, "*.json"))):
+            self._entry(path)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Shared by the pipeline, the Streamlit viewer and verify.py
+REGISTRY = SchemaRegistry()
@@ -2,6 +2,7 @@ import json
 import os
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
+from src.validators.schema_registry import REGISTRY
 
 class SchemaValidator:
     @staticmethod
@@ -13,12 +14,8 @@ class SchemaValidator:
 
     @staticmethod
     def load_schema(path: str) -> dict:
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Schema file not found: {path}")
-        with open(path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-        Draft202012Validator.check_schema(schema)
-        return schema
+        # Loaded, checked and compiled once per process (see SchemaRegistry)
+        return REGISTRY.get_schema(path)
 
     @staticmethod
     def validate(instance: dict, schema: dict):
@@ -26,10 +23,20 @@ class SchemaValidator:
         validator.validate(instance) # Raises ValidationError on first error
 
     @staticmethod
-    def validate_file(instance_path: str, schema_path: str):
-        instance = SchemaValidator.load_json(instance_path)
-        schema = SchemaValidator.load_schema(schema_path)
+    def validate_instance(instance: dict, schema_path: str, label: str = "<memory>"):
+        """Validates an in-memory instance with the cached compiled validator."""
+        # Fast path: generated validator accepts -> done. On reject (or unsupported
+        # schema) the generic validator runs to produce the detailed error.
+        fast = REGISTRY.get_fast_validator(schema_path)
+        if fast is not None and fast(instance):
+            return
+        validator = REGISTRY.get_validator(schema_path)
         try:
-            SchemaValidator.validate(instance, schema)
+            validator.validate(instance)
         except ValidationError as e:
-            raise RuntimeError(f"Schema Validation Failed for {instance_path}:\nMessage: {e.message}\nPath: {e.json_path}") from e
+            raise RuntimeError(f"Schema Validation Failed for {label}:\nMessage: {e.message}\nPath: {e.json_path}") from e
+
+    @staticmethod
+    def validate_file(instance_path: str, schema_path: str):
+        instance = SchemaValidator.load_json(instance_path)
+        SchemaValidator.validate_instance(instance, schema_path, label=instance_path)
@@ -0,0 +1,102 @@
+import hashlib
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+from src.validators.schema_registry import REGISTRY
+from src.validators.scheduler import validate_catalog
+
+def in_sample(product_id: Hashable, sample_rate: float, salt: str = "") -> bool:
+    """Deterministic sampling: the same product is always in (or out of) the sample."""
+    if sample_rate >= 1.0:
+        return True
+    if sample_rate <= 0.0:
+        return False
+    digest = hashlib.blake2b(f"{salt}:{product_id}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64 < sample_rate
+
+def structural_errors(page: Any, schema_path: str) -> List[str]:
+    """Cheap top-level check: an object whose keys match the schema's required/allowed properties."""
+    schema = REGISTRY.get_schema(schema_path)
+    if not isinstance(page, dict):
+        return [f"STRUCTURE: expected object, got {type(page).__name__}"]
+    keys = set(page)
+    missing = [k for k in schema.get("required", []) if k not in keys]
+    unexpected = []
+    if schema.get("additionalProperties") is False:
+        unexpected = sorted(keys - set(schema.get("properties", {})))
+    if missing or unexpected:
+        return [f"STRUCTURE: missing {missing}, unexpected {unexpected}"]
+    return []
+
+def validate_catalog_tiered(entries: Iterable[Tuple[Hashable, Any, Dict[str, Any]]], schema_paths: Dict[str, str],
+                            sample_rate: float = 0.01, shard_size: int = 1000, salt: str = "",
+                            max_workers: int = 4) -> Dict[str, Any]:
+    """
+    Tiered catalog validation for very large backfills:
+
+    1. Cheap structural checks on every page.
+    2. Full schema + FactGuard validation on a deterministic sample, plus any
+       product that failed the structural tier.
+    3. Any shard (shard_size consecutive products) with a failure in tier 2 is
+       escalated to full validation of every product in it.
+
+    The report has the validate_catalog shape plus a "coverage" section.
+    Product IDs must be unique (results and shards are keyed by them).
+    """
+    entries = list(entries)
+    seen, duplicates = set(), []
+    for product_id, _, _ in entries:
+        if product_id in seen and product_id not in duplicates:
+            duplicates.append(product_id)
+        seen.add(product_id)
+    if duplicates:
+        raise ValueError(f"Duplicate product IDs in catalog: {duplicates}")
+    shard_of = {entry[0]: idx // shard_size for idx, entry in enumerate(entries)}
+    order = {entry[0]: idx for idx, entry in enumerate(entries)}
+
+    # Tier 1: structure on every page
+    structure: Dict[Hashable, List[str]] = {}
+    pages_total = 0
+    for product_id, _, pages in entries:
+        for key, page in pages.items():
+            pages_total += 1
+            if key in schema_paths:
+                errs = structural_errors(page, schema_paths[key])
+                if errs:
+                    structure.setdefault(product_id, []).extend(f"{key}: {e}" for e in errs)
+
+    # Tier 2: deterministic sample (+ structural failures)
+    sampled = [e for e in entries if e[0] in structure or in_sample(e[0], sample_rate, salt)]
+    reports = [validate_catalog(sampled, schema_paths, max_workers=max_workers)]
+    failed_shards = sorted({shard_of[pid] for pid, r in reports[0]["products"].items() if not r["passed"]})
+
+    # Tier 3: escalate failing shards to full validation
+    done = {e[0] for e in sampled}
+    escalated = [e for e in entries if shard_of[e[0]] in failed_shards and e[0] not in done]
+    if escalated:
+        reports.append(validate_catalog(escalated, schema_paths, max_workers=max_workers))
+
+    products: Dict[Hashable, Dict[str, Any]] = {}
+    for report in reports:
+        products.update(report["products"])
+    for product_id, errs in structure.items():
+        products[product_id]["errors"] = errs + products[product_id]["errors"]
+        products[product_id]["passed"] = False
+    products = dict(sorted(products.items(), key=lambda item: order[item[0]]))
+
+    errors = [f"[{pid}] {e}" for pid, r in products.items() for e in r["errors"]]
+    pages_full = sum(len(pages) for pid, _, pages in entries if pid in products)
+    return {
+        "passed": not errors,
+        "errors": errors,
+        "products": products,
+        "coverage": {
+            "products_total": len(entries),
+            "products_full": len(products),
+            "pages_total": pages_total,
+            "pages_structural": pages_total,
+            "pages_full": pages_full,
+            "full_ratio": round(pages_full / pages_total, 6) if pages_total else 1.0,
+            "sample_rate": sample_rate,
+            "escalated_shards": failed_shards,
+        },
+    }
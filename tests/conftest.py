@@ -1,4 +1,12 @@
 import pytest
+from src.state.pipeline_state import PipelineState
+from src.agents.parse_product import ParseProductAgent
+from src.agents.generate_questions import GenerateQuestionsAgent
+from src.agents.generate_product_b import ProductBGeneratorAgent
+from src.agents.build_faq_page import FaqPageAgent
+from src.agents.build_product_page import ProductPageAgent
+from src.agents.build_comparison_page import ComparisonPageAgent
+from src.agents.assemble_pages import AssemblePagesAgent
 
 @pytest.fixture
 def valid_raw_data():
@@ -12,3 +20,17 @@ def valid_raw_data():
         "Side Effects": "Mild tingling for sensitive skin",
         "Price": "₹699"
     }
+
+@pytest.fixture
+def assembled_state(valid_raw_data):
+    """State after drafting and assembly from valid_raw_data (nothing validated or written)."""
+    state = PipelineState(raw_product=valid_raw_data, product=ParseProductAgent().run(valid_raw_data))
+    for agent in (GenerateQuestionsAgent(), ProductBGeneratorAgent(), FaqPageAgent(),
+                  ProductPageAgent(), ComparisonPageAgent(), AssemblePagesAgent()):
+        state = agent.run(state)
+    return state
+
+@pytest.fixture
+def assembled_pages(assembled_state):
+    """Schema-shaped pages keyed like OUTPUT_FILES, independent of whatever is in outputs/."""
+    return assembled_state.assembled_pages
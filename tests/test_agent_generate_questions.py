@@ -48,3 +48,40 @@ def test_generate_questions_determinism(populated_state):
     
     # Order and content must be identical
     assert state1.questions.items == state2.questions.items
+
+def test_shared_questions_come_from_the_bank_read_only(populated_state, valid_raw_data):
+    import copy
+    from src.agents.generate_questions import SHARED_QUESTION_BANK
+
+    other_raw = dict(valid_raw_data, **{"Product Name": "Other Serum", "Benefits": "Hydration"})
+    other = PipelineState(product=ParseProductAgent().run(other_raw))
+
+    agent = GenerateQuestionsAgent()
+    q1 = agent.run(populated_state).questions
+    q2 = agent.run(other).questions
+
+    # Same shared item across products, looked up by ID: no per-product copy
+    assert "usage.how_to_use" in q1.ids
+    idx1 = q1.ids.index("usage.how_to_use")
+    idx2 = q2.ids.index("usage.how_to_use")
+    assert q1.items[idx1] is SHARED_QUESTION_BANK["usage.how_to_use"] is q2.items[idx2]
+    assert q1.items[idx1] == {"category": "Usage", "question": "How do I use this product?"}
+
+    # Shared items cannot be edited in place; copies are ordinary dicts
+    with pytest.raises(TypeError):
+        q1.items[idx1]["question"] = "edited"
+    with pytest.raises(TypeError):
+        q1.items[idx1].update(question="edited")
+    edited = copy.deepcopy(q1.items[idx1])
+    edited["question"] = "edited"
+    assert q2.items[idx2]["question"] == "How do I use this product?"
+
+    # Product-specific questions are materialized per product
+    assert {"category": "Informational", "question": "What is Other Serum?"} in q2.items
+    assert len(q1.ids) == len(q1.items)
+
+def test_benefit_questions_expand_per_benefit(populated_state):
+    items = GenerateQuestionsAgent().run(populated_state).questions
+    pairs = dict(zip(items.ids, items.items))
+    assert pairs["benefits.helps_with.0"]["question"] == "Does this help with brightening?"
+    assert pairs["benefits.helps_with.1"]["question"] == "Does this help with fades dark spots?"
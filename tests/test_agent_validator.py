@@ -73,3 +73,37 @@ def test_validator_agent_fail(tmp_path):
     err_msg = str(exc.value)
     assert "Schema Validation Failed" in err_msg
     assert "123 is not of type 'string'" in err_msg
+
+def test_validator_agent_in_memory(tmp_path):
+    schema = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {"foo": {"type": "string"}},
+        "required": ["foo"]
+    }
+    schema_path = tmp_path / "test_schema.json"
+    with open(schema_path, "w") as f:
+        json.dump(schema, f)
+
+    state = PipelineState()
+    state.schema_paths = {"test_key": str(schema_path)}
+    state.assembled_pages = {"test_key": {"foo": "bar"}}
+
+    # Nothing on disk: pages are validated before serialization
+    new_state = ValidatorAgent(in_memory=True).run(state)
+    assert new_state.validation_report["passed"] is True
+
+    state.assembled_pages = {"test_key": {"foo": 123}}
+    with pytest.raises(RuntimeError, match="Schema Validation Failed for <memory:test_key>"):
+        ValidatorAgent(in_memory=True).run(state)
+
+def test_validator_agent_in_memory_requires_pages():
+    with pytest.raises(ValueError, match="assembled_pages"):
+        ValidatorAgent(in_memory=True).run(PipelineState())
+
+def test_validator_agent_reports_missing_output(tmp_path):
+    state = PipelineState()
+    state.output_paths = {"test_key": str(tmp_path / "missing.json")}
+    new_state = ValidatorAgent().run(state)
+    assert new_state.validation_report["passed"] is False
+    assert "Output file missing" in new_state.validation_report["errors"][0]
@@ -0,0 +1,113 @@
+import json
+import pytest
+from src.models.product import ProductData
+from src.blocks.faq_answers import build_faq_answer
+from src.blocks.answer_cache import FaqAnswerCache, CACHE_FILE_NAME
+from src.orchestrator.pipeline import build_dag, SCHEMA_PATHS, CACHE_DIR_NAME
+from src.state.pipeline_state import PipelineState
+from src.agents.build_faq_page import FaqPageAgent
+
+@pytest.fixture
+def product():
+    return ProductData(
+        product_name="Test Serum",
+        concentration="10%",
+        key_ingredients=["Vit C", "Aqua"],
+        benefits=["Glow", "Hydrate"],
+        skin_type=["Oily"],
+        how_to_use="Apply daily",
+        side_effects="Mild tingling",
+        price_inr=500
+    )
+
+QUESTIONS = [
+    {"category": "Usage", "question": "How do I use this product?"},
+    {"category": "Purchase", "question": "Where can I buy it?"},
+    {"category": "Safety", "question": "Are there any side effects?"},
+    {"category": "Storage", "question": "How should I store this serum?"},
+]
+
+def test_cache_matches_uncached(product):
+    cache = FaqAnswerCache()
+    for q in QUESTIONS:
+        assert cache.answer(product, q) == build_faq_answer(product, q)
+    for q in QUESTIONS:
+        cache.answer(product, q)
+    assert cache.hits == len(QUESTIONS)
+
+def test_price_change_only_invalidates_price(product):
+    cache = FaqAnswerCache()
+    for q in QUESTIONS:
+        cache.answer(product, q)
+    misses = cache.misses
+
+    repriced = product.model_copy(update={"price_inr": 650})
+    answers = [cache.answer(repriced, q) for q in QUESTIONS]
+    assert answers[1] == "Price: ₹650"
+    assert cache.misses == misses + 1
+
+def test_lru_bound(product):
+    cache = FaqAnswerCache(maxsize=2)
+    for price in (1, 2, 3):
+        cache.answer(product.model_copy(update={"price_inr": price}), QUESTIONS[1])
+    assert len(cache) == 2
+
+def test_persistence_round_trip(tmp_path, product):
+    path = str(tmp_path / "cache" / "answers.json")
+    cache = FaqAnswerCache(path=path)
+    for q in QUESTIONS:
+        cache.answer(product, q)
+    cache.save()
+
+    warm = FaqAnswerCache(path=path)
+    assert len(warm) == len(QUESTIONS)
+    assert warm.answer(product, QUESTIONS[0]) == "Apply daily"
+    assert warm.hits == 1
+
+def test_corrupt_file_ignored(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text("{not json")
+    assert len(FaqAnswerCache(path=str(path))) == 0
+
+@pytest.mark.parametrize("payload", [
+    {"version": 1, "answers": {"not": "a list"}},
+    {"version": 1, "answers": [["usage", "fp"]]},
+    {"version": 1, "answers": [["usage", "fp", "text"], "oops"]},
+    {"version": 1, "answers": [[1, 2, 3]]},
+])
+def test_badly_shaped_file_ignored(tmp_path, payload):
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps(payload))
+    assert len(FaqAnswerCache(path=str(path))) == 0
+
+def test_pipeline_persists_answers_between_runs(tmp_path, monkeypatch, valid_raw_data):
+    monkeypatch.chdir(tmp_path)
+    first = build_dag(output_dir=str(tmp_path / "out"))
+    saves = []
+    cache = first._nodes["build_faq"].agent.answer_cache
+    monkeypatch.setattr(cache, "save", lambda: saves.append(FaqAnswerCache.save(cache)))
+    first.run(PipelineState(raw_product=valid_raw_data, schema_paths=dict(SCHEMA_PATHS)))
+    # Saved once, at the end of the run, under the output dir rather than the CWD
+    assert len(saves) == 1
+    assert (tmp_path / "out" / CACHE_DIR_NAME / CACHE_FILE_NAME).exists()
+    assert not (tmp_path / CACHE_DIR_NAME).exists()
+
+    second = build_dag(output_dir=str(tmp_path / "out"))
+    second.run(PipelineState(raw_product=valid_raw_data, schema_paths=dict(SCHEMA_PATHS)))
+    cache = second._nodes["build_faq"].agent.answer_cache
+    assert cache.misses == 0 and cache.hits == 5
+
+def test_agent_defers_saving_to_flush(tmp_path, assembled_state):
+    path = tmp_path / "answers.json"
+    agent = FaqPageAgent(answer_cache=FaqAnswerCache(path=str(path)))
+    agent.run(assembled_state)
+    assert not path.exists()
+    agent.flush()
+    assert path.exists() and not agent.answer_cache.dirty
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["answers.json"]
+
+def test_explicit_cache_dir(tmp_path, valid_raw_data):
+    dag = build_dag(output_dir=str(tmp_path / "out"), cache_dir=str(tmp_path / "cache"))
+    dag.run(PipelineState(raw_product=valid_raw_data, schema_paths=dict(SCHEMA_PATHS)))
+    assert (tmp_path / "cache" / CACHE_FILE_NAME).exists()
+    assert not (tmp_path / "out" / CACHE_DIR_NAME).exists()
@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.storage.atomic_writer import AtomicWriter
+from src.agents.write_json import JsonWriterAgent
+
+def test_write_replaces_atomically(tmp_path):
+    path = tmp_path / "nested" / "out.json"
+    writer = AtomicWriter()
+    writer.write_many([(str(path), b"one")])
+    writer.write(str(path), b"two")
+    # Staged until flush
+    assert path.read_bytes() == b"one"
+    writer.flush()
+    assert path.read_bytes() == b"two"
+    assert os.listdir(tmp_path / "nested") == ["out.json"]
+
+@pytest.mark.parametrize("policy", ["none", "file", "batch"])
+def test_fsync_policies(tmp_path, policy):
+    writer = AtomicWriter(fsync=policy)
+    writer.write(str(tmp_path / "a.json"), b"a")
+    # Staged until flush, for every policy
+    assert not (tmp_path / "a.json").exists()
+    writer.flush()
+    assert (tmp_path / "a.json").read_bytes() == b"a"
+    assert os.listdir(tmp_path) == ["a.json"]
+
+def test_invalid_policy():
+    with pytest.raises(ValueError, match="Invalid fsync"):
+        AtomicWriter(fsync="sometimes")
+
+@pytest.mark.parametrize("policy", ["none", "file", "batch"])
+def test_discard_keeps_previous_content(tmp_path, policy):
+    path = tmp_path / "a.json"
+    path.write_bytes(b"old")
+    writer = AtomicWriter(fsync=policy)
+    writer.write(str(path), b"new")
+    writer.discard()
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["a.json"]
+
+def test_failed_serialization_leaves_existing_file(tmp_path):
+    agent = JsonWriterAgent(output_dir=str(tmp_path))
+    (tmp_path / "faq.json").write_text("{}")
+
+    class State:
+        assembled_pages = {"faq_draft": {"bad": object()}}
+        encoded_pages = {}
+        validation_report = None
+        output_hashes = {}
+        output_paths = {}
+        output_dir = None
+
+    with pytest.raises(TypeError):
+        agent.run(State())
+    assert (tmp_path / "faq.json").read_text() == "{}"
+
+def test_write_catalog_layout(tmp_path):
+    agent = JsonWriterAgent(output_dir=str(tmp_path), fsync="batch")
+    pages = {"faq_draft": {"title": "é"}, "product_page_draft": {"hero": {}}}
+    hashes = agent.write_catalog([("p1", pages), ("p2", pages)])
+
+    assert sorted(os.listdir(tmp_path)) == ["manifest.json", "p1", "p2"]
+    assert sorted(os.listdir(tmp_path / "p1")) == ["faq.json", "product_page.json"]
+    text = (tmp_path / "p2" / "faq.json").read_text(encoding="utf-8")
+    assert text == json.dumps({"title": "é"}, indent=2, ensure_ascii=False)
+    assert hashes["p1"] == hashes["p2"]
+
+def test_write_catalog_rejects_unsafe_ids(tmp_path):
+    agent = JsonWriterAgent(output_dir=str(tmp_path), fsync="batch")
+    with pytest.raises(ValueError, match="Invalid product id"):
+        agent.write_catalog([("ok", {"faq_draft": {}}), ("../escape", {"faq_draft": {}})])
+    # Nothing from the failed batch is published
+    assert not (tmp_path / "ok" / "faq.json").exists()
+
+@pytest.mark.parametrize("policy", ["none", "file"])
+def test_write_catalog_failure_mid_batch_publishes_nothing(tmp_path, policy):
+    agent = JsonWriterAgent(output_dir=str(tmp_path), fsync=policy)
+    good = {"faq_draft": {"title": "ok"}}
+    bad = {"faq_draft": {"bad": object()}}
+    with pytest.raises(TypeError):
+        agent.write_catalog([("p1", good), ("p2", good), ("p3", bad)])
+    # Earlier products were staged, never renamed into place; no manifest either
+    assert sorted(os.listdir(tmp_path)) == ["p1", "p2"]
+    assert os.listdir(tmp_path / "p1") == []
+    assert os.listdir(tmp_path / "p2") == []
+
+def test_recreates_directory_removed_after_caching(tmp_path):
+    writer = AtomicWriter()
+    path = tmp_path / "run" / "a.json"
+    writer.write_many([(str(path), b"one")])
+    shutil.rmtree(tmp_path / "run")
+    writer.write_many([(str(path), b"two")])
+    assert path.read_bytes() == b"two"
+
+def test_concurrent_writes_are_all_staged(tmp_path):
+    writer = AtomicWriter()
+    paths = [str(tmp_path / f"d{i % 4}" / f"{i}.json") for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda p: writer.write(p, b"x"), paths))
+    writer.flush()
+    assert all(os.path.exists(p) for p in paths)
@@ -0,0 +1,74 @@
+import pytest
+from src.models.product import ProductData
+from src.validators.fact_guard import FactGuard
+from src.validators.batch_fact_guard import BatchFactGuard, Vocabulary
+from src.validators.scheduler import validate_catalog
+
+def make_product(name, price=100, ingredients=("A", "B")):
+    return ProductData(
+        product_name=name, concentration="10%", key_ingredients=list(ingredients),
+        benefits=["X", "Y"], skin_type=["All"], how_to_use="Use it",
+        side_effects="None", price_inr=price
+    )
+
+def pages(ingredients, price):
+    return {
+        "faq_draft": {"faqs": [{"answer": "Key ingredients: " + ", ".join(ingredients)}, {"answer": f"Price: ₹{price}"}]},
+        "product_page_draft": {"details": {"ingredients": ingredients, "benefits": ["X"]}, "pricing": {"amount": price}},
+        "comparison_draft": {"comparison": [{"attribute": "Key Ingredients", "product_a_value": ingredients}]},
+    }
+
+def test_vocabulary_interning():
+    vocab = Vocabulary()
+    assert vocab.intern("A") == vocab.intern("A") == 0
+    assert vocab.lookup("missing") is None
+    assert len(vocab) == 1
+
+def test_validate_many_reports_only_failures():
+    guard = BatchFactGuard()
+    entries = [
+        ("p1", make_product("P1"), pages(["A", "B"], 100)),
+        ("p2", make_product("P2", price=200), pages(["A", "Z"], 100)),
+        ("p3", make_product("P3"), pages(["B"], 100)),
+    ]
+    failures = guard.validate_many(entries)
+    assert list(failures) == ["p2"]
+    messages = [str(v) for v in failures["p2"]]
+    assert "FactGuard Failure [FAQ]: Ingredient 'Z' not in dataset." in messages
+    assert "FactGuard Failure [ProductPage.ingredients]: 'Z' is not a known fact. Allowed: ['A', 'B']" in messages
+    assert "FactGuard Failure [ProductPage.price]: Value '100' does not match expected '200'" in messages
+
+def test_matches_single_product_guard():
+    product = make_product("P")
+    bad = pages(["A", "Q"], 999)
+    expected = []
+    guard = FactGuard(product, collect_all=True)
+    expected += guard.validate_faq_page(bad["faq_draft"])
+    expected += guard.validate_product_page(bad["product_page_draft"])
+    expected += guard.validate_comparison_page(bad["comparison_draft"])
+
+    assert [str(v) for v in BatchFactGuard().validate(product, bad)] == expected
+
+def test_identical_facts_are_shared():
+    guard = BatchFactGuard()
+    assert guard.facts_for(make_product("P1")) is guard.facts_for(make_product("P1 variant"))
+    assert guard.facts_for(make_product("P1")) is not guard.facts_for(make_product("P2", price=5))
+
+def test_unknown_item_does_not_grow_vocabulary():
+    guard = BatchFactGuard()
+    guard.validate(make_product("P"), pages(["Unknown"], 100))
+    assert guard.vocab.lookup("Unknown") is None
+
+def test_empty_vocabulary_is_kept():
+    vocab = Vocabulary()
+    assert BatchFactGuard(vocab).vocab is vocab
+
+def test_catalog_validation_uses_batch_guard():
+    entries = [
+        ("p1", make_product("P1"), pages(["A", "B"], 100)),
+        ("p2", make_product("P2"), pages(["A", "Z"], 100)),
+    ]
+    report = validate_catalog(entries, {}, max_workers=1)
+    assert list(report["products"]) == ["p1", "p2"]
+    assert report["products"]["p1"]["passed"] is True
+    assert "CONTENT VIOLATION: FactGuard Failure [FAQ]: Ingredient 'Z' not in dataset." in report["products"]["p2"]["errors"]
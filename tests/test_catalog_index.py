@@ -0,0 +1,73 @@
+import copy
+import pytest
+import src.catalog.index as catalog_index
+from src.catalog.index import CatalogIndex, INDEX_NAME
+from src.agents.write_json import JsonWriterAgent, OUTPUT_FILES
+from src.agents.write_jsonl import JsonlWriterAgent
+
+def _catalog(assembled_pages, n):
+    entries = []
+    for i in range(n):
+        pages = copy.deepcopy(assembled_pages)
+        pages["product_page_draft"]["hero"]["title"] = f"Serum {i}"
+        pages["product_page_draft"]["pricing"]["amount"] = 100 * i
+        entries.append((f"p{i:03d}", pages))
+    # Schema-invalid product page
+    del entries[-1][1]["product_page_draft"]["hero"]
+    return entries
+
+def test_directory_catalog_paging_and_filters(tmp_path, assembled_pages):
+    JsonWriterAgent(output_dir=str(tmp_path)).write_catalog(_catalog(assembled_pages, 25))
+    index = CatalogIndex.open(str(tmp_path))
+    assert len(index) == 25
+    assert (tmp_path / INDEX_NAME).exists()
+
+    page, total = index.page(2, size=10)
+    assert total == 25
+    assert [e.product_id for e in page] == [f"p{i:03d}" for i in range(20, 25)]
+
+    assert [e.product_id for e in index.query(text="serum 1")] == ["p001"] + [f"p{i:03d}" for i in range(10, 20)]
+    assert [e.price for e in index.query(min_price=500, max_price=700)] == [500, 600, 700]
+    assert [e.product_id for e in index.query(schema_status="failed")] == ["p024"]
+
+    entry = index.query(text="p003")[0]
+    assert entry.title == "Serum 3" and entry.currency == "INR"
+    assert index.load(entry)["product_page_draft"]["pricing"]["amount"] == 300
+
+def test_open_reuses_unchanged_entries(tmp_path, assembled_pages, monkeypatch):
+    catalog = _catalog(assembled_pages, 10)
+    JsonWriterAgent(output_dir=str(tmp_path)).write_catalog(catalog)
+    CatalogIndex.open(str(tmp_path))
+
+    calls = []
+    real = catalog_index.summarize
+    monkeypatch.setattr(catalog_index, "summarize", lambda *a: calls.append(a[0]) or real(*a))
+    # No catalog change: persisted index is used as is
+    CatalogIndex.open(str(tmp_path))
+    assert calls == []
+
+    catalog[4][1]["product_page_draft"]["hero"]["title"] = "Renamed"
+    JsonWriterAgent(output_dir=str(tmp_path)).write_catalog(catalog)
+    index = CatalogIndex.open(str(tmp_path))
+    assert calls == ["p004"]
+    assert index.query(text="renamed")[0].product_id == "p004"
+
+def test_shard_catalog_uses_offsets(tmp_path, assembled_pages):
+    JsonlWriterAgent(output_dir=str(tmp_path), products_per_shard=8, compression="gzip").write_catalog(
+        _catalog(assembled_pages, 20))
+    index = CatalogIndex.open(str(tmp_path))
+    assert len(index) == 20
+    entry = index.query(text="p017")[0]
+    assert entry.location["shard"].endswith(".jsonl.gz")
+    pages = index.load(entry)
+    assert set(pages) == set(OUTPUT_FILES)
+    assert pages["product_page_draft"]["hero"]["title"] == "Serum 17"
+
+def test_corrupt_index_is_rebuilt(tmp_path, assembled_pages):
+    JsonWriterAgent(output_dir=str(tmp_path)).write_catalog(_catalog(assembled_pages, 3))
+    (tmp_path / INDEX_NAME).write_text("not json")
+    assert len(CatalogIndex.open(str(tmp_path))) == 3
+
+def test_invalid_page_size(tmp_path):
+    with pytest.raises(ValueError):
+        CatalogIndex(str(tmp_path), []).page(0, size=0)
@@ -43,3 +43,26 @@ def test_faq_price_fail(product):
     bad_data = {"faqs": [{"answer": "Price: ₹999"}]} # 100 is expected
     with pytest.raises(ValueError, match="Price mismatch"):
         guard.validate_faq_page(bad_data)
+
+def test_faq_collect_all_returns_every_violation(product):
+    guard = FactGuard(product, collect_all=True)
+    bad_data = {"faqs": [
+        {"answer": "Key ingredients: A, Z, Q"},
+        {"answer": "Price: ₹999 placeholder"},
+        {"answer": "Benefits: X"},
+        {"answer": "Contains 50%"},
+    ]}
+    violations = guard.validate_faq_page(bad_data)
+    assert violations == [
+        "FactGuard Failure [FAQ]: Ingredient 'Z' not in dataset.",
+        "FactGuard Failure [FAQ]: Ingredient 'Q' not in dataset.",
+        "FactGuard Failure [FAQ]: Generated placeholder found in answer.",
+        "FactGuard Failure [FAQ]: Price mismatch. Answer mentions ₹ but not 100",
+        "FactGuard Failure [FAQ]: Answer mentions % but does not include dataset concentration '10%'",
+    ]
+    assert guard.violations == violations
+
+def test_faq_segment_stops_at_repeated_marker(product):
+    # Matches the historical split(marker)[1] behaviour: only the first segment is checked
+    guard = FactGuard(product, collect_all=True)
+    assert guard.validate_faq_page({"faqs": [{"answer": "Key ingredients: A, B Key ingredients: Z"}]}) == []
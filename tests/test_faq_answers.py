@@ -40,3 +40,32 @@ def test_answer_storage(mock_product):
     ans = build_faq_answer(mock_product, q)
     assert ans == "This information is not provided in the product dataset."
     assert "cool, dry place" not in ans
+
+def test_priority_order_preserved(mock_product):
+    # Usage rule outranks price even when the question mentions cost
+    q = {"category": "Purchase", "question": "Does it cost more if I apply it twice?"}
+    assert build_faq_answer(mock_product, q) == "Apply daily"
+    # Category keyword outranks a lower-priority question keyword
+    q = {"category": "Safety", "question": "What are the ingredients?"}
+    assert build_faq_answer(mock_product, q) == "Mild tingling"
+
+def test_overlapping_keywords_not_hidden(mock_product):
+    # "cost" and "tingl" overlap in "costingle"; the higher-priority safety rule must win
+    from src.blocks.faq_answers import route_question
+    assert route_question({"category": "", "question": "costingle"}) == "safety"
+
+def test_batch_matches_single(mock_product):
+    from src.blocks.faq_answers import build_faq_answers
+    other = mock_product.model_copy(update={"price_inr": 900, "how_to_use": "Apply nightly"})
+    questions = [
+        {"category": "Usage", "question": "How do I use this product?"},
+        {"category": "Purchase", "question": "Where can I buy it?"},
+        {"category": "Benefits", "question": "Does this help with brightening?"},
+        {"category": "Storage", "question": "How should I store this serum?"},
+    ]
+    batch = build_faq_answers([(mock_product, questions), (other, questions)])
+    assert batch == [
+        [build_faq_answer(mock_product, q) for q in questions],
+        [build_faq_answer(other, q) for q in questions],
+    ]
+    assert batch[1][1] == "Price: ₹900"
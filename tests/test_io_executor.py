@@ -0,0 +1,67 @@
+import threading
+import time
+import pytest
+from src.storage.io_executor import IoExecutor
+from src.state.pipeline_state import PipelineState
+from src.agents.write_json import JsonWriterAgent, OUTPUT_FILES
+from src.agents.validate_outputs import ValidatorAgent
+
+def _fail(message):
+    raise OSError(message)
+
+def test_errors_collected_per_owner():
+    with IoExecutor(max_workers=2) as io:
+        io.submit("a", _fail, "disk full")
+        io.submit("b", lambda: None)
+        io.submit("a", _fail, "again")
+        errors = io.drain()
+        assert set(errors) == {"a"}
+        assert sorted(str(e) for e in errors["a"]) == ["again", "disk full"]
+        assert io.drain() == {}
+
+def test_submit_blocks_when_full():
+    release = threading.Event()
+    with IoExecutor(max_workers=1, max_pending=1) as io:
+        io.submit("a", release.wait)
+        submitted = threading.Event()
+        t = threading.Thread(target=lambda: (io.submit("b", lambda: None), submitted.set()))
+        t.start()
+        time.sleep(0.05)
+        assert not submitted.is_set()
+        release.set()
+        t.join(timeout=5)
+        assert submitted.is_set()
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        IoExecutor(max_workers=0)
+
+def _pages(n):
+    return {key: {"n": n, "key": key} for key in OUTPUT_FILES}
+
+def test_writer_catalog_matches_inline(tmp_path):
+    entries = [(f"p{i}", _pages(i)) for i in range(20)]
+    inline = JsonWriterAgent(output_dir=str(tmp_path / "inline")).write_catalog(entries)
+    with IoExecutor(max_workers=4, max_pending=8) as io:
+        pooled = JsonWriterAgent(output_dir=str(tmp_path / "pooled"), io_executor=io).write_catalog(entries)
+    assert pooled == inline
+    for i in (0, 19):
+        for filename in OUTPUT_FILES.values():
+            assert (tmp_path / "pooled" / f"p{i}" / filename).read_bytes() == \
+                (tmp_path / "inline" / f"p{i}" / filename).read_bytes()
+
+def test_writer_error_names_product(tmp_path):
+    (tmp_path / "p1").write_text("not a directory")
+    with IoExecutor() as io:
+        writer = JsonWriterAgent(output_dir=str(tmp_path), io_executor=io)
+        with pytest.raises(RuntimeError, match="WRITE FAILED: p1:"):
+            writer.write_catalog([("p0", _pages(0)), ("p1", _pages(1))])
+    assert not (tmp_path / "manifest.json").exists()
+
+def test_validator_read_error_lands_in_report(tmp_path):
+    (tmp_path / "faq.json").mkdir()
+    state = PipelineState(output_paths={"faq_draft": str(tmp_path / "faq.json")})
+    with IoExecutor() as io:
+        state = ValidatorAgent(io_executor=io).run(state)
+    assert state.validation_report["passed"] is False
+    assert state.validation_report["errors"][0].startswith("Output file unreadable")
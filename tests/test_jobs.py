@@ -0,0 +1,60 @@
+import threading
+import pytest
+from src.orchestrator.jobs import JobManager
+
+@pytest.fixture
+def manager():
+    m = JobManager(max_concurrent=1)
+    yield m
+    m.shutdown()
+
+def test_duplicates_coalesce_into_one_job(manager):
+    release = threading.Event()
+    runs = []
+    def work(job):
+        runs.append(job.job_id)
+        release.wait(5)
+        return "done"
+    first = manager.submit("outputs", work)
+    second = manager.submit("outputs", work)
+    assert second is first and first.requests == 2
+    release.set()
+    job = manager.wait(first.job_id, timeout=5)
+    assert job.status == "succeeded" and job.result == "done"
+    assert runs == [first.job_id]
+    # Once finished, a new submission starts a new job
+    third = manager.submit("outputs", lambda job: None)
+    assert third.job_id != first.job_id
+    manager.wait(third.job_id, timeout=5)
+
+def test_concurrency_limit_queues_other_targets(manager):
+    release = threading.Event()
+    started = threading.Event()
+    def block(job):
+        started.set()
+        release.wait(5)
+    a = manager.submit("a", block)
+    started.wait(5)
+    b = manager.submit("b", lambda job: job.events.append("ran"))
+    assert a.status == "running" and b.status == "queued"
+    assert manager.active("b") is b
+    release.set()
+    assert manager.wait(b.job_id, timeout=5).events == ["ran"]
+    assert manager.active("a") is None and manager.latest("b") is b
+
+def test_failure_is_recorded(manager):
+    def boom(job):
+        raise RuntimeError("disk full")
+    job = manager.wait(manager.submit("outputs", boom).job_id, timeout=5)
+    assert job.status == "failed" and job.error == "RuntimeError: disk full"
+    assert job.finished_at >= job.started_at
+
+def test_history_is_bounded():
+    m = JobManager(max_history=3)
+    try:
+        ids = [m.wait(m.submit(f"t{i}", lambda job: None).job_id, timeout=5).job_id for i in range(6)]
+        m.submit("last", lambda job: None)
+        assert m.get(ids[0]) is None
+        assert m.get(ids[-1]) is not None
+    finally:
+        m.shutdown()
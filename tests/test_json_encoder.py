@@ -0,0 +1,81 @@
+import enum
+import json
+import random
+import pytest
+from src.storage.json_encoder import encode_json
+from src.agents.assembly import ASSEMBLERS, assemble_faq_page, encode_page
+from src.agents.write_json import serialize_page
+
+def _reference(value):
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+def _random_value(rng, depth=0):
+    kind = rng.randrange(9 if depth < 4 else 6)
+    if kind == 0:
+        return rng.choice(["", "plain", "ü ₹699 –", 'quote " back \\ slash', "line\nbreak\ttab", "\x00\x1f ", "😀"])
+    if kind == 1:
+        return rng.randint(-10**20, 10**20)
+    if kind == 2:
+        return rng.choice([0.0, -0.0, 1.5, 1e-7, 1e300, rng.random()])
+    if kind == 3:
+        return rng.choice([True, False, None])
+    if kind in (4, 5):
+        return rng.choice(["x", 1, 2.5])
+    if kind in (6, 7):
+        return {f"k{i}{rng.choice(['', 'é', ' '])}": _random_value(rng, depth + 1) for i in range(rng.randrange(4))}
+    return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+
+def test_matches_json_dumps_on_random_values():
+    rng = random.Random(7)
+    for _ in range(3000):
+        value = _random_value(rng)
+        assert encode_json(value) == _reference(value)
+
+def test_deep_nesting_and_special_cases():
+    deep = []
+    for i in range(40):
+        deep = [i, {"a": deep}]
+    class Color(str, enum.Enum):
+        RED = "red"
+    cases = [deep, {1: "x", 2.5: "y", True: "z", None: "n"}, (1, (2, [])), float("nan"), float("-inf"), Color.RED]
+    for value in cases:
+        assert encode_json(value) == _reference(value)
+
+def test_circular_reference_raises_value_error_like_json_dumps():
+    looped = {"a": [1]}
+    looped["a"].append(looped)
+    with pytest.raises(ValueError, match="Circular reference"):
+        json.dumps(looped, indent=2)
+    with pytest.raises(ValueError, match="Circular reference"):
+        encode_json(looped)
+    with pytest.raises(ValueError, match="Circular reference"):
+        encode_page("faq_draft", {"meta": looped})
+    # Shared (non-circular) references are fine
+    shared = [1]
+    assert encode_json({"x": shared, "y": shared}) == _reference({"x": shared, "y": shared})
+
+def test_assemble_agent_encodes_each_page_once(assembled_state):
+    assert set(assembled_state.encoded_pages) == set(assembled_state.assembled_pages)
+    for key, page in assembled_state.assembled_pages.items():
+        assert assembled_state.encoded_pages[key] == serialize_page(page)
+
+def test_unserializable_raises_type_error():
+    with pytest.raises(TypeError):
+        encode_json({"a": {1, 2}})
+    with pytest.raises(TypeError):
+        encode_json({(1, 2): "tuple key"})
+
+@pytest.mark.parametrize("key", list(ASSEMBLERS))
+def test_encode_page_matches_assemble_then_serialize(key):
+    drafts = [
+        {},
+        {"meta": {"x": 1}, "title": "T", "usage": "U", "extra": "dropped"},
+        {"comparison": [{"attribute": "Price", "a": 1, "b": 2}], "product_b": {"name": "B"}, "hero": {"title": "H"}},
+    ]
+    for draft in drafts:
+        assert encode_page(key, draft) == serialize_page(ASSEMBLERS[key](draft))
+
+def test_assembled_defaults_are_not_shared():
+    first = assemble_faq_page({})
+    first["ingredients"].append("leak")
+    assert assemble_faq_page({})["ingredients"] == []
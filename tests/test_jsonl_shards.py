@@ -0,0 +1,94 @@
+import gzip
+import json
+import lzma
+import os
+import pytest
+from src.storage.jsonl_shards import ShardedJsonlWriter, ShardedJsonlReader
+from src.agents.write_jsonl import JsonlWriterAgent, RECORD_FIELDS
+from src.models.product import ProductData
+from src.state.pipeline_state import PipelineState
+
+def _records(n):
+    return [(f"p{i:04d}", {"title": f"Product {i}", "note": "ü" * (i % 5)}) for i in range(n)]
+
+@pytest.mark.parametrize("compression", [None, "gzip", "lzma"])
+def test_round_trip_random_access(tmp_path, compression):
+    with ShardedJsonlWriter(str(tmp_path), products_per_shard=40, compression=compression, block_records=8) as w:
+        for pid, rec in _records(100):
+            w.append(pid, rec)
+    assert len(w.shards) == 3
+    reader = ShardedJsonlReader(str(tmp_path))
+    assert len(reader) == 100
+    for pid, rec in _records(100)[::7]:
+        assert reader.get(pid) == dict(rec, product_id=pid)
+    assert [r["product_id"] for r in reader.iter_records()] == [pid for pid, _ in _records(100)]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+def test_compressed_shard_is_standard_file(tmp_path):
+    with ShardedJsonlWriter(str(tmp_path), compression="gzip", block_records=3) as w:
+        for pid, rec in _records(10):
+            w.append(pid, rec)
+    lines = gzip.decompress(open(w.shards[0], "rb").read()).splitlines()
+    assert [json.loads(line)["product_id"] for line in lines] == [pid for pid, _ in _records(10)]
+
+def test_records_are_compact(tmp_path):
+    with ShardedJsonlWriter(str(tmp_path)) as w:
+        w.append("a", {"k": [1, 2], "s": "é"})
+    assert open(w.shards[0], "rb").read() == '{"k":[1,2],"s":"é","product_id":"a"}\n'.encode("utf-8")
+
+def test_rollover_by_size(tmp_path):
+    with ShardedJsonlWriter(str(tmp_path), max_shard_bytes=100) as w:
+        for pid, rec in _records(10):
+            w.append(pid, rec)
+    assert len(w.shards) > 1
+    assert all(os.path.getsize(path) <= 100 for path in w.shards)
+
+def test_new_writer_appends_shards_and_later_wins(tmp_path):
+    with ShardedJsonlWriter(str(tmp_path), compression="lzma") as w:
+        w.append("a", {"v": 1})
+    with ShardedJsonlWriter(str(tmp_path)) as w:
+        w.append("a", {"v": 2})
+    names = sorted(os.listdir(tmp_path))
+    assert names == ["shard-00000.jsonl.xz", "shard-00000.jsonl.xz.idx", "shard-00001.jsonl", "shard-00001.jsonl.idx"]
+    assert ShardedJsonlReader(str(tmp_path)).get("a")["v"] == 2
+
+def test_error_discards_open_shard(tmp_path):
+    with pytest.raises(RuntimeError):
+        with ShardedJsonlWriter(str(tmp_path)) as w:
+            w.append("a", {})
+            raise RuntimeError("boom")
+    assert os.listdir(tmp_path) == []
+
+def test_invalid_compression(tmp_path):
+    with pytest.raises(ValueError, match="Invalid compression"):
+        ShardedJsonlWriter(str(tmp_path), compression="zip")
+
+def test_missing_id(tmp_path):
+    with pytest.raises(KeyError):
+        ShardedJsonlReader(str(tmp_path)).get("nope")
+
+def test_agent_writes_catalog(tmp_path):
+    pages = {key: {"field": key} for key in RECORD_FIELDS}
+    agent = JsonlWriterAgent(output_dir=str(tmp_path), products_per_shard=2, compression="gzip")
+    shards = agent.write_catalog([("x", pages), ("y", pages), ("z", pages)])
+    assert len(shards) == 2
+    record = ShardedJsonlReader(str(tmp_path)).get("z")
+    assert record == {"faq": {"field": "faq_draft"}, "product_page": {"field": "product_page_draft"},
+                      "comparison_page": {"field": "comparison_draft"}, "product_id": "z"}
+
+def test_agent_run_keeps_one_sink_across_products(tmp_path):
+    pages = {key: {"field": key} for key in RECORD_FIELDS}
+    agent = JsonlWriterAgent(output_dir=str(tmp_path), products_per_shard=2)
+    with agent:
+        for name in ("A", "B", "C"):
+            product = ProductData.model_construct(product_name=name)
+            state = agent.run(PipelineState(product=product, assembled_pages=pages))
+            assert state.output_paths["jsonl_shard"].endswith(".jsonl")
+    # Three products -> two shards (not one shard + index per product)
+    assert sorted(os.listdir(tmp_path)) == ["shard-00000.jsonl", "shard-00000.jsonl.idx",
+                                           "shard-00001.jsonl", "shard-00001.jsonl.idx"]
+    assert sorted(ShardedJsonlReader(str(tmp_path)).ids()) == ["a", "b", "c"]
+
+def test_agent_run_requires_product(tmp_path):
+    with pytest.raises(ValueError, match="No product"):
+        JsonlWriterAgent(output_dir=str(tmp_path)).run(PipelineState())
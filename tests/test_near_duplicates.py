@@ -0,0 +1,83 @@
+import pytest
+from src.models.product import ProductData
+from src.orchestrator.pipeline import Pipeline
+from src.catalog.near_duplicates import (
+    MinHasher, LshIndex, NearDuplicateDetector, product_features, jaccard
+)
+
+def make_product(name, ingredients, benefits):
+    return ProductData(
+        product_name=name, concentration="10%", skin_type=["All"],
+        key_ingredients=ingredients, benefits=benefits,
+        how_to_use="Use it", side_effects="None", price_inr=100
+    )
+
+def test_signature_deterministic():
+    a = MinHasher(num_perm=64, seed=7).signature({"x", "y", "z"})
+    b = MinHasher(num_perm=64, seed=7).signature(["z", "y", "x", "x"])
+    assert a == b
+    assert len(a) == 64
+
+def test_estimate_tracks_jaccard():
+    hasher = MinHasher(num_perm=256)
+    s1 = {f"t{i}" for i in range(100)}
+    s2 = {f"t{i}" for i in range(20, 120)}
+    est = MinHasher.estimate(hasher.signature(s1), hasher.signature(s2))
+    assert abs(est - jaccard(s1, s2)) < 0.1
+
+def test_product_features_prefixes():
+    p = make_product("P", ["Vitamin C"], ["Vitamin C"])
+    assert product_features(p) == {"ing:vitamin c", "ben:vitamin c"}
+
+def test_lsh_candidate_pairs_find_similar_only():
+    index = LshIndex(num_perm=128, bands=32)
+    base = {f"ing:{i}" for i in range(20)}
+    index.add("a", base)
+    index.add("b", base | {"ben:extra"})
+    index.add("c", {f"ing:other{i}" for i in range(20)})
+
+    pairs = index.candidate_pairs()
+    assert ("a", "b") in pairs
+    assert not any("c" in p for p in pairs)
+    assert index.similar_pairs(0.9)[0][:2] == ("a", "b")
+
+def test_lsh_rejects_bad_banding_and_duplicate_keys():
+    with pytest.raises(ValueError):
+        LshIndex(num_perm=100, bands=32)
+    index = LshIndex()
+    index.add("a", {"x"})
+    with pytest.raises(ValueError, match="already indexed"):
+        index.add("a", {"x"})
+
+def test_detector_flags_near_duplicate():
+    detector = NearDuplicateDetector(threshold=0.8)
+    original = make_product("Glow", ["Vitamin C", "Hyaluronic Acid"], ["Brightening", "Fades dark spots"])
+    variant = make_product("Glow 30ml", ["Vitamin C", "Hyaluronic Acid"], ["Brightening", "Fades dark spots"])
+    different = make_product("Cool", ["Water", "Glycerin"], ["Hydration", "Cooling"])
+
+    assert detector.check("glow", original) is None
+    assert detector.check("glow-30ml", variant) == "glow"
+    assert detector.check("cool", different) is None
+    # Flagged duplicates are not indexed themselves
+    assert "glow-30ml" not in detector.index
+    assert len(detector.index) == 2
+
+def test_reingesting_same_key_is_not_a_duplicate():
+    detector = NearDuplicateDetector()
+    p = make_product("P", ["A", "B"], ["C"])
+    assert detector.check("p", p) is None
+    assert detector.check("p", p) is None
+    assert len(detector.index) == 1
+
+def test_pipeline_flags_near_duplicate_at_ingest(tmp_path, monkeypatch, valid_raw_data):
+    monkeypatch.chdir(tmp_path)
+    pipeline = Pipeline(output_dir=str(tmp_path / "outputs"), detect_near_duplicates=True)
+    try:
+        first = pipeline.run(valid_raw_data)
+        renamed = pipeline.run(dict(valid_raw_data, **{"Product Name": "GlowBoost Twin Serum"}))
+        rerun = pipeline.run(valid_raw_data)
+    finally:
+        pipeline.close()
+    assert first.near_duplicate_of is None
+    assert renamed.near_duplicate_of == "glowboost-vitamin-c-serum"
+    assert rerun.near_duplicate_of is None
@@ -103,3 +103,50 @@ def test_dag_payload_availability():
     final_state = runner.run(state)
     assert final_state.faq_draft is not None
     assert final_state.product_page_draft is not None
+
+def test_dag_plan_is_cached_until_graph_changes():
+    runner = DagRunner()
+    runner.register(NodeSpec(node_id="A", agent=DummyAgent("A")))
+    runner.run(PipelineState())
+    plan = runner._plan
+    runner.run(PipelineState())
+    assert runner._plan is plan
+    runner.register(NodeSpec(node_id="B", agent=DummyAgent("B"), depends_on=["A"]))
+    assert runner.run(PipelineState()).debug_log == ["A", "B"]
+
+class FailingAgent:
+    def run(self, state):
+        raise RuntimeError("boom")
+
+def test_dag_emits_node_events():
+    runner = DagRunner()
+    runner.register(NodeSpec(node_id="A", agent=DummyAgent("A")))
+    runner.register(NodeSpec(node_id="B", agent=DummyAgent("B"), depends_on=["A"]))
+    events = []
+    runner.run(PipelineState(), on_event=events.append)
+    assert [(e.node_id, e.event, e.index, e.total) for e in events] == [
+        ("A", "started", 0, 2), ("A", "finished", 0, 2), ("B", "started", 1, 2), ("B", "finished", 1, 2)
+    ]
+    assert events[0].duration_sec is None
+    assert events[1].duration_sec >= 0
+
+def test_dag_failure_event_then_raise():
+    runner = DagRunner()
+    runner.register(NodeSpec(node_id="A", agent=FailingAgent()))
+    runner.register(NodeSpec(node_id="B", agent=DummyAgent("B"), depends_on=["A"]))
+    events = []
+    with pytest.raises(RuntimeError, match="boom"):
+        runner.run(PipelineState(), on_event=events.append)
+    assert [e.event for e in events] == ["started", "failed"]
+    assert events[-1].error == "RuntimeError: boom"
+
+def test_jsonl_listener_writes_one_line_per_event():
+    import io
+    import json
+    from src.orchestrator.dag_runner import jsonl_listener
+    stream = io.StringIO()
+    runner = DagRunner()
+    runner.register(NodeSpec(node_id="A", agent=DummyAgent("A")))
+    runner.run(PipelineState(), on_event=jsonl_listener(stream))
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(l["node_id"], l["event"]) for l in lines] == [("A", "started"), ("A", "finished")]
@@ -0,0 +1,53 @@
+import json
+import os
+import pytest
+from src.agents.write_json import JsonWriterAgent
+from src.state.pipeline_state import PipelineState
+
+PAGES = {
+    "faq_draft": {"title": "A"},
+    "product_page_draft": {"hero": {"title": "A"}},
+    "comparison_draft": {"meta": {}},
+}
+
+def run(tmp_path, pages, **kwargs):
+    agent = JsonWriterAgent(output_dir=str(tmp_path), **kwargs)
+    state = agent.run(PipelineState(assembled_pages=pages))
+    return agent, state
+
+def test_manifest_lists_hashes(tmp_path):
+    _, state = run(tmp_path, PAGES)
+    with open(tmp_path / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert sorted(manifest["files"]) == ["comparison_page.json", "faq.json", "product_page.json"]
+    assert manifest["files"]["faq.json"]["sha256"] == state.output_hashes["faq_draft"]
+    assert manifest["files"]["faq.json"]["size"] == os.path.getsize(tmp_path / "faq.json")
+
+def test_unchanged_files_not_rewritten(tmp_path):
+    run(tmp_path, PAGES)
+    mtimes = {name: os.stat(tmp_path / name).st_mtime_ns for name in os.listdir(tmp_path)}
+
+    changed = dict(PAGES, faq_draft={"title": "B"})
+    agent, _ = run(tmp_path, changed)
+    assert agent.written == [str(tmp_path / "faq.json")]
+    assert len(agent.skipped) == 2
+    assert os.stat(tmp_path / "product_page.json").st_mtime_ns == mtimes["product_page.json"]
+
+    # Fully unchanged run: nothing written, manifest untouched
+    manifest_mtime = os.stat(tmp_path / "manifest.json").st_mtime_ns
+    agent, _ = run(tmp_path, changed)
+    assert agent.written == []
+    assert os.stat(tmp_path / "manifest.json").st_mtime_ns == manifest_mtime
+
+def test_externally_modified_file_is_rewritten(tmp_path):
+    run(tmp_path, PAGES)
+    (tmp_path / "faq.json").write_text("{}")
+    agent, _ = run(tmp_path, PAGES)
+    assert agent.written == [str(tmp_path / "faq.json")]
+    with open(tmp_path / "faq.json", encoding="utf-8") as f:
+        assert json.load(f) == {"title": "A"}
+
+def test_skip_unchanged_disabled(tmp_path):
+    run(tmp_path, PAGES)
+    agent, _ = run(tmp_path, PAGES, skip_unchanged=False)
+    assert len(agent.written) == 3
@@ -95,3 +95,30 @@ def test_product_page_constraints(run_pipeline):
         
     assert data["pricing"]["amount"] == 699
     assert data["meta"]["generated_by"] == "ProductPageAgent"
+
+def test_in_memory_validation_matches_files(run_pipeline):
+    from src.agents.assemble_pages import AssemblePagesAgent
+    state, tmp_path = run_pipeline
+    state = AssemblePagesAgent().run(state)
+    state = ValidatorAgent(in_memory=True).run(state)
+    assert state.validation_report["passed"] is True
+
+    for key, path in state.output_paths.items():
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == state.assembled_pages[key]
+
+def test_writer_verify_writes_hashes(run_pipeline):
+    import hashlib
+    state, tmp_path = run_pipeline
+    writer = JsonWriterAgent(output_dir=str(tmp_path), verify_writes=True)
+    state = writer.run(state)
+    for key, path in state.output_paths.items():
+        with open(path, "rb") as f:
+            assert hashlib.sha256(f.read()).hexdigest() == state.output_hashes[key]
+
+def test_writer_verify_detects_tampering(run_pipeline, monkeypatch):
+    state, tmp_path = run_pipeline
+    writer = JsonWriterAgent(output_dir=str(tmp_path), verify_writes=True)
+    monkeypatch.setattr(writer, "_write", lambda path, data: "0" * 64)
+    with pytest.raises(RuntimeError, match="WRITE VERIFICATION FAILED"):
+        writer.run(state)
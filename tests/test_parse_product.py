@@ -2,7 +2,7 @@ import json
 import pytest
 from pydantic import ValidationError
 from src.agents.parse_product import ParseProductAgent
-from src.models.product import RawProductInput, ProductData
+from src.models.product import RawProductInput, ProductData, product_id_for
 
 
 
@@ -62,3 +62,8 @@ def test_round_trip_stability(valid_raw_data):
     # This just ensures the output is a valid ProductData
     restored_product = ProductData(**product_dict)
     assert product == restored_product
+
+def test_product_id_for():
+    assert product_id_for("GlowBoost Vitamin C Serum") == "glowboost-vitamin-c-serum"
+    assert product_id_for("  A/B 10% ") == "a-b-10"
+    assert product_id_for("***") == "product"
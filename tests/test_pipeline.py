@@ -0,0 +1,59 @@
+import io
+import os
+import pytest
+from src.orchestrator.pipeline import Pipeline, print_summary, load_input_data
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    # Caches default to <output_dir>/.cache; chdir too so nothing can land in the repo
+    monkeypatch.chdir(tmp_path)
+    p = Pipeline(output_dir=str(tmp_path / "outputs"))
+    yield p
+    p.close()
+
+def test_in_process_run_matches_committed_outputs(pipeline, tmp_path):
+    raw = load_input_data(os.path.join(REPO_ROOT, "data", "product_input.json"))
+    state = pipeline.run(raw)
+    assert state.validation_report["passed"] is True
+    assert len(state.output_paths) == 3
+    for path in state.output_paths.values():
+        with open(os.path.join(REPO_ROOT, "outputs", os.path.basename(path)), "rb") as expected, \
+                open(path, "rb") as actual:
+            assert actual.read() == expected.read()
+
+def test_repeated_runs_reuse_the_dag(pipeline, valid_raw_data, capsys):
+    first = pipeline.run(valid_raw_data)
+    plan = pipeline.dag._plan
+    second = pipeline.run(valid_raw_data)
+    assert pipeline.dag._plan is plan
+    assert first is not second
+    assert second.output_hashes == first.output_hashes
+    # Second run: seeded from the published run, so no output is rewritten
+    # and the pages are already proven
+    writer = pipeline.dag._nodes["write_json"].agent
+    assert writer.written == []
+    assert len(writer.skipped) == len(second.output_hashes) == 3
+    assert second.validation_report["skipped"] == list(second.output_hashes)
+    print_summary(second)
+    assert "Passed: True" in capsys.readouterr().out
+
+def test_run_streams_node_events(pipeline, valid_raw_data):
+    events = []
+    pipeline.run(valid_raw_data, on_event=events.append)
+    nodes = list(pipeline.dag._plan)
+    assert [e.node_id for e in events if e.event == "finished"] == nodes
+    assert len(events) == 2 * len(nodes)
+
+def test_invalid_input_raises(pipeline):
+    with pytest.raises(Exception):
+        pipeline.run({"Product Name": "Only a name"})
+
+def test_output_goes_to_the_given_stream(pipeline, valid_raw_data, capsys):
+    out = io.StringIO()
+    print_summary(pipeline.run(valid_raw_data, out=out), out=out)
+    assert "Running node: write_json" in out.getvalue()
+    assert "Passed: True" in out.getvalue()
+    # Nothing leaks to (or is taken from) the process-wide stdout
+    assert capsys.readouterr().out == ""
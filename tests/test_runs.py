@@ -0,0 +1,107 @@
+import os
+import pytest
+from src.storage.runs import RunStore, resolve_output_dir, POINTER_NAME
+from src.orchestrator.pipeline import Pipeline
+
+def _make_runs(store, n):
+    ids = []
+    for i in range(n):
+        run_id, path = store.create_run()
+        with open(os.path.join(path, "faq.json"), "w") as f:
+            f.write(str(i))
+        ids.append(run_id)
+    return ids
+
+def test_publish_swaps_pointer_and_prunes(tmp_path):
+    store = RunStore(str(tmp_path), keep=2)
+    assert resolve_output_dir(str(tmp_path)) == str(tmp_path)
+    ids = _make_runs(store, 4)
+    assert ids == sorted(ids)
+    store.publish(ids[1])
+    assert store.current() == ids[1]
+    # Keeps the newest two plus the current run
+    assert store.runs() == ids[1:]
+    assert resolve_output_dir(str(tmp_path)) == store.run_dir(ids[1])
+    if os.path.islink(tmp_path / "current"):
+        assert (tmp_path / "current" / "faq.json").read_text() == "1"
+
+def test_rollback_to_previous_and_explicit(tmp_path):
+    store = RunStore(str(tmp_path))
+    ids = _make_runs(store, 3)
+    store.publish(ids[2])
+    assert store.rollback() == ids[1]
+    assert store.rollback(ids[2]) == ids[2]
+    store.publish(ids[0])
+    with pytest.raises(ValueError, match="No earlier run"):
+        store.rollback()
+    with pytest.raises(ValueError, match="Unknown run"):
+        store.rollback("nope")
+
+def test_stale_pointer_falls_back_to_root(tmp_path):
+    store = RunStore(str(tmp_path))
+    (tmp_path / POINTER_NAME).write_text("gone\n")
+    assert store.current() is None
+    assert store.current_dir() == str(tmp_path)
+
+def test_discard_refuses_current(tmp_path):
+    store = RunStore(str(tmp_path))
+    run_id = _make_runs(store, 1)[0]
+    store.publish(run_id)
+    with pytest.raises(ValueError):
+        store.discard(run_id)
+
+def test_new_run_is_seeded_from_current(tmp_path):
+    store = RunStore(str(tmp_path))
+    first = _make_runs(store, 1)[0]
+    store.publish(first)
+    second, path = store.create_run()
+    assert os.listdir(path) == ["faq.json"]
+    # Writers replace files by rename, which leaves the published copy alone
+    tmp = os.path.join(path, "faq.json.tmp")
+    with open(tmp, "w") as f:
+        f.write("new")
+    os.replace(tmp, os.path.join(path, "faq.json"))
+    assert (tmp_path / "runs" / first / "faq.json").read_text() == "0"
+    _, empty = store.create_run(seed=False)
+    assert os.listdir(empty) == []
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Caches default to <output_dir>/.cache; chdir too so nothing can land in the repo
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_run_scoped_pipeline_publishes_only_successful_runs(workdir, valid_raw_data):
+    root = str(workdir / "outputs")
+    pipeline = Pipeline(output_dir=root, keep_runs=2)
+    try:
+        state = pipeline.run(valid_raw_data)
+        store = RunStore(root)
+        first = store.current()
+        assert os.path.dirname(state.output_paths["faq_draft"]) == store.run_dir(first)
+
+        with pytest.raises(Exception):
+            pipeline.run({"Product Name": "broken"})
+        assert store.current() == first and store.runs() == [first]
+
+        pipeline.run(valid_raw_data)
+        pipeline.run(valid_raw_data)
+        assert len(store.runs()) == 2 and store.current() == store.runs()[-1]
+    finally:
+        pipeline.close()
+
+def test_in_place_write_keeps_published_run_current(workdir, valid_raw_data):
+    root = str(workdir / "outputs")
+    scoped = Pipeline(output_dir=root)
+    direct = Pipeline(output_dir=root, run_scoped=False)
+    try:
+        scoped.run(valid_raw_data)
+        published = RunStore(root).current_dir()
+        state = direct.run(valid_raw_data)
+        assert os.path.dirname(state.output_paths["faq_draft"]) == root
+        assert resolve_output_dir(root) == published
+        # The agent was not re-pointed at a run directory
+        assert scoped.dag._nodes["write_json"].agent.output_dir == root
+    finally:
+        scoped.close()
+        direct.close()
@@ -0,0 +1,106 @@
+import copy
+import json
+import random
+import pytest
+from jsonschema import Draft202012Validator
+from src.validators.schema_codegen import compile_validator, generate_source, UnsupportedSchemaError
+
+SCHEMAS = {
+    "faq": "src/schemas/faq_schema.json",
+    "product_page": "src/schemas/product_page_schema.json",
+    "comparison": "src/schemas/comparison_page_schema.json",
+}
+
+VALID_SAMPLE = {
+    "faq": {
+        "title": "T", "ingredients": ["A"], "benefits": ["B"], "usage": "U", "safety": "S",
+        "price": {"currency": "INR", "amount": 1},
+        "question_bank": [{"category": "C", "question": f"Q{i}"} for i in range(15)],
+        "faqs": [{"question": f"Q{i}", "answer": "A"} for i in range(5)],
+        "meta": {"generated_by": "FaqPageAgent"},
+    },
+    "product_page": {
+        "meta": {"generated_by": "ProductPageAgent"}, "hero": {"title": "T"},
+        "details": {"ingredients": ["A"], "benefits": ["B"]}, "usage": "U", "safety": "S",
+        "pricing": {"currency": "INR", "amount": 1},
+    },
+    "comparison": {
+        "meta": {"product_b_fictional": True, "product_b_name": "B"},
+        "comparison": [{"attribute": "Name", "product_a_value": "A", "product_b_value": None}],
+        "product_a": {"name": "A"},
+        "product_b": {"name": "B", "key_ingredients": ["X"], "benefits": ["Y"], "price": {"currency": "INR", "amount": 1}},
+    },
+}
+
+REPLACEMENTS = [None, True, False, 0, 1, 1.0, 1.5, -3, "", "x", [], ["x"], [1], {}, {"k": "v"}]
+
+def _paths(doc, prefix=()):
+    yield prefix
+    if isinstance(doc, dict):
+        for k, v in doc.items():
+            yield from _paths(v, prefix + (k,))
+    elif isinstance(doc, list):
+        for i, v in enumerate(doc):
+            yield from _paths(v, prefix + (i,))
+
+def _mutate(doc, rng):
+    doc = copy.deepcopy(doc)
+    path = rng.choice(list(_paths(doc)))
+    if not path:
+        return rng.choice(REPLACEMENTS)
+    parent = doc
+    for p in path[:-1]:
+        parent = parent[p]
+    last = path[-1]
+    op = rng.randrange(4)
+    if op == 0:
+        parent[last] = rng.choice(REPLACEMENTS)
+    elif op == 1:
+        del parent[last]
+    elif op == 2 and isinstance(parent, dict):
+        parent["unexpected"] = rng.choice(REPLACEMENTS)
+    elif isinstance(parent, list):
+        parent.append(copy.deepcopy(rng.choice(parent)) if parent else rng.choice(REPLACEMENTS))
+    else:
+        parent[last] = rng.choice(REPLACEMENTS)
+    return doc
+
+@pytest.mark.parametrize("name", sorted(SCHEMAS))
+def test_differential_against_draft202012(name):
+    schema_path = SCHEMAS[name]
+    with open(schema_path, encoding="utf-8") as f:
+        schema = json.load(f)
+    generic = Draft202012Validator(schema)
+    fast = compile_validator(schema)
+
+    rng = random.Random(name)
+    doc = VALID_SAMPLE[name]
+    assert fast(doc) is True
+    for _ in range(2000):
+        doc = _mutate(VALID_SAMPLE[name] if rng.random() < 0.5 else doc, rng)
+        assert fast(doc) == generic.is_valid(doc), json.dumps(doc, default=str)
+
+@pytest.mark.parametrize("schema,instance", [
+    ({"type": "integer"}, 1.0),
+    ({"type": "integer"}, True),
+    ({"type": "number"}, False),
+    ({"type": ["string", "null"]}, None),
+    ({"minItems": 2}, "not an array"),
+    ({"required": ["a"]}, []),
+    ({"additionalProperties": {"type": "string"}, "properties": {"a": {}}}, {"a": 1, "b": 2}),
+    ({"items": False}, []),
+    ({"items": False}, [1]),
+    ({"maxLength": 1}, "é"),
+    (False, 1),
+])
+def test_edge_cases_match_generic(schema, instance):
+    assert compile_validator(schema)(instance) == Draft202012Validator(schema).is_valid(instance)
+
+def test_unsupported_keywords_raise():
+    with pytest.raises(UnsupportedSchemaError, match="pattern"):
+        compile_validator({"type": "string", "pattern": "^a"})
+
+def test_source_is_stable():
+    with open("src/schemas/faq_schema.json", encoding="utf-8") as f:
+        schema = json.load(f)
+    assert generate_source(schema) == generate_source(schema)
@@ -0,0 +1,49 @@
+import json
+import os
+import pytest
+from jsonschema.exceptions import SchemaError
+from src.validators.schema_registry import SchemaRegistry, SCHEMA_DIR
+
+def write_schema(path, schema):
+    with open(path, "w") as f:
+        json.dump(schema, f)
+
+def test_compiles_once(tmp_path):
+    path = tmp_path / "s.json"
+    write_schema(path, {"type": "object"})
+    registry = SchemaRegistry()
+
+    v1 = registry.get_validator(str(path))
+    v2 = registry.get_validator(str(path))
+    assert v1 is v2
+    assert registry.compiles == 1
+
+def test_recompiles_on_change(tmp_path):
+    path = tmp_path / "s.json"
+    write_schema(path, {"type": "object"})
+    registry = SchemaRegistry()
+    registry.get_validator(str(path))
+
+    write_schema(path, {"type": "object", "required": ["foo"]})
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert registry.get_schema(str(path))["required"] == ["foo"]
+    assert registry.compiles == 2
+
+def test_invalid_schema_rejected(tmp_path):
+    path = tmp_path / "bad.json"
+    write_schema(path, {"type": 12})
+    with pytest.raises(SchemaError):
+        SchemaRegistry().get_validator(str(path))
+
+def test_missing_schema(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Schema file not found"):
+        SchemaRegistry().get_validator(str(tmp_path / "nope.json"))
+
+def test_preload_repo_schemas():
+    registry = SchemaRegistry()
+    registry.preload()
+    assert registry.compiles == 3
+    registry.get_validator(os.path.join(SCHEMA_DIR, "faq_schema.json"))
+    assert registry.compiles == 3
@@ -0,0 +1,54 @@
+import hashlib
+import sqlite3
+import pytest
+from src.storage.sqlite_store import SqliteOutputStore
+from src.agents.write_json import serialize_page
+from src.agents.write_sqlite import SqliteWriterAgent
+
+def _pages(n):
+    return {"faq_draft": {"n": n}, "product_page_draft": {"name": f"P{n}"}, "comparison_draft": {"x": "é"}}
+
+def test_write_and_read_back(tmp_path):
+    db = str(tmp_path / "out.sqlite")
+    hashes = SqliteWriterAgent(db, batch_size=7).write_catalog([(f"p{i}", _pages(i)) for i in range(20)])
+    with SqliteOutputStore(db) as store:
+        assert store.count() == 60
+        assert store.count("faq") == 20
+        assert store.get("p3", "faq") == {"n": 3}
+        assert store.get_product("p4")["product_page"] == {"name": "P4"}
+        assert store.get("p99", "faq") is None
+        assert store.product_ids(limit=3) == ["p0", "p1", "p10"]
+        assert store.etag("p5", "faq") == hashes["p5"]["faq_draft"]
+        assert len(store.find_by_hash(hashes["p1"]["comparison_draft"])) == 20
+
+def test_hash_matches_file_bytes(tmp_path):
+    db = str(tmp_path / "out.sqlite")
+    hashes = SqliteWriterAgent(db).write_catalog([("a", _pages(1))])
+    assert hashes["a"]["faq_draft"] == hashlib.sha256(serialize_page({"n": 1})).hexdigest()
+
+def test_wal_and_indexes(tmp_path):
+    db = str(tmp_path / "out.sqlite")
+    SqliteOutputStore(db).close()
+    conn = sqlite3.connect(db)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {r[1] for r in conn.execute("PRAGMA index_list(outputs)")}
+    assert {"idx_outputs_type", "idx_outputs_hash"} <= indexes
+
+def test_unchanged_rows_not_rewritten(tmp_path):
+    db = str(tmp_path / "out.sqlite")
+    with SqliteOutputStore(db) as store:
+        store.put_many([("a", "faq", "h1", "{}"), ("b", "faq", "h1", "{}")])
+    with SqliteOutputStore(db) as store:
+        store.put_many([("a", "faq", "h1", "{}"), ("b", "faq", "h2", "[]")])
+        store.flush()
+        assert store.changed == 1
+        assert store.get("b", "faq") == []
+
+def test_error_discards_pending_batch(tmp_path):
+    db = str(tmp_path / "out.sqlite")
+    with pytest.raises(RuntimeError):
+        with SqliteOutputStore(db, batch_size=100) as store:
+            store.put("a", "faq", "h", "{}")
+            raise RuntimeError("boom")
+    with SqliteOutputStore(db) as store:
+        assert store.count() == 0
@@ -0,0 +1,115 @@
+import json
+import os
+import pytest
+from src.validators.tiered import validate_catalog_tiered, in_sample, structural_errors
+from src.validators.schema_registry import SCHEMA_PATHS
+from src.agents.validate_outputs import ValidatorAgent
+from src.orchestrator.pipeline import Pipeline
+
+@pytest.fixture
+def product_and_pages(assembled_state):
+    return assembled_state.product, assembled_state.assembled_pages
+
+def test_sampling_is_deterministic():
+    picks = [in_sample(f"p{i}", 0.1) for i in range(2000)]
+    assert picks == [in_sample(f"p{i}", 0.1) for i in range(2000)]
+    assert 100 < sum(picks) < 300
+    assert all(in_sample("x", 1.0) for _ in range(3))
+    assert not in_sample("x", 0.0)
+
+def test_structural_errors():
+    assert structural_errors({"meta": {}}, SCHEMA_PATHS["product_page_draft"]) == [
+        "STRUCTURE: missing ['hero', 'details', 'usage', 'safety', 'pricing'], unexpected []"
+    ]
+    assert structural_errors([], SCHEMA_PATHS["faq_draft"]) == ["STRUCTURE: expected object, got list"]
+
+def test_clean_catalog_reports_coverage(product_and_pages):
+    product, pages = product_and_pages
+    entries = [(f"p{i}", product, pages) for i in range(200)]
+    report = validate_catalog_tiered(entries, SCHEMA_PATHS, sample_rate=0.1, shard_size=50)
+    cov = report["coverage"]
+    assert report["passed"] is True
+    assert cov["pages_structural"] == cov["pages_total"] == 600
+    assert 0 < cov["products_full"] < 200
+    assert cov["escalated_shards"] == []
+    assert cov["full_ratio"] == cov["pages_full"] / 600
+
+def test_sampled_violation_escalates_shard(product_and_pages):
+    product, pages = product_and_pages
+    bad_pages = json.loads(json.dumps(pages))
+    bad_pages["product_page_draft"]["pricing"]["amount"] = 1
+
+    # Find a sampled product and a non-sampled one in the same shard
+    ids = [f"p{i}" for i in range(40)]
+    sampled = next(pid for pid in ids if in_sample(pid, 0.1))
+    hidden = next(pid for pid in ids if not in_sample(pid, 0.1) and pid != sampled)
+
+    entries = [(pid, product, bad_pages if pid in (sampled, hidden) else pages) for pid in ids]
+    report = validate_catalog_tiered(entries, SCHEMA_PATHS, sample_rate=0.1, shard_size=40)
+
+    assert report["coverage"]["escalated_shards"] == [0]
+    assert report["coverage"]["products_full"] == 40
+    assert report["products"][hidden]["passed"] is False
+    assert [pid for pid, r in report["products"].items() if not r["passed"]] == [p for p in ids if p in (sampled, hidden)]
+
+def test_structural_failure_always_fully_validated(product_and_pages):
+    product, pages = product_and_pages
+    broken = dict(pages, faq_draft={"title": "x"})
+    entries = [("p0", product, broken)]
+    report = validate_catalog_tiered(entries, SCHEMA_PATHS, sample_rate=0.0)
+    errors = report["products"]["p0"]["errors"]
+    assert errors[0].startswith("faq_draft: STRUCTURE: missing")
+    assert any(e.startswith("VALIDATION FATAL") for e in errors)
+
+def test_duplicate_product_ids_rejected(product_and_pages):
+    product, pages = product_and_pages
+    with pytest.raises(ValueError, match="Duplicate product IDs"):
+        validate_catalog_tiered([("p0", product, pages), ("p1", product, pages), ("p0", product, pages)],
+                                SCHEMA_PATHS)
+
+def test_validator_agent_tiered_mode_reports_coverage(assembled_state):
+    assembled_state.schema_paths = dict(SCHEMA_PATHS)
+    report = ValidatorAgent(in_memory=True, mode="tiered", sample_rate=0.0).run(assembled_state).validation_report
+    assert report["passed"] is True
+    assert report["coverage"]["pages_full"] == 0
+    assert report["coverage"]["pages_structural"] == 3
+
+    # Fully sampled: a fact violation is caught
+    assembled_state.assembled_pages["product_page_draft"]["pricing"]["amount"] = 1
+    report = ValidatorAgent(in_memory=True, mode="tiered", sample_rate=1.0).run(assembled_state).validation_report
+    assert report["passed"] is False
+    assert report["coverage"]["pages_full"] == 3
+
+def test_pipeline_selects_tiered_mode(tmp_path, monkeypatch, valid_raw_data):
+    monkeypatch.chdir(tmp_path)
+    pipeline = Pipeline(output_dir=str(tmp_path / "outputs"), validation_mode="tiered", sample_rate=1.0)
+    try:
+        report = pipeline.run(valid_raw_data).validation_report
+    finally:
+        pipeline.close()
+    assert report["passed"] is True
+    assert report["coverage"]["full_ratio"] == 1.0
+
+def test_invalid_mode():
+    with pytest.raises(ValueError, match="Invalid mode"):
+        ValidatorAgent(mode="sometimes")
+
+def test_failed_tiered_validation_writes_nothing(tmp_path, monkeypatch, valid_raw_data):
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "outputs"
+    pipeline = Pipeline(output_dir=str(out), run_scoped=False, validation_mode="tiered", sample_rate=1.0,
+                        cache_dir=str(tmp_path / "cache"))
+    # Corrupt the product page after assembly, before validation
+    assemble = pipeline.dag._nodes["assemble_pages"].agent
+    real_run = assemble.run
+    def corrupting_run(state):
+        state = real_run(state)
+        state.assembled_pages["product_page_draft"]["pricing"]["amount"] = 1
+        return state
+    monkeypatch.setattr(assemble, "run", corrupting_run)
+    try:
+        with pytest.raises(RuntimeError, match="refusing to write"):
+            pipeline.run(valid_raw_data)
+    finally:
+        pipeline.close()
+    assert not out.exists() or os.listdir(out) == []
@@ -0,0 +1,88 @@
+import json
+import pytest
+from src.state.pipeline_state import PipelineState
+from src.agents.validate_outputs import ValidatorAgent
+from src.validators.ledger import ValidationLedger
+from src.validators.schema_registry import SCHEMA_PATHS
+from src.agents.write_json import OUTPUT_FILES, serialize_page
+
+@pytest.fixture
+def state(tmp_path, assembled_state):
+    output_paths = {}
+    for key, page in assembled_state.assembled_pages.items():
+        target = tmp_path / OUTPUT_FILES[key]
+        target.write_bytes(serialize_page(page))
+        output_paths[key] = str(target)
+    return PipelineState(
+        product=assembled_state.product,
+        output_paths=output_paths,
+        schema_paths=dict(SCHEMA_PATHS),
+    )
+
+def test_second_run_skips_proven_outputs(tmp_path, state):
+    path = str(tmp_path / "ledger.json")
+    first = ValidatorAgent(ledger=ValidationLedger(path)).run(state)
+    assert first.validation_report["skipped"] == []
+
+    second = ValidatorAgent(ledger=ValidationLedger(path)).run(state)
+    assert second.validation_report["passed"] is True
+    assert second.validation_report["skipped"] == list(SCHEMA_PATHS)
+
+def test_changed_output_is_revalidated(tmp_path, state):
+    ledger = ValidationLedger(str(tmp_path / "ledger.json"))
+    ValidatorAgent(ledger=ledger).run(state)
+
+    path = state.output_paths["product_page_draft"]
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["pricing"]["amount"] = 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    with pytest.raises(RuntimeError, match="ProductPage.price"):
+        ValidatorAgent(ledger=ledger).run(state)
+
+def test_product_change_invalidates(tmp_path, state):
+    ledger = ValidationLedger(str(tmp_path / "ledger.json"))
+    ValidatorAgent(ledger=ledger).run(state)
+    state.product = state.product.model_copy(update={"price_inr": 700})
+    with pytest.raises(RuntimeError, match="CONTENT VIOLATION"):
+        ValidatorAgent(ledger=ledger).run(state)
+
+def test_force_revalidates(tmp_path, state):
+    ledger = ValidationLedger(str(tmp_path / "ledger.json"))
+    ValidatorAgent(ledger=ledger).run(state)
+    report = ValidatorAgent(ledger=ledger, force=True).run(state).validation_report
+    assert report["skipped"] == []
+    assert report["passed"] is True
+
+def test_in_memory_uses_same_keys_as_files(tmp_path, state):
+    ledger = ValidationLedger(str(tmp_path / "ledger.json"))
+    ValidatorAgent(ledger=ledger).run(state)
+
+    pages = {}
+    for key, path in state.output_paths.items():
+        with open(path, encoding="utf-8") as f:
+            pages[key] = json.load(f)
+    state.assembled_pages = pages
+    report = ValidatorAgent(in_memory=True, ledger=ledger).run(state).validation_report
+    assert report["skipped"] == list(SCHEMA_PATHS)
+
+def test_corrupt_ledger_ignored(tmp_path):
+    path = tmp_path / "ledger.json"
+    path.write_text("not json")
+    assert len(ValidationLedger(str(path))) == 0
+
+@pytest.mark.parametrize("entries", [[["key", {}]], {"key": "not a dict"}, "nope"])
+def test_malformed_ledger_entries_ignored(tmp_path, entries):
+    path = tmp_path / "ledger.json"
+    path.write_text(json.dumps({"version": 1, "entries": entries}))
+    assert len(ValidationLedger(str(path))) == 0
+
+def test_save_leaves_no_temp_files(tmp_path):
+    ledger = ValidationLedger(str(tmp_path / "ledger.json"))
+    ledger.record("key", "faq")
+    ledger.save()
+    ledger.save()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ledger.json"]
+    assert ValidationLedger(str(tmp_path / "ledger.json")).is_proven("key")
@@ -0,0 +1,69 @@
+import json
+import time
+import pytest
+from src.validators.scheduler import ValidationScheduler, ValidationTask, validate_catalog
+from src.validators.schema_registry import SCHEMA_PATHS
+
+@pytest.fixture
+def catalog_entry(assembled_state):
+    return assembled_state.product, assembled_state.assembled_pages
+
+def make_task(idx, errors, delay=0.0, ran=None):
+    def check():
+        time.sleep(delay)
+        if ran is not None:
+            ran.append(idx)
+        return list(errors)
+    return ValidationTask(idx, "k", "facts", check)
+
+def test_results_in_task_order():
+    tasks = [make_task(i, [f"e{i}"] if i % 2 else [], delay=0.01 * (5 - i)) for i in range(5)]
+    results = ValidationScheduler(max_workers=5).run(tasks)
+    assert results == [[], ["CONTENT VIOLATION: e1"], [], ["CONTENT VIOLATION: e3"], []]
+
+def test_fail_fast_cancels_outstanding():
+    ran = []
+    tasks = [make_task(0, ["boom"], ran=ran)] + [make_task(i, [], delay=0.05, ran=ran) for i in range(1, 20)]
+    with pytest.raises(RuntimeError, match="CONTENT VIOLATION: boom"):
+        ValidationScheduler(max_workers=2, fail_fast=True).run(tasks)
+    assert len(ran) < len(tasks)
+
+def test_exceptions_become_errors():
+    def check():
+        raise ValueError("bad")
+    results = ValidationScheduler(max_workers=2).run([ValidationTask("p", "k", "schema", check)])
+    assert results == [["VALIDATION FATAL: bad"]]
+
+def test_validate_catalog_aggregates_per_product(catalog_entry):
+    product, pages = catalog_entry
+    broken = json.loads(json.dumps(pages))
+    broken["product_page_draft"]["pricing"]["amount"] = 1
+    del broken["faq_draft"]["meta"]
+
+    entries = [("a", product, pages), ("b", product, broken), ("c", product, pages)]
+    report = validate_catalog(entries, SCHEMA_PATHS, max_workers=4)
+
+    assert report["passed"] is False
+    assert list(report["products"]) == ["a", "b", "c"]
+    assert report["products"]["a"]["passed"] and report["products"]["c"]["passed"]
+    errors = report["products"]["b"]["errors"]
+    assert errors[0].startswith("VALIDATION FATAL: Schema Validation Failed for faq_draft")
+    assert errors[1].startswith("CONTENT VIOLATION: FactGuard Failure [ProductPage.price]")
+    assert report["errors"] == [f"[b] {e}" for e in errors]
+
+    # Same report regardless of worker count
+    assert validate_catalog(entries, SCHEMA_PATHS, max_workers=1) == report
+
+def test_validator_agent_parallel_collects(catalog_entry):
+    from src.state.pipeline_state import PipelineState
+    from src.agents.validate_outputs import ValidatorAgent
+    product, pages = catalog_entry
+    pages = json.loads(json.dumps(pages))
+    pages["faq_draft"]["faqs"][0]["answer"] = "placeholder"
+
+    state = PipelineState(product=product, assembled_pages=pages, schema_paths=dict(SCHEMA_PATHS))
+    state = ValidatorAgent(in_memory=True, max_workers=3, fail_fast=False).run(state)
+    assert state.validation_report["passed"] is False
+    assert state.validation_report["errors"] == [
+        "CONTENT VIOLATION: FactGuard Failure [FAQ]: Generated placeholder found in answer."
+    ]
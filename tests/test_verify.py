@@ -0,0 +1,80 @@
+import time
+import verify
+from verify import CheckFailed, VerifyContext, run_checks
+
+def test_failed_prerequisite_skips_dependents(monkeypatch):
+    calls = []
+
+    def ok(ctx, log):
+        calls.append("ok")
+        log("PASS: ok")
+
+    def broken(ctx, log):
+        raise CheckFailed("boom")
+
+    def dependent(ctx, log):
+        calls.append("dependent")
+
+    monkeypatch.setattr(verify, "CHECKS", [
+        ("Ok", ok, None),
+        ("Broken", broken, None),
+        ("Dependent", dependent, broken),
+    ])
+    results = run_checks(VerifyContext())
+    assert [r.status for r in results] == ["passed", "failed", "skipped"]
+    assert results[1].lines == ["FAIL: boom"]
+    assert results[2].lines == ["SKIP: requires Broken"]
+    assert calls == ["ok"]
+
+def test_context_loads_outputs_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "outputs").mkdir()
+    for name in verify.OUTPUT_FILES:
+        (tmp_path / "outputs" / name).write_text('{"a": 1}')
+    ctx = VerifyContext()
+    ctx.load()
+    assert ctx.outputs["faq.json"] == {"a": 1}
+    assert ctx.payloads["faq.json"] == b'{"a": 1}'
+
+    (tmp_path / "outputs" / "faq.json").write_text("{")
+    try:
+        VerifyContext().load()
+    except CheckFailed as e:
+        assert "not valid JSON" in str(e)
+    else:
+        raise AssertionError("expected CheckFailed")
+
+def test_dependent_starts_after_slow_prerequisite(monkeypatch):
+    order = []
+
+    def slow(ctx, log):
+        time.sleep(0.05)
+        order.append("slow")
+
+    def dependent(ctx, log):
+        order.append("dependent")
+
+    monkeypatch.setattr(verify, "CHECKS", [
+        ("Slow", slow, None),
+        ("Dependent", dependent, slow),
+    ])
+    assert [r.status for r in run_checks(VerifyContext())] == ["passed", "passed"]
+    assert order == ["slow", "dependent"]
+
+def test_pipeline_check_has_its_own_cache_dir(tmp_path, monkeypatch):
+    # The test suite runs concurrently with the pipeline check; they must not share cache files
+    monkeypatch.chdir(tmp_path)
+    created = {}
+    class FakePipeline:
+        def __init__(self, **options):
+            created.update(options)
+        def run(self, out=None):
+            raise RuntimeError("stop")
+        def close(self):
+            pass
+    monkeypatch.setattr("src.orchestrator.pipeline.Pipeline", FakePipeline)
+    try:
+        verify.run_pipeline(VerifyContext(), lambda line: None)
+    except CheckFailed:
+        pass
+    assert created["cache_dir"] == verify.PIPELINE_CACHE_DIR
@@ -1,274 +1,353 @@
 import os
 import sys
+import io
 import json
+import time
 import subprocess
 import glob
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 import jsonschema
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+OUTPUT_FILES = ["faq.json", "product_page.json", "comparison_page.json"]
+# The pipeline check's ledger/answer cache: never shared with the concurrently running test suite
+PIPELINE_CACHE_DIR = os.path.join(".cache", "verify")
+
+class CheckFailed(Exception):
+    """Raised by a check with the FAIL message."""
+
+class VerifyContext:
+    """
+    Shared, read-once state for the checks: the outputs of the published run
+    (raw bytes + parsed JSON), the product input and the parsed product.
+    """
+
+    def __init__(self):
+        self.output_dir = "outputs"
+        self.payloads: Dict[str, bytes] = {}
+        self.outputs: Dict[str, Any] = {}
+        self.raw_input: Optional[dict] = None
+        self.product = None
+
+    def output_file(self, name: str) -> str:
+        return os.path.join(self.output_dir, name)
+
+    def load(self):
+        """Resolves the current run and reads every output once."""
+        from src.storage.runs import resolve_output_dir
+        self.output_dir = resolve_output_dir("outputs")
+        for name in OUTPUT_FILES:
+            path = self.output_file(name)
+            if not os.path.exists(path):
+                raise CheckFailed(f"Output {path} missing")
+            with open(path, "rb") as f:
+                self.payloads[name] = f.read()
+            try:
+                self.outputs[name] = json.loads(self.payloads[name].decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise CheckFailed(f"Output {path} is not valid JSON")
+
+    def load_input(self):
+        if self.raw_input is None:
+            if not os.path.exists("data/product_input.json"):
+                raise CheckFailed("data/product_input.json missing")
+            with open("data/product_input.json", "r", encoding="utf-8") as f:
+                self.raw_input = json.load(f)
+        return self.raw_input
+
 # Check A: Repo naming
-def check_repo_naming():
-    print("Checking Repo Naming...")
+def check_repo_naming(ctx: VerifyContext, log: Callable[[str], None]):
     current_dir = os.path.basename(os.getcwd())
     if not current_dir.startswith("kasparro-ai-agentic-content-generation-system-"):
-        print(f"FAIL: Repo name '{current_dir}' does not start with 'kasparro-ai-agentic-content-generation-system-'")
-        sys.exit(1)
-    print("PASS: Repo naming")
+        raise CheckFailed(f"Repo name '{current_dir}' does not start with 'kasparro-ai-agentic-content-generation-system-'")
+    log("PASS: Repo naming")
 
 # Check B: Docs check
-def check_docs():
-    print("Checking Docs...")
+def check_docs(ctx: VerifyContext, log: Callable[[str], None]):
     docs_path = Path("docs/projectdocumentation.md")
     if not docs_path.exists():
-        print(f"FAIL: {docs_path} does not exist")
-        sys.exit(1)
+        raise CheckFailed(f"{docs_path} does not exist")
     
     content = docs_path.read_text()
     required = ["Problem Statement", "Solution Overview", "Scopes & Assumptions", "System Design"]
     for req in required:
         if req not in content:
-            print(f"FAIL: Docs missing header '{req}'")
-            sys.exit(1)
+            raise CheckFailed(f"Docs missing header '{req}'")
             
     if ("[" in content and "->" in content) or "DAG" in content:
         pass
     else:
-        print("FAIL: Docs missing DAG description (did not find DAG keyword or [ -> syntax)")
-        sys.exit(1)
-    print("PASS: Docs check")
+        raise CheckFailed("Docs missing DAG description (did not find DAG keyword or [ -> syntax)")
+    log("PASS: Docs check")
 
 # Check C: Run pipeline
-def run_pipeline():
-    print("Running Pipeline...")
-    # Using strict mode: verify.py runs python main.py
+def run_pipeline(ctx: VerifyContext, log: Callable[[str], None]):
+    # In-process: same DAG as `python main.py`, without a second interpreter.
+    # Output goes to a per-check stream; sys.stdout is shared with the other check threads.
+    from src.orchestrator.pipeline import Pipeline, print_summary
+    pipeline = Pipeline(output_dir="outputs", force_revalidate="--force-revalidate" in sys.argv,
+                        run_scoped="--in-place" not in sys.argv, cache_dir=PIPELINE_CACHE_DIR)
+    out = io.StringIO()
     try:
-        subprocess.run([sys.executable, "main.py"], check=True)
-    except subprocess.CalledProcessError:
-        print("FAIL: Pipeline execution failed")
-        sys.exit(1)
-    print("PASS: Pipeline run")
+        print_summary(pipeline.run(out=out), out=out)
+    except (Exception, SystemExit) as e:
+        log(out.getvalue().rstrip())
+        raise CheckFailed(f"Pipeline execution failed: {e}")
+    finally:
+        pipeline.close()
+    log(out.getvalue().rstrip())
+    log("PASS: Pipeline run")
 
 # Check D: Output existence + JSON validity
-def check_outputs():
-    print("Checking Outputs...")
-    files = ["outputs/faq.json", "outputs/product_page.json", "outputs/comparison_page.json"]
-    for f in files:
-        path = Path(f)
-        if not path.exists():
-            print(f"FAIL: Output {f} missing")
-            sys.exit(1)
-        try:
-            with open(path) as fp:
-                json.load(fp)
-        except json.JSONDecodeError:
-            print(f"FAIL: Output {f} is not valid JSON")
-            sys.exit(1)
-    print("PASS: Output existence & validity")
+def check_outputs(ctx: VerifyContext, log: Callable[[str], None]):
+    ctx.load()
+    log("PASS: Output existence & validity")
 
 # Check E: JSON Schema validation
-def check_schemas():
-    print("Checking Schemas...")
+def check_schemas(ctx: VerifyContext, log: Callable[[str], None]):
     schema_map = {
-        "outputs/faq.json": "src/schemas/faq_schema.json",
-        "outputs/product_page.json": "src/schemas/product_page_schema.json",
-        "outputs/comparison_page.json": "src/schemas/comparison_page_schema.json"
+        "faq.json": "src/schemas/faq_schema.json",
+        "product_page.json": "src/schemas/product_page_schema.json",
+        "comparison_page.json": "src/schemas/comparison_page_schema.json"
     }
     
-    for outfile, schemafile in schema_map.items():
+    from src.validators.schema_registry import REGISTRY
+    from src.validators.ledger import ValidationLedger, content_hash
+
+    # Outputs whose bytes and schema are unchanged since they last passed are skipped
+    ledger = ValidationLedger()
+    force = "--force-revalidate" in sys.argv
+
+    for name, schemafile in schema_map.items():
+        outfile = ctx.output_file(name)
         if not os.path.exists(schemafile):
-             print(f"FAIL: Schema {schemafile} missing")
-             sys.exit(1)
-             
-        with open(schemafile) as sf:
-            schema = json.load(sf)
-        with open(outfile) as of:
-            instance = json.load(of)
+            raise CheckFailed(f"Schema {schemafile} missing")
+
+        ledger_key = ValidationLedger.make_key(content_hash(ctx.payloads[name]), REGISTRY.get_schema_hash(schemafile), "")
+        if not force and ledger.is_proven(ledger_key):
+            log(f"SKIP: {outfile} unchanged since last successful validation")
+            continue
             
-        validator = jsonschema.Draft202012Validator(schema)
+        # Shared compiled validator (also meta-validates the schema once)
+        validator = REGISTRY.get_validator(schemafile)
         try:
-            validator.validate(instance)
+            validator.validate(ctx.outputs[name])
         except jsonschema.ValidationError as e:
-            print(f"FAIL: Schema validation failed for {outfile}: {e.message}")
-            sys.exit(1)
-    print("PASS: Schema validation")
+            raise CheckFailed(f"Schema validation failed for {outfile}: {e.message}")
+        ledger.record(ledger_key, outfile)
+    ledger.save()
+    log("PASS: Schema validation")
 
 # Check F: Assignment constraints
-def check_constraints():
-    print("Checking Constraints...")
+def check_constraints(ctx: VerifyContext, log: Callable[[str], None]):
     # FAQ
-    with open("outputs/faq.json") as f:
-        faq = json.load(f)
-        # Check if question_bank exists and has length
-        qb = faq.get("question_bank", [])
-        if len(qb) < 15:
-            print(f"FAIL: len(question_bank) < 15 ({len(qb)})")
-            sys.exit(1)
-        
-        categories = {q.get("category") for q in qb if q.get("category")}
-        if len(categories) < 5:
-            print(f"FAIL: Categories count {len(categories)} < 5")
-            sys.exit(1)
-            
-        # Fact Guard: Usage & Safety
-        # Load truth for strict comparison
-        with open("data/product_input.json", "r") as f:
-            truth = json.load(f)
+    faq = ctx.outputs["faq.json"]
+    # Check if question_bank exists and has length
+    qb = faq.get("question_bank", [])
+    if len(qb) < 15:
+        raise CheckFailed(f"len(question_bank) < 15 ({len(qb)})")
+    
+    categories = {q.get("category") for q in qb if q.get("category")}
+    if len(categories) < 5:
+        raise CheckFailed(f"Categories count {len(categories)} < 5")
         
-        # Load product_page.json for comparison
-        with open("outputs/product_page.json", "r") as f:
-            product_page = json.load(f)
+    # Fact Guard: Usage & Safety
+    # Load truth for strict comparison
+    truth = ctx.load_input()
+    product_page = ctx.outputs["product_page.json"]
 
-        t_usage = truth.get("How to Use", "").strip()
-        t_safe = truth.get("Side Effects", "").strip()
-        
-        p_usage = product_page.get("usage", "").strip()
-        p_safe = product_page.get("safety", "")
+    t_usage = truth.get("How to Use", "").strip()
+    t_safe = truth.get("Side Effects", "").strip()
+    
+    p_usage = product_page.get("usage", "").strip()
+    p_safe = product_page.get("safety", "")
+    
+    # Usage must be exact match (or very close if formatting involved, but spec says dataset-only)
+    if p_usage != t_usage:
+        raise CheckFailed(f"Product Page usage '{p_usage}' != dataset '{t_usage}'")
+
+    # Safety: Dataset string must be present (agent adds "Note: " prefix often)
+    if t_safe not in p_safe:
+        raise CheckFailed(f"Product Page safety '{p_safe}' does not contain dataset '{t_safe}'")
         
-        # Usage must be exact match (or very close if formatting involved, but spec says dataset-only)
-        if p_usage != t_usage:
-             print(f"FAIL: Product Page usage '{p_usage}' != dataset '{t_usage}'")
-             sys.exit(1)
-
-        # Safety: Dataset string must be present (agent adds "Note: " prefix often)
-        if t_safe not in p_safe:
-             print(f"FAIL: Product Page safety '{p_safe}' does not contain dataset '{t_safe}'")
-             sys.exit(1)
-            
-        if len(faq.get("faqs", [])) < 5:
-            print(f"FAIL: len(faqs) < 5 ({len(faq.get('faqs'))})")
-            sys.exit(1)
+    if len(faq.get("faqs", [])) < 5:
+        raise CheckFailed(f"len(faqs) < 5 ({len(faq.get('faqs'))})")
 
     # Comparison
-    with open("outputs/comparison_page.json") as f:
-        comp = json.load(f)
-        meta = comp.get("meta", {})
-        if meta.get("product_b_fictional") is not True:
-             print("FAIL: meta.product_b_fictional is not true")
-             sys.exit(1)
-        
-        pb = comp.get("product_b", {})
-        required_pb_fields = ["name", "key_ingredients", "benefits", "price"]
-        for field in required_pb_fields:
-            if field not in pb:
-                print(f"FAIL: product_b missing field '{field}'")
-                sys.exit(1)
+    comp = ctx.outputs["comparison_page.json"]
+    meta = comp.get("meta", {})
+    if meta.get("product_b_fictional") is not True:
+        raise CheckFailed("meta.product_b_fictional is not true")
+    
+    pb = comp.get("product_b", {})
+    required_pb_fields = ["name", "key_ingredients", "benefits", "price"]
+    for field in required_pb_fields:
+        if field not in pb:
+            raise CheckFailed(f"product_b missing field '{field}'")
 
-    print("PASS: Constraints")
+    log("PASS: Constraints")
 
 # Check G: Final 'no new facts' sweep
-def check_fact_guard():
-    print("Checking Fact Guard...")
-    if not os.path.exists("data/product_input.json"):
-        print("FAIL: data/product_input.json missing")
-        sys.exit(1)
-        
-    try:
-        from src.agents.parse_product import ParseProductAgent
-    except ImportError:
-        sys.path.append(os.getcwd())
-        from src.agents.parse_product import ParseProductAgent
+def check_fact_guard(ctx: VerifyContext, log: Callable[[str], None]):
+    from src.agents.parse_product import ParseProductAgent
 
-    with open("data/product_input.json") as f:
-        raw_input = json.load(f)
-    
-    agent = ParseProductAgent()
-    product_data = agent.run(raw_input)
+    product_data = ParseProductAgent().run(ctx.load_input())
     
     # Check Product Page
-    with open("outputs/product_page.json") as f:
-        pp = json.load(f)
-        details = pp.get("details", {})
-        
-        # ingredients
-        pp_ing = details.get("ingredients", [])
-        if pp_ing != product_data.key_ingredients:
-             print(f"FAIL: Product Page ingredients mismatch.\nExpected: {product_data.key_ingredients}\nGot: {pp_ing}")
-             sys.exit(1)
-
-        # benefits
-        pp_ben = details.get("benefits", [])
-        if pp_ben != product_data.benefits:
-             print(f"FAIL: Product Page benefits mismatch.\nExpected: {product_data.benefits}\nGot: {pp_ben}")
-             sys.exit(1)
-             
-        # price
-        # Pricing might be top level or in details. Checking top level 'pricing' then 'amount'
-        if "pricing" in pp:
-            pricing = pp["pricing"]
-            if "amount" in pricing:
-                 if pricing["amount"] != product_data.price_inr:
-                     print(f"FAIL: Product Page price mismatch. Expected {product_data.price_inr}, got {pricing['amount']}")
-                     sys.exit(1)
-        
-        # safety (look for side_effects in details as that matches strict property name from parser)
-        if "side_effects" in details:
-             if details["side_effects"] != product_data.side_effects:
-                 print("FAIL: Product Page side_effects mismatch")
-                 sys.exit(1)
+    pp = ctx.outputs["product_page.json"]
+    details = pp.get("details", {})
+    
+    # ingredients
+    pp_ing = details.get("ingredients", [])
+    if pp_ing != product_data.key_ingredients:
+        raise CheckFailed(f"Product Page ingredients mismatch.\nExpected: {product_data.key_ingredients}\nGot: {pp_ing}")
+
+    # benefits
+    pp_ben = details.get("benefits", [])
+    if pp_ben != product_data.benefits:
+        raise CheckFailed(f"Product Page benefits mismatch.\nExpected: {product_data.benefits}\nGot: {pp_ben}")
+         
+    # price
+    # Pricing might be top level or in details. Checking top level 'pricing' then 'amount'
+    if "pricing" in pp:
+        pricing = pp["pricing"]
+        if "amount" in pricing:
+            if pricing["amount"] != product_data.price_inr:
+                raise CheckFailed(f"Product Page price mismatch. Expected {product_data.price_inr}, got {pricing['amount']}")
+    
+    # safety (look for side_effects in details as that matches strict property name from parser)
+    if "side_effects" in details:
+        if details["side_effects"] != product_data.side_effects:
+            raise CheckFailed("Product Page side_effects mismatch")
 
     # Check Comparison Page (product_a)
-    with open("outputs/comparison_page.json") as f:
-        cp = json.load(f)
-        pa = cp.get("product_a", {})
-        
-        # If product_a has these fields, they must match
-        if "key_ingredients" in pa:
-            if pa["key_ingredients"] != product_data.key_ingredients:
-                print("FAIL: Comparison Page product_a key_ingredients mismatch")
-                sys.exit(1)
-        if "benefits" in pa:
-            if pa["benefits"] != product_data.benefits:
-                print("FAIL: Comparison Page product_a benefits mismatch")
-                sys.exit(1)
+    pa = ctx.outputs["comparison_page.json"].get("product_a", {})
+    
+    # If product_a has these fields, they must match
+    if "key_ingredients" in pa:
+        if pa["key_ingredients"] != product_data.key_ingredients:
+            raise CheckFailed("Comparison Page product_a key_ingredients mismatch")
+    if "benefits" in pa:
+        if pa["benefits"] != product_data.benefits:
+            raise CheckFailed("Comparison Page product_a benefits mismatch")
             
-    print("PASS: Fact Guard")
+    log("PASS: Fact Guard")
 
 # Check H: Modular + agentic
-def check_modularity():
-    print("Checking Modularity...")
+def check_modularity(ctx: VerifyContext, log: Callable[[str], None]):
     agents = glob.glob("src/agents/*.py")
     # exclude __init__
     agents = [a for a in agents if "__init__" not in a]
     if len(agents) < 5:
-        print(f"FAIL: Fewer than 5 agent modules found ({len(agents)})")
-        sys.exit(1)
+        raise CheckFailed(f"Fewer than 5 agent modules found ({len(agents)})")
         
     templates = ["src/templates/faq_template.py", "src/templates/product_template.py", "src/templates/comparison_template.py"]
     for t in templates:
         if not os.path.exists(t):
-            print(f"FAIL: Template {t} missing")
-            sys.exit(1)
+            raise CheckFailed(f"Template {t} missing")
             
     if not os.path.exists("src/blocks") or not os.path.isdir("src/blocks"):
-         print("FAIL: src/blocks missing or not dir")
-         sys.exit(1)
+        raise CheckFailed("src/blocks missing or not dir")
          
     blocks = glob.glob("src/blocks/*.py")
     if len(blocks) < 2:
-        print("FAIL: src/blocks seems empty or too few blocks")
-        sys.exit(1)
+        raise CheckFailed("src/blocks seems empty or too few blocks")
 
-    print("PASS: Modularity")
+    log("PASS: Modularity")
 
 # Check I: Test suite
-def check_tests():
-    print("Running Tests...")
-    try:
-        subprocess.run([sys.executable, "-m", "pytest", "-q"], check=True)
-    except subprocess.CalledProcessError:
-        print("FAIL: Tests failed")
-        sys.exit(1)
-    print("PASS: Test suite")
+def check_tests(ctx: VerifyContext, log: Callable[[str], None]):
+    # Separate process (pytest owns its interpreter); output is captured so checks don't interleave
+    result = subprocess.run([sys.executable, "-m", "pytest", "-q"], capture_output=True, text=True)
+    log(result.stdout.rstrip())
+    if result.returncode != 0:
+        raise CheckFailed("Tests failed")
+    log("PASS: Test suite")
+
+# (label, check, prerequisite check); checks whose prerequisite passed run concurrently
+CHECKS = [
+    ("Repo Naming", check_repo_naming, None),
+    ("Docs", check_docs, None),
+    ("Pipeline", run_pipeline, None),
+    ("Outputs", check_outputs, run_pipeline),
+    ("Schemas", check_schemas, check_outputs),
+    ("Constraints", check_constraints, check_outputs),
+    ("Fact Guard", check_fact_guard, check_outputs),
+    ("Modularity", check_modularity, None),
+    ("Tests", check_tests, None),
+]
+
+class CheckResult:
+    def __init__(self, label: str):
+        self.label = label
+        self.status = "skipped"  # "passed" | "failed" | "skipped"
+        self.seconds = 0.0
+        self.lines: List[str] = []
+
+def run_checks(ctx: VerifyContext, max_workers: int = 4) -> List[CheckResult]:
+    """
+    Runs CHECKS on a thread pool: each check starts as soon as its
+    prerequisite passed; a failed prerequisite skips its dependents.
+    Results come back in CHECKS order with per-check timings.
+    """
+    results = {fn: CheckResult(label) for label, fn, _ in CHECKS}
+    futures = {}
+
+    def execute(fn):
+        result = results[fn]
+        t0 = time.perf_counter()
+        try:
+            fn(ctx, result.lines.append)
+            result.status = "passed"
+        except CheckFailed as e:
+            result.lines.append(f"FAIL: {e}")
+            result.status = "failed"
+        except Exception as e:
+            result.lines.append(f"FAIL: {type(e).__name__}: {e}")
+            result.status = "failed"
+        result.seconds = time.perf_counter() - t0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = list(CHECKS)
+        while pending:
+            for item in list(pending):
+                _, fn, prerequisite = item
+                if prerequisite is None:
+                    futures[fn] = pool.submit(execute, fn)
+                elif prerequisite in futures and futures[prerequisite].done():
+                    if results[prerequisite].status == "passed":
+                        futures[fn] = pool.submit(execute, fn)
+                    else:
+                        results[fn].lines.append(f"SKIP: requires {results[prerequisite].label}")
+                else:
+                    continue
+                pending.remove(item)
+            if pending:
+                # Block until some check finishes; only then can a dependent become ready
+                wait([f for f in futures.values() if not f.done()], return_when=FIRST_COMPLETED)
+    return [results[fn] for _, fn, _ in CHECKS]
+
+def print_report(results: List[CheckResult], wall: float):
+    for result in results:
+        print(f"Checking {result.label}...")
+        for line in result.lines:
+            if line:
+                print(line)
+
+    print("\n--- Timing ---")
+    for result in results:
+        print(f"{result.label:<14}{result.status:<9}{result.seconds:>8.3f}s")
+    print(f"{'Total (wall)':<23}{wall:>8.3f}s  (sum of checks {sum(r.seconds for r in results):.3f}s)")
 
 if __name__ == "__main__":
-    check_repo_naming()
-    check_docs()
-    run_pipeline()
-    check_outputs()
-    check_schemas()
-    check_constraints()
-    check_fact_guard()
-    check_modularity()
-    check_tests()
-    
+    t0 = time.perf_counter()
+    results = run_checks(VerifyContext())
+    print_report(results, time.perf_counter() - t0)
+
+    if any(r.status != "passed" for r in results):
+        print("\n❌ VERIFICATION FAILED")
+        sys.exit(1)
     print("\n✅ VERIFICATION COMPLETE: ALL CHECKS PASSED")